@@ -125,6 +125,7 @@ from .core import (  # Helper functions; Annotation System (NEW v4.1); Transacti
     auto_scan_package,
     create_event,
     either_of,
+    flush_pending_registrations,
     get,
     get_annotation_metadata,
     get_annotation_registry,
@@ -335,6 +336,7 @@ __all__ = [
     "auto_scan_package",
     "auto_register_classes",
     "auto_register",
+    "flush_pending_registrations",
     # Transaction Management (NEW v4.1)
     "DatabaseTransactionManager",
     "RedisTransactionManager",
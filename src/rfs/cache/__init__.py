@@ -23,7 +23,13 @@ from .distributed import (
     DistributedCache,
     DistributedCacheConfig,
 )
-from .memory_cache import LFUCache, LRUCache, MemoryCache, MemoryCacheConfig
+from .memory_cache import (
+    LFUCache,
+    LRUCache,
+    MemoryCache,
+    MemoryCacheConfig,
+    ShardedMemoryCache,
+)
 from .metrics import (
     CacheMetrics,
     MetricsCollector,
@@ -54,6 +60,7 @@ __all__ = [
     "MemoryCacheConfig",
     "LRUCache",
     "LFUCache",
+    "ShardedMemoryCache",
     # Distributed Cache
     "DistributedCache",
     "DistributedCacheConfig",
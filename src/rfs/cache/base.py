@@ -5,6 +5,7 @@ RFS Cache Base (RFS v4.1)
 """
 
 import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -13,7 +14,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from ..core.enhanced_logging import get_logger
 from ..core.result import Failure, Result, Success
@@ -40,6 +41,63 @@ class SerializationType(str, Enum):
     MSGPACK = "msgpack"
 
 
+def _json_dumps(value: Any) -> bytes:
+    """JSON 직렬화"""
+    # 정수는 JSON 표현이 str()과 같으므로 인코더를 거치지 않음 (INCR 호환 유지)
+    if type(value) is int:
+        return str(value).encode()
+    return json.dumps(value, ensure_ascii=False).encode()
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """JSON 역직렬화"""
+    if data.isdigit() and data.isascii():
+        return int(data)
+    return json.loads(data)
+
+
+def _string_dumps(value: Any) -> bytes:
+    """문자열 직렬화"""
+    return str(value).encode()
+
+
+def _string_loads(data: bytes) -> str:
+    """문자열 역직렬화"""
+    return data.decode()
+
+
+def _resolve_codec(
+    serialization: SerializationType,
+) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any], bool]:
+    """직렬화 방식별 (인코더, 디코더, 바이너리 여부) 반환"""
+    match serialization:
+        case SerializationType.PICKLE:
+            return pickle.dumps, pickle.loads, True
+        case SerializationType.STRING:
+            return _string_dumps, _string_loads, False
+        case SerializationType.MSGPACK:
+            try:
+                import msgspec
+
+                # 인코더/디코더는 재사용 시 타입 분석 비용이 상각됨
+                encoder = msgspec.msgpack.Encoder()
+                decoder = msgspec.msgpack.Decoder()
+                return encoder.encode, decoder.decode, True
+            except ImportError:
+                pass
+            try:
+                import msgpack
+
+                return (
+                    msgpack.packb,
+                    functools.partial(msgpack.unpackb, raw=False),
+                    True,
+                )
+            except ImportError:
+                logger.warning("msgpack을 사용할 수 없어 JSON으로 대체합니다")
+    return _json_dumps, _json_loads, False
+
+
 @dataclass
 class CacheConfig:
     """캐시 설정"""
@@ -75,8 +133,35 @@ class CacheBackend(ABC):
     def __init__(self, config: CacheConfig):
         self.config = config
         self.namespace = config.namespace
+        self._key_prefix = f"{config.namespace}:" if config.namespace else ""
+        self._encode, self._decode, self._binary_serialization = _resolve_codec(
+            config.serialization
+        )
         self._connected = False
-        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._deletes = 0
+        self._errors = 0
+
+    @property
+    def _stats(self) -> Dict[str, int]:
+        """통계 카운터 스냅샷"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "sets": self._sets,
+            "deletes": self._deletes,
+            "errors": self._errors,
+        }
+
+    @_stats.setter
+    def _stats(self, stats: Dict[str, int]):
+        self._hits = stats.get("hits", 0)
+        self._misses = stats.get("misses", 0)
+        self._sets = stats.get("sets", 0)
+        self._deletes = stats.get("deletes", 0)
+        self._errors = stats.get("errors", 0)
 
     @abstractmethod
     async def connect(self) -> Result[None, str]:
@@ -135,7 +220,7 @@ class CacheBackend(ABC):
                         result[key] = value
             return Success(result)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             return Failure(f"배치 조회 실패: {str(e)}")
 
     async def set_many(
@@ -149,7 +234,7 @@ class CacheBackend(ABC):
                     return Failure(f"배치 저장 실패: {set_result.unwrap_err()}")
             return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             return Failure(f"배치 저장 실패: {str(e)}")
 
     async def delete_many(self, keys: List[str]) -> Result[None, str]:
@@ -161,14 +246,12 @@ class CacheBackend(ABC):
                     return Failure(f"배치 삭제 실패: {delete_result.unwrap_err()}")
             return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             return Failure(f"배치 삭제 실패: {str(e)}")
 
     def _make_key(self, key: str) -> str:
         """네임스페이스가 포함된 키 생성"""
-        if self.namespace:
-            return f"{self.namespace}:{key}"
-        return key
+        return self._key_prefix + key if self._key_prefix else key
 
     def _hash_key(self, key: str) -> str:
         """키 해시 생성"""
@@ -177,48 +260,17 @@ class CacheBackend(ABC):
     def _serialize(self, value: Any) -> bytes:
         """값 직렬화"""
         try:
-            match self.config.serialization:
-                case SerializationType.JSON:
-                    return json.dumps(value, ensure_ascii=False).encode()
-                case SerializationType.PICKLE:
-                    return pickle.dumps(value)
-                case SerializationType.STRING:
-                    return str(value).encode()
-                case SerializationType.MSGPACK:
-                    try:
-                        import msgpack
-
-                        return msgpack.packb(value)
-                    except ImportError:
-                        logger.warning("msgpack을 사용할 수 없어 JSON으로 대체합니다")
-                        return json.dumps(value, ensure_ascii=False).encode()
-                case _:
-                    return json.dumps(value, ensure_ascii=False).encode()
+            return self._encode(value)
         except Exception as e:
             logger.error(f"직렬화 실패: {e}")
             return b""
 
-    def _deserialize(self, data: bytes) -> Any:
+    def _deserialize(self, data: Union[bytes, str]) -> Any:
         """값 역직렬화"""
         try:
             if not data:
                 return None
-            match self.config.serialization:
-                case SerializationType.JSON:
-                    return json.loads(data.decode())
-                case SerializationType.PICKLE:
-                    return pickle.loads(data)
-                case SerializationType.STRING:
-                    return data.decode()
-                case SerializationType.MSGPACK:
-                    try:
-                        import msgpack
-
-                        return msgpack.unpackb(data, raw=False)
-                    except ImportError:
-                        return json.loads(data.decode())
-                case _:
-                    return json.loads(data.decode())
+            return self._decode(data)
         except Exception as e:
             logger.error(f"역직렬화 실패: {e}")
             return None
@@ -235,8 +287,8 @@ class CacheBackend(ABC):
 
     def get_stats(self) -> Dict[str, int]:
         """캐시 통계 반환"""
-        total_operations = self._stats["hits"] + self._stats["misses"]
-        hit_rate = self._stats["hits"] / total_operations if total_operations > 0 else 0
+        total_operations = self._hits + self._misses
+        hit_rate = self._hits / total_operations if total_operations > 0 else 0
         return {
             **self._stats,
             "hit_rate": round(hit_rate, 4),
@@ -245,7 +297,11 @@ class CacheBackend(ABC):
 
     def reset_stats(self):
         """통계 초기화"""
-        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._deletes = 0
+        self._errors = 0
 
     @property
     def is_connected(self) -> bool:
@@ -6,11 +6,14 @@ RFS Memory Cache (RFS v4.1)
 
 import asyncio
 import heapq
+import os
+import pickle
+import sys
 import time
 from collections import OrderedDict
-from dataclasses import dataclass, field
-from threading import RLock
-from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, replace
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ..core.enhanced_logging import get_logger
 from ..core.result import Failure, Result, Success
@@ -18,6 +21,39 @@ from .base import CacheBackend, CacheConfig
 
 logger = get_logger(__name__)
 
+# TTL 비교는 단조 시계 기준 (핫 패스에서 속성 조회 생략)
+time_monotonic = time.monotonic
+
+# 자주 쓰이는 타입의 크기 추정 (sys.getsizeof 호출 생략)
+_SIZE_FAST = {
+    bytes: lambda v: 33 + len(v),
+    bytearray: sys.getsizeof,
+    memoryview: lambda v: 184 + v.nbytes,
+    # 큰 정수와 비 ASCII 문자열은 길이만으로 알 수 없으므로 getsizeof 사용
+    str: sys.getsizeof,
+    int: sys.getsizeof,
+    float: lambda v: 24,
+    bool: lambda v: 28,
+    type(None): lambda v: 16,
+}
+
+# dict 조회 결과 부재 표시용 센티널
+_MISSING = object()
+
+# 원소 수에 비례해 크기를 외삽하는 가변 길이 컨테이너
+_CONTAINER_TYPES = frozenset({list, tuple, dict, set, frozenset})
+
+
+def _deep_size(value: Any) -> int:
+    """직렬화 크기 기반 깊은 크기 추정"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        try:
+            return sys.getsizeof(value)
+        except Exception:
+            return 1024
+
 
 @dataclass
 class MemoryCacheConfig(CacheConfig):
@@ -35,36 +71,68 @@ class MemoryCacheConfig(CacheConfig):
 class CacheItem:
     """캐시 항목"""
 
-    def __init__(self, key: str, value: Any, ttl: int = None):
+    __slots__ = (
+        "key",
+        "value",
+        "created_at",
+        "accessed_at",
+        "access_count",
+        "expires_at",
+        "size",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = None,
+        now: Optional[float] = None,
+        size: Optional[int] = None,
+    ):
+        self.reset(key, value, ttl, now, size)
+
+    def reset(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = None,
+        now: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> "CacheItem":
+        """항목 재초기화 (풀 재사용용)"""
         self.key = key
         self.value = value
-        self.created_at = time.time()
+        self.created_at = time_monotonic() if now is None else now
         self.accessed_at = self.created_at
         self.access_count = 1
-        if ttl and ttl > 0:
+        if ttl is None:
+            self.expires_at = None
+        elif ttl > 0:
             self.expires_at = self.created_at + ttl
         else:
             self.expires_at = None
-        self.size = self._estimate_size(value)
+        self.size = self._estimate_size(value) if size is None else size
+        return self
 
     def _estimate_size(self, value: Any) -> int:
         """값 크기 추정"""
+        estimator = _SIZE_FAST.get(type(value))
+        if estimator is not None:
+            return estimator(value)
         try:
-            import sys
-
             return sys.getsizeof(value)
         except:
             return 1024
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """만료 확인"""
         if self.expires_at is None:
             return False
-        return time.time() > self.expires_at
+        return (time_monotonic() if now is None else now) > self.expires_at
 
-    def touch(self):
+    def touch(self, now: Optional[float] = None):
         """접근 시간 업데이트"""
-        self.accessed_at = time.time()
+        self.accessed_at = time_monotonic() if now is None else now
         self.access_count = self.access_count + 1
 
     def __lt__(self, other):
@@ -84,15 +152,32 @@ class MemoryCache(CacheBackend):
     def __init__(self, config: MemoryCacheConfig):
         super().__init__(config)
         self.config: MemoryCacheConfig = config
-        self._data: Dict[str, CacheItem] = {}
-        self._access_order: OrderedDict = OrderedDict()
+        # 삽입/접근 순서를 유지하는 주 저장소 (LRU 순서 추적 겸용)
+        self._data: OrderedDict[str, CacheItem] = OrderedDict()
         self._frequency: Dict[str, int] = {}
-        self._insertion_order: List[str] = []
+        # 삽입 순서를 유지하는 순서 집합 (dict 키만 사용)
+        self._insertion_order: Dict[str, None] = {}
         self._ttl_heap: List[Tuple[float, str]] = []
-        self._lock = RLock()
+        self._item_pool: List[CacheItem] = []
+        # 타입별 크기 캐시 (컨테이너는 원소당 크기)
+        self._size_cache: Dict[type, int] = {}
+        self._size_sample_rate = 64
+        self._size_samples = 0
+        self._lock = Lock()
         self._current_size = 0
         self._current_memory = 0
+        # TTL이 설정된 살아있는 항목 수 (힙의 유효 엔트리 수와 같음)
+        self._ttl_count = 0
         self._cleanup_task: Optional[asyncio.Task] = None
+        policy = config.eviction_policy.lower()
+        self._fast_lru = policy == "lru"
+        # 정책별 희생자 선택 함수는 생성 시점에 한 번만 결정
+        self._select_victim: Callable[[], Optional[str]] = {
+            "lru": self._select_lru_victim,
+            "lfu": self._select_lfu_victim,
+            "fifo": self._select_fifo_victim,
+            "ttl": self._select_ttl_victim,
+        }.get(policy, self._select_any_victim)
 
     async def connect(self) -> Result[None, str]:
         """캐시 초기화"""
@@ -121,13 +206,14 @@ class MemoryCache(CacheBackend):
                 except asyncio.CancelledError:
                     pass
             with self._lock:
-                self._data = {}
-                self._access_order = OrderedDict()
+                self._data = OrderedDict()
                 self._frequency = {}
-                self._insertion_order = []
+                self._insertion_order = {}
                 self._ttl_heap = []
+                self._item_pool = []
                 self._current_size = 0
                 self._current_memory = 0
+                self._ttl_count = 0
             self._connected = False
             logger.info("메모리 캐시 정리 완료")
             return Success(None)
@@ -136,25 +222,76 @@ class MemoryCache(CacheBackend):
             logger.error(error_msg)
             return Failure(error_msg)
 
+    def get_sync(self, key: str) -> Optional[Any]:
+        """값 조회 (동기) - 오류는 예외로 전파"""
+        cache_key = self._make_key(key)
+        now = time_monotonic()
+        with self._lock:
+            item = self._data.get(cache_key)
+            if item is None:
+                self._misses += 1
+                return None
+            if self.config.lazy_expiration and item.is_expired(now):
+                del self._data[cache_key]
+                self._remove_bookkeeping(cache_key, item)
+                self._misses += 1
+                return None
+            item.touch(now)
+            self._update_access_tracking(cache_key)
+            self._hits += 1
+            return item.value
+
+    def set_sync(self, key: str, value: Any, ttl: int = None) -> None:
+        """값 저장 (동기) - 오류는 예외로 전파"""
+        cache_key = self._make_key(key)
+        if ttl:
+            ttl = self._validate_ttl(ttl)
+        else:
+            # TTL 없는 저장이 가장 흔한 경로: 검증과 힙 갱신을 모두 생략
+            ttl = None
+        # 항목 생성(크기 추정 포함)은 락 밖에서 수행
+        item = self._acquire_item(cache_key, value, ttl, time_monotonic())
+        with self._lock:
+            self._remove_item(cache_key)
+            self._ensure_space(item.size)
+            self._data[cache_key] = item
+            self._current_size = self._current_size + 1
+            self._current_memory = self._current_memory + item.size
+            self._update_insertion_tracking(cache_key)
+            if ttl is not None:
+                heapq.heappush(self._ttl_heap, (item.expires_at, cache_key))
+                self._ttl_count += 1
+                self._maybe_compact_heap()
+            self._sets += 1
+
+    def delete_sync(self, key: str) -> bool:
+        """값 삭제 (동기) - 삭제 여부 반환"""
+        cache_key = self._make_key(key)
+        with self._lock:
+            if self._remove_item(cache_key):
+                self._deletes += 1
+                return True
+            return False
+
+    def exists_sync(self, key: str) -> bool:
+        """키 존재 확인 (동기)"""
+        cache_key = self._make_key(key)
+        with self._lock:
+            item = self._data.get(cache_key)
+            if item is None:
+                return False
+            if self.config.lazy_expiration and item.is_expired(time_monotonic()):
+                del self._data[cache_key]
+                self._remove_bookkeeping(cache_key, item)
+                return False
+            return True
+
     async def get(self, key: str) -> Result[Optional[Any], str]:
         """값 조회"""
         try:
-            cache_key = self._make_key(key)
-            with self._lock:
-                item = self._data.get(cache_key)
-                if item is None:
-                    self._stats = {**self._stats, "misses": self._stats["misses"] + 1}
-                    return Success(None)
-                if self.config.lazy_expiration and item.is_expired():
-                    self._remove_item(cache_key)
-                    self._stats = {**self._stats, "misses": self._stats["misses"] + 1}
-                    return Success(None)
-                item.touch()
-                self._update_access_tracking(cache_key)
-                self._stats = {**self._stats, "hits": self._stats["hits"] + 1}
-                return Success(item.value)
+            return Success(self.get_sync(key))
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 GET 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -162,23 +299,10 @@ class MemoryCache(CacheBackend):
     async def set(self, key: str, value: Any, ttl: int = None) -> Result[None, str]:
         """값 저장"""
         try:
-            cache_key = self._make_key(key)
-            ttl = self._validate_ttl(ttl) if ttl else None
-            with self._lock:
-                if cache_key in self._data:
-                    self._remove_item(cache_key)
-                item = CacheItem(cache_key, value, ttl)
-                self._ensure_space(item.size)
-                self._data[cache_key] = item
-                self._current_size = self._current_size + 1
-                self._current_memory = self._current_memory + item.size
-                self._update_insertion_tracking(cache_key)
-                if item.expires_at:
-                    heapq.heappush(self._ttl_heap, (item.expires_at, cache_key))
-                self._stats = {**self._stats, "sets": self._stats["sets"] + 1}
-                return Success(None)
+            self.set_sync(key, value, ttl)
+            return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 SET 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -186,14 +310,10 @@ class MemoryCache(CacheBackend):
     async def delete(self, key: str) -> Result[None, str]:
         """값 삭제"""
         try:
-            cache_key = self._make_key(key)
-            with self._lock:
-                if cache_key in self._data:
-                    self._remove_item(cache_key)
-                    self._stats = {**self._stats, "deletes": self._stats["deletes"] + 1}
-                return Success(None)
+            self.delete_sync(key)
+            return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 DELETE 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -201,17 +321,9 @@ class MemoryCache(CacheBackend):
     async def exists(self, key: str) -> Result[bool, str]:
         """키 존재 확인"""
         try:
-            cache_key = self._make_key(key)
-            with self._lock:
-                item = self._data.get(cache_key)
-                if item is None:
-                    return Success(False)
-                if self.config.lazy_expiration and item.is_expired():
-                    self._remove_item(cache_key)
-                    return Success(False)
-                return Success(True)
+            return Success(self.exists_sync(key))
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 EXISTS 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -225,11 +337,14 @@ class MemoryCache(CacheBackend):
                 item = self._data.get(cache_key)
                 if item is None:
                     return Success(None)
-                item.expires_at = time.time() + ttl
+                if item.expires_at is None:
+                    self._ttl_count += 1
+                item.expires_at = time_monotonic() + ttl
                 heapq.heappush(self._ttl_heap, (item.expires_at, cache_key))
+                self._maybe_compact_heap()
                 return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 EXPIRE 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -242,10 +357,10 @@ class MemoryCache(CacheBackend):
                 item = self._data.get(cache_key)
                 if item is None or item.expires_at is None:
                     return Success(-1)
-                remaining = int(item.expires_at - time.time())
+                remaining = int(item.expires_at - time_monotonic())
                 return Success(max(0, remaining))
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 TTL 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -273,21 +388,25 @@ class MemoryCache(CacheBackend):
 
                 # TTL 갱신
                 if validated_ttl is not None and validated_ttl >= 0:
+                    if item.expires_at is None:
+                        self._ttl_count += 1
                     if validated_ttl == 0:
                         # TTL=0: 즉시 만료
                         item.expires_at = (
-                            time.time() - 1
+                            time_monotonic() - 1
                         )  # 과거 시간으로 설정하여 즉시 만료
                     else:
                         # TTL>0: 지정된 시간 후 만료
-                        item.expires_at = time.time() + validated_ttl
+                        item.expires_at = time_monotonic() + validated_ttl
                     heapq.heappush(self._ttl_heap, (item.expires_at, cache_key))
-                else:
+                    self._maybe_compact_heap()
+                elif item.expires_at is not None:
                     item.expires_at = None  # TTL 제거
+                    self._ttl_count -= 1
 
                 return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 TTL 갱신 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -301,10 +420,12 @@ class MemoryCache(CacheBackend):
                 if item is None:
                     return Failure("키가 존재하지 않음")
 
-                item.expires_at = None  # TTL 제거
+                if item.expires_at is not None:
+                    item.expires_at = None  # TTL 제거
+                    self._ttl_count -= 1
                 return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 PERSIST 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
@@ -313,67 +434,74 @@ class MemoryCache(CacheBackend):
         """모든 키 삭제"""
         try:
             with self._lock:
-                if self.namespace:
-                    keys_to_delete = []
-                    prefix = f"{self.namespace}:"
-                    for key in self._data.keys():
-                        if key.startswith(prefix):
-                            keys_to_delete = keys_to_delete + [key]
+                prefix = self._key_prefix
+                if prefix:
+                    keys_to_delete = [k for k in self._data if k.startswith(prefix)]
                     for key in keys_to_delete:
                         self._remove_item(key)
                 else:
-                    self._data = {}
-                    self._access_order = OrderedDict()
+                    self._data = OrderedDict()
                     self._frequency = {}
-                    self._insertion_order = []
+                    self._insertion_order = {}
                     self._ttl_heap = []
                     self._current_size = 0
                     self._current_memory = 0
+                    self._ttl_count = 0
                 return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
+            self._errors += 1
             error_msg = f"메모리 캐시 CLEAR 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
 
     def _ensure_space(self, needed_size: int):
         """공간 확보"""
-        while (
-            self._current_size >= self.config.max_size
-            or self._current_memory + needed_size > self.config.memory_limit
-        ):
-            if not self._data:
-                break
-            victim_key = self._select_victim()
-            if victim_key:
-                self._remove_item(victim_key)
-            else:
-                break
-
-    def _select_victim(self) -> Optional[str]:
-        """제거할 항목 선택"""
-        if not self._data:
-            return None
-        policy = self.config.eviction_policy.lower()
-        match policy:
-            case "lru":
-                return self._select_lru_victim()
-            case "lfu":
-                return self._select_lfu_victim()
-            case _:
-                match policy:
-                    case "fifo":
-                        return self._select_fifo_victim()
-                    case "ttl":
-                        return self._select_ttl_victim()
-                    case _:
-                        return next(iter(self._data.keys()))
+        excess_count = self._current_size + 1 - self.config.max_size
+        memory_limit = self.config.memory_limit - needed_size
+        if excess_count <= 0 and self._current_memory <= memory_limit:
+            return
+        if self._fast_lru:
+            self._evict_lru(excess_count, memory_limit)
+        else:
+            self._evict_by_policy(excess_count, memory_limit)
+
+    def _evict_lru(self, excess_count: int, memory_limit: int):
+        """LRU 일괄 제거 - 가장 오래된 항목이 맨 앞이므로 popitem으로 제거"""
+        data = self._data
+        popitem = data.popitem
+        remove_bookkeeping = self._remove_bookkeeping
+        for _ in range(excess_count):
+            if not data:
+                return
+            key, item = popitem(last=False)
+            remove_bookkeeping(key, item)
+        while data and self._current_memory > memory_limit:
+            key, item = popitem(last=False)
+            remove_bookkeeping(key, item)
+
+    def _evict_by_policy(self, excess_count: int, memory_limit: int):
+        """정책 기반 일괄 제거"""
+        data = self._data
+        select_victim = self._select_victim
+        remove_item = self._remove_item
+        for _ in range(excess_count):
+            victim_key = select_victim() if data else None
+            if not victim_key:
+                return
+            remove_item(victim_key)
+        while data and self._current_memory > memory_limit:
+            victim_key = select_victim()
+            if not victim_key:
+                return
+            remove_item(victim_key)
+
+    def _select_any_victim(self) -> Optional[str]:
+        """임의(가장 앞) 희생자 선택"""
+        return next(iter(self._data), None)
 
     def _select_lru_victim(self) -> Optional[str]:
         """LRU 희생자 선택"""
-        if not self._access_order:
-            return None
-        return next(iter(self._access_order))
+        return next(iter(self._data), None)
 
     def _select_lfu_victim(self) -> Optional[str]:
         """LFU 희생자 선택"""
@@ -387,52 +515,94 @@ class MemoryCache(CacheBackend):
 
     def _select_fifo_victim(self) -> Optional[str]:
         """FIFO 희생자 선택"""
-        if not self._insertion_order:
-            return None
-        return self._insertion_order[0]
+        return next(iter(self._insertion_order), None)
 
     def _select_ttl_victim(self) -> Optional[str]:
         """TTL 기반 희생자 선택"""
-        current_time = time.time()
-        for key, item in self._data.items():
-            if item.expires_at and item.expires_at <= current_time:
-                return key
-        min_expires = None
-        victim = None
-        for key, item in self._data.items():
-            if item.expires_at:
-                if min_expires is None or item.expires_at < min_expires:
-                    min_expires = item.expires_at
-                    victim = key
-        return victim or next(iter(self._data.keys()))
-
-    def _remove_item(self, key: str):
-        """항목 제거"""
-        if key not in self._data:
-            return
-        item = self._data[key]
-        del self._data[key]
+        # 힙 최상단이 가장 먼저 만료되는 항목 (오래된 엔트리는 지연 제거)
+        while self._ttl_heap:
+            expires_at, key = self._ttl_heap[0]
+            item = self._data.get(key)
+            if item is None or item.expires_at != expires_at:
+                heapq.heappop(self._ttl_heap)
+                continue
+            return key
+        return next(iter(self._data), None)
+
+    def _remove_item(self, key: str) -> bool:
+        """항목 제거 - 제거 여부 반환"""
+        item = self._data.pop(key, _MISSING)
+        if item is _MISSING:
+            return False
+        self._remove_bookkeeping(key, item)
+        return True
+
+    def _remove_bookkeeping(self, key: str, item: CacheItem):
+        """저장소에서 빠진 항목의 부가 추적 정보 정리"""
         self._current_size = self._current_size - 1
         self._current_memory = self._current_memory - item.size
-        if key in self._access_order:
-            del self._access_order[key]
-        if key in self._frequency:
-            del self._frequency[key]
-        if key in self._insertion_order:
-            self._insertion_order = [i for i in self._insertion_order if i != key]
+        if item.expires_at is not None:
+            self._ttl_count -= 1
+        self._release_item(item)
+        self._frequency.pop(key, None)
+        self._insertion_order.pop(key, None)
+
+    def _maybe_compact_heap(self):
+        """오래된 엔트리가 유효 엔트리보다 많아지면 TTL 힙 재구성"""
+        if len(self._ttl_heap) - self._ttl_count <= self._ttl_count:
+            return
+        self._ttl_heap = [
+            (item.expires_at, key)
+            for key, item in self._data.items()
+            if item.expires_at is not None
+        ]
+        heapq.heapify(self._ttl_heap)
+
+    def _acquire_item(
+        self, key: str, value: Any, ttl: Optional[int], now: float
+    ) -> CacheItem:
+        """풀에서 항목을 꺼내 재사용하거나 새로 생성"""
+        size = self._estimate_value_size(value) if self.config.estimate_size else 1
+        try:
+            item = self._item_pool.pop()
+        except IndexError:
+            return CacheItem(key, value, ttl, now, size)
+        return item.reset(key, value, ttl, now, size)
+
+    def _estimate_value_size(self, value: Any) -> int:
+        """값의 깊은 크기 추정 (컨테이너는 원소당 크기를 캐시하고 샘플링)"""
+        value_type = type(value)
+        estimator = _SIZE_FAST.get(value_type)
+        if estimator is not None:
+            return estimator(value)
+        if value_type not in _CONTAINER_TYPES:
+            # 같은 타입이라도 인스턴스마다 크기가 크게 다를 수 있어 캐시하지 않음
+            return _deep_size(value)
+        if not value:
+            return sys.getsizeof(value)
+        cached = self._size_cache.get(value_type)
+        self._size_samples += 1
+        if cached is None or self._size_samples % self._size_sample_rate == 0:
+            size = _deep_size(value)
+            self._size_cache[value_type] = max(1, size // len(value))
+            return size
+        return cached * len(value)
+
+    def _release_item(self, item: CacheItem):
+        """제거된 항목을 풀에 반환"""
+        if len(self._item_pool) < self.config.max_size:
+            item.value = None
+            self._item_pool.append(item)
 
     def _update_access_tracking(self, key: str):
         """접근 추적 업데이트"""
-        if key in self._access_order:
-            self._access_order.move_to_end(key)
-        else:
-            self._access_order[key] = True
-        self._frequency = {**self._frequency, key: self._frequency.get(key, 0) + 1}
+        self._data.move_to_end(key)
+        self._frequency[key] = self._frequency.get(key, 0) + 1
 
     def _update_insertion_tracking(self, key: str):
         """삽입 추적 업데이트"""
         if key not in self._insertion_order:
-            self._insertion_order = self._insertion_order + [key]
+            self._insertion_order[key] = None
         self._update_access_tracking(key)
 
     async def _cleanup_expired_items(self):
@@ -440,21 +610,27 @@ class MemoryCache(CacheBackend):
         while self._connected:
             try:
                 await asyncio.sleep(self.config.cleanup_interval)
-                current_time = time.time()
+                current_time = time_monotonic()
                 expired_keys = []
                 with self._lock:
-                    while self._ttl_heap:
-                        expires_at, key = self._ttl_heap[0]
-                        if expires_at <= current_time:
-                            heapq.heappop(self._ttl_heap)
-                            if key in self._data:
-                                item = self._data[key]
-                                if item.is_expired():
-                                    expired_keys = expired_keys + [key]
+                    heap = self._ttl_heap
+                    data = self._data
+                    heappop = heapq.heappop
+                    while heap:
+                        expires_at, key = heap[0]
+                        item = data.get(key)
+                        if item is None or item.expires_at != expires_at:
+                            # 삭제되었거나 TTL이 변경된 오래된 엔트리
+                            heappop(heap)
+                        elif expires_at <= current_time:
+                            heappop(heap)
+                            expired_keys.append(key)
                         else:
                             break
+                    remove_item = self._remove_item
                     for key in expired_keys:
-                        self._remove_item(key)
+                        remove_item(key)
+                    self._maybe_compact_heap()
                     if expired_keys:
                         logger.debug(f"만료된 항목 {len(expired_keys)}개 정리")
             except asyncio.CancelledError:
@@ -490,3 +666,133 @@ class LFUCache(MemoryCache):
     def __init__(self, config: MemoryCacheConfig):
         config.eviction_policy = "lfu"
         super().__init__(config)
+
+
+class ShardedMemoryCache(CacheBackend):
+    """샤딩 메모리 캐시 - 키 해시로 독립된 락을 가진 세그먼트에 분산"""
+
+    def __init__(self, config: MemoryCacheConfig, shard_count: Optional[int] = None):
+        super().__init__(config)
+        self.config: MemoryCacheConfig = config
+        if shard_count is None:
+            shard_count = min(32, (os.cpu_count() or 1) * 2)
+        self.shard_count = max(1, shard_count)
+        shard_config = replace(
+            config,
+            max_size=max(1, config.max_size // self.shard_count),
+            memory_limit=max(1, config.memory_limit // self.shard_count),
+        )
+        self._shards: List[MemoryCache] = [
+            MemoryCache(shard_config) for _ in range(self.shard_count)
+        ]
+
+    def _shard_for(self, key: str) -> MemoryCache:
+        """키가 속한 샤드"""
+        return self._shards[hash(key) % self.shard_count]
+
+    def get_sync(self, key: str) -> Optional[Any]:
+        """값 조회 (동기)"""
+        return self._shard_for(key).get_sync(key)
+
+    def set_sync(self, key: str, value: Any, ttl: int = None) -> None:
+        """값 저장 (동기)"""
+        self._shard_for(key).set_sync(key, value, ttl)
+
+    def delete_sync(self, key: str) -> bool:
+        """값 삭제 (동기)"""
+        return self._shard_for(key).delete_sync(key)
+
+    def exists_sync(self, key: str) -> bool:
+        """키 존재 확인 (동기)"""
+        return self._shard_for(key).exists_sync(key)
+
+    async def connect(self) -> Result[None, str]:
+        """모든 샤드 초기화"""
+        for shard in self._shards:
+            result = await shard.connect()
+            if not result.is_success():
+                return result
+        self._connected = True
+        return Success(None)
+
+    async def disconnect(self) -> Result[None, str]:
+        """모든 샤드 정리"""
+        for shard in self._shards:
+            result = await shard.disconnect()
+            if not result.is_success():
+                return result
+        self._connected = False
+        return Success(None)
+
+    async def get(self, key: str) -> Result[Optional[Any], str]:
+        """값 조회"""
+        return await self._shard_for(key).get(key)
+
+    async def set(self, key: str, value: Any, ttl: int = None) -> Result[None, str]:
+        """값 저장"""
+        return await self._shard_for(key).set(key, value, ttl)
+
+    async def delete(self, key: str) -> Result[None, str]:
+        """값 삭제"""
+        return await self._shard_for(key).delete(key)
+
+    async def exists(self, key: str) -> Result[bool, str]:
+        """키 존재 확인"""
+        return await self._shard_for(key).exists(key)
+
+    async def expire(self, key: str, ttl: int) -> Result[None, str]:
+        """TTL 설정"""
+        return await self._shard_for(key).expire(key, ttl)
+
+    async def ttl(self, key: str) -> Result[int, str]:
+        """TTL 조회"""
+        return await self._shard_for(key).ttl(key)
+
+    async def refresh_ttl(self, key: str, ttl: int = None) -> Result[None, str]:
+        """TTL 갱신"""
+        return await self._shard_for(key).refresh_ttl(key, ttl)
+
+    async def persist(self, key: str) -> Result[None, str]:
+        """TTL 제거"""
+        return await self._shard_for(key).persist(key)
+
+    async def clear(self) -> Result[None, str]:
+        """모든 키 삭제"""
+        for shard in self._shards:
+            result = await shard.clear()
+            if not result.is_success():
+                return result
+        return Success(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """샤드 통계 합산"""
+        totals = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "deletes": 0,
+            "errors": 0,
+            "current_size": 0,
+            "current_memory": 0,
+        }
+        for shard in self._shards:
+            shard_stats = shard.get_stats()
+            for name in totals:
+                totals[name] += shard_stats[name]
+        total_operations = totals["hits"] + totals["misses"]
+        hit_rate = totals["hits"] / total_operations if total_operations > 0 else 0
+        return {
+            **totals,
+            "hit_rate": round(hit_rate, 4),
+            "total_operations": total_operations,
+            "max_size": self.config.max_size,
+            "max_memory": self.config.memory_limit,
+            "eviction_policy": self.config.eviction_policy,
+            "shard_count": self.shard_count,
+        }
+
+    def reset_stats(self):
+        """통계 초기화"""
+        super().reset_stats()
+        for shard in self._shards:
+            shard.reset_stats()
@@ -5,12 +5,19 @@ RFS Cache Metrics (RFS v4.1)
 """
 
 import asyncio
+import bisect
 import functools
+import itertools
+import operator
+import queue
+import sys
+import threading
 import time
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional
+import weakref
+from array import array
+from collections import Counter, defaultdict, deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..core.enhanced_logging import get_logger
 from ..core.result import Failure, Result, Success
@@ -19,28 +26,101 @@ from .base import CacheBackend, get_cache_manager
 
 logger = get_logger(__name__)
 
+# 비활성화 시 track_cache_operation이 측정 없이 원본 함수만 호출
+_METRICS_ENABLED = True
+_LOOP_WARNING_EMITTED = False
+
+# 캐시 백엔드 기능 비트
+CAP_MEMORY = 1
+CAP_REDIS = 2
+
+
+def _ratio_bp(numerator: int, denominator: int) -> int:
+    """비율을 basis point(1/10000) 정수로 반올림"""
+    return (numerator * 10000 + denominator // 2) // denominator
+
 
-@dataclass
 class CacheMetrics:
     """캐시 메트릭스"""
 
-    hits: int = 0
-    misses: int = 0
-    sets: int = 0
-    deletes: int = 0
-    errors: int = 0
-    avg_get_time: float = 0.0
-    avg_set_time: float = 0.0
-    max_get_time: float = 0.0
-    max_set_time: float = 0.0
-    hourly_hits: Dict[str, int] = field(default_factory=dict)
-    hourly_misses: Dict[str, int] = field(default_factory=dict)
-    key_patterns: Dict[str, int] = field(default_factory=dict)
-    hot_keys: List[str] = field(default_factory=list)
-    memory_usage: int = 0
-    memory_limit: int = 0
-    connections_active: int = 0
-    connections_idle: int = 0
+    __slots__ = (
+        "hits",
+        "misses",
+        "sets",
+        "deletes",
+        "errors",
+        "avg_get_time",
+        "avg_set_time",
+        "max_get_time",
+        "max_set_time",
+        "hourly_hits",
+        "hourly_misses",
+        "key_patterns",
+        "hot_keys",
+        "memory_usage",
+        "memory_limit",
+        "connections_active",
+        "connections_idle",
+        "_dict_cache",
+    )
+
+    def __init__(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        sets: int = 0,
+        deletes: int = 0,
+        errors: int = 0,
+        avg_get_time: float = 0.0,
+        avg_set_time: float = 0.0,
+        max_get_time: float = 0.0,
+        max_set_time: float = 0.0,
+        hourly_hits: Optional[array] = None,
+        hourly_misses: Optional[array] = None,
+        key_patterns: Optional[Dict[str, int]] = None,
+        hot_keys: Optional[List[str]] = None,
+        memory_usage: int = 0,
+        memory_limit: int = 0,
+        connections_active: int = 0,
+        connections_idle: int = 0,
+    ):
+        self.hits = hits
+        self.misses = misses
+        self.sets = sets
+        self.deletes = deletes
+        self.errors = errors
+        self.avg_get_time = avg_get_time
+        self.avg_set_time = avg_set_time
+        self.max_get_time = max_get_time
+        self.max_set_time = max_set_time
+        # 컬렉션 필드는 채워질 때까지 None으로 두어 빈 객체 할당을 피함
+        self.hourly_hits = hourly_hits
+        self.hourly_misses = hourly_misses
+        self.key_patterns = key_patterns
+        self.hot_keys = hot_keys
+        self.memory_usage = memory_usage
+        self.memory_limit = memory_limit
+        self.connections_active = connections_active
+        self.connections_idle = connections_idle
+
+    def __setattr__(self, name: str, value: Any):
+        # 필드가 바뀌면 캐시된 딕셔너리 표현을 무효화
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CacheMetrics):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__[:-1]
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__[:-1]
+        )
+        return f"CacheMetrics({fields})"
 
     @property
     def total_operations(self) -> int:
@@ -64,17 +144,54 @@ class CacheMetrics:
         return self.errors / self.total_operations if self.total_operations > 0 else 0.0
 
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
+        """딕셔너리로 변환 (캐시된 결과를 호출마다 복사해 반환)"""
+        cached = self._dict_cache
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cached)
+        # 호출자가 결과를 수정해도 캐시와 히스토리가 오염되지 않도록 복사
         return {
-            "hits": self.hits,
-            "misses": self.misses,
-            "sets": self.sets,
-            "deletes": self.deletes,
-            "errors": self.errors,
-            "total_operations": self.total_operations,
-            "hit_rate": round(self.hit_rate, 4),
-            "miss_rate": round(self.miss_rate, 4),
-            "error_rate": round(self.error_rate, 4),
+            **cached,
+            "hourly_stats": {
+                name: list(values) for name, values in cached["hourly_stats"].items()
+            },
+            "key_analysis": {
+                "patterns": dict(cached["key_analysis"]["patterns"]),
+                "hot_keys": list(cached["key_analysis"]["hot_keys"]),
+            },
+        }
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """to_dict 결과 생성"""
+        # 프로퍼티를 거치지 않고 필드를 한 번씩만 읽어 비율을 계산
+        hits = self.hits
+        misses = self.misses
+        sets = self.sets
+        deletes = self.deletes
+        errors = self.errors
+        total_reads = hits + misses
+        total_operations = total_reads + sets + deletes
+        hit_rate_bp = (
+            (hits * 10000 + total_reads // 2) // total_reads if total_reads else 0
+        )
+        error_rate_bp = (
+            (errors * 10000 + total_operations // 2) // total_operations
+            if total_operations
+            else 0
+        )
+        hourly_hits = self.hourly_hits
+        hourly_misses = self.hourly_misses
+        hot_keys = self.hot_keys
+        result = {
+            "hits": hits,
+            "misses": misses,
+            "sets": sets,
+            "deletes": deletes,
+            "errors": errors,
+            "total_operations": total_operations,
+            "hit_rate": hit_rate_bp / 10000,
+            "miss_rate": (10000 - hit_rate_bp) / 10000,
+            "error_rate": error_rate_bp / 10000,
             "avg_get_time": round(self.avg_get_time, 4),
             "avg_set_time": round(self.avg_set_time, 4),
             "max_get_time": round(self.max_get_time, 4),
@@ -83,12 +200,101 @@ class CacheMetrics:
             "memory_limit": self.memory_limit,
             "connections_active": self.connections_active,
             "connections_idle": self.connections_idle,
-            "hourly_stats": {"hits": self.hourly_hits, "misses": self.hourly_misses},
+            "hourly_stats": {
+                "hits": list(hourly_hits) if hourly_hits else [],
+                "misses": list(hourly_misses) if hourly_misses else [],
+            },
             "key_analysis": {
-                "patterns": self.key_patterns,
-                "hot_keys": self.hot_keys[:10],
+                "patterns": self.key_patterns or {},
+                "hot_keys": hot_keys[:10] if hot_keys else [],
             },
         }
+        return result
+
+
+# (임계값 키, 알림 유형, 값 추출, 비교 연산, 메시지 포맷)
+_ALERT_RULES = (
+    (
+        "hit_rate_min",
+        "low_hit_rate",
+        operator.attrgetter("hit_rate"),
+        operator.lt,
+        lambda value: f"캐시 히트율이 낮습니다: {value:.2%}",
+    ),
+    (
+        "error_rate_max",
+        "high_error_rate",
+        operator.attrgetter("error_rate"),
+        operator.gt,
+        lambda value: f"캐시 에러율이 높습니다: {value:.2%}",
+    ),
+    (
+        "response_time_max",
+        "high_response_time",
+        lambda metrics: max(metrics.avg_get_time, metrics.avg_set_time),
+        operator.gt,
+        lambda value: f"캐시 응답시간이 느립니다: {value:.3f}s",
+    ),
+)
+
+
+# 전체 보고서 요약에서 합산하는 카운터
+_SUMMARY_COUNTERS = ("hits", "misses", "sets", "deletes", "errors")
+
+# (단계 이름, 항목당 구간 초, 보관 개수)
+_HISTORY_TIERS = (("minute", 60, 60), ("hour", 3600, 24), ("day", 86400, 30))
+
+
+class _HistoryRing:
+    """epoch 순으로 정렬된 고정 길이 히스토리"""
+
+    __slots__ = ("entries", "epochs", "samples")
+
+    def __init__(self, maxlen: int):
+        self.entries: deque = deque(maxlen=maxlen)
+        self.epochs: deque = deque(maxlen=maxlen)
+        # 마지막 항목에 병합된 원본 샘플
+        self.samples: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def append(self, epoch: int, entry: Dict[str, Any]):
+        """항목 추가"""
+        self.entries.append(entry)
+        self.epochs.append(epoch)
+        self.samples = [entry]
+
+    def merge_last(self, entry: Dict[str, Any]):
+        """마지막 항목과 같은 구간의 샘플을 평균으로 병합"""
+        self.samples.append(entry)
+        self.entries[-1] = _rollup_entries(self.samples, self.epochs[-1])[1]
+
+    def since(self, cutoff: int) -> List[Dict[str, Any]]:
+        """cutoff 이후 항목 조회"""
+        start = bisect.bisect_left(self.epochs, cutoff)
+        return list(itertools.islice(self.entries, start, None))
+
+
+def _new_history_tiers() -> Dict[str, _HistoryRing]:
+    """캐시별 히스토리 단계 생성"""
+    return {name: _HistoryRing(maxlen) for name, _, maxlen in _HISTORY_TIERS}
+
+
+def _rollup_entries(
+    entries: List[Dict[str, Any]], epoch: int
+) -> Tuple[int, Dict[str, Any]]:
+    """구간 항목들의 수치 메트릭스를 평균내어 하나의 항목으로 병합"""
+    latest = entries[-1]["metrics"]
+    metrics = dict(latest)
+    count = len(entries)
+    for key, value in latest.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[key] = (
+                sum(entry["metrics"].get(key, 0) for entry in entries) / count
+            )
+    timestamp = datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M")
+    return epoch, {"timestamp": timestamp, "epoch": epoch, "metrics": metrics}
 
 
 class MetricsCollector(metaclass=SingletonMeta):
@@ -96,9 +302,28 @@ class MetricsCollector(metaclass=SingletonMeta):
 
     def __init__(self):
         self.collectors: Dict[str, Callable] = {}
-        self.metrics_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1440))
-        self.key_access_count: Dict[str, int] = defaultdict(int)
-        self.operation_times: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        # 캐시별 minute/hour/day 단계 히스토리
+        self.metrics_history: Dict[str, Dict[str, _HistoryRing]] = defaultdict(
+            _new_history_tiers
+        )
+        self.key_access_count: Dict[str, Counter] = defaultdict(Counter)
+        # (cache_name, operation) 별 소요 시간(ns)과 누적 합계/최대/개수 (SoA)
+        self.op_durations: Dict[Tuple[str, str], deque] = defaultdict(
+            lambda: deque(maxlen=1000)
+        )
+        self.op_sum: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.op_max: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.op_count: Dict[Tuple[str, str], int] = defaultdict(int)
+        # 캐시 이름/작업 이름 intern 테이블 (dict 조회 시 동일 객체 비교)
+        self._interned_names: Dict[str, str] = {}
+        # 윈도우 내 최대값 후보 (단조 감소 deque, 맨 앞이 최대값)
+        self._op_max_window: Dict[Tuple[str, str], deque] = defaultdict(deque)
+        # 작업 기록은 큐에 넣고 백그라운드 스레드가 배치로 집계
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._batch_size = 256
+        # 첫 기록 시점에 시작 (조회만 하는 프로세스는 스레드를 만들지 않음)
+        self._worker: Optional[threading.Thread] = None
         self._collection_task: Optional[asyncio.Task] = None
         self._collection_interval = 60
         self.alert_thresholds = {
@@ -107,14 +332,32 @@ class MetricsCollector(metaclass=SingletonMeta):
             "response_time_max": 1.0,
         }
         self.alert_callbacks: List[Callable] = []
+        self._compile_alert_specs()
+        # 캐시별 직전 수집 시점의 (hits, misses, 시간 인덱스)와 24시간 슬롯
+        self._last_totals: Dict[str, Tuple[int, int, int]] = {}
+        self._hourly: Dict[str, Tuple[array, array]] = {}
+        # id(cache_backend) -> 기능 비트마스크 (백엔드 소멸 시 제거)
+        self._backend_caps: Dict[int, int] = {}
 
     def start_collection(self, interval: int = 60):
         """메트릭스 수집 시작"""
         self._collection_interval = interval
         if not self._collection_task or self._collection_task.done():
+            self._warn_if_default_loop(asyncio.get_running_loop())
             self._collection_task = asyncio.create_task(self._collection_loop())
             logger.info(f"메트릭스 수집 시작: {interval}초 간격")
 
+    def _warn_if_default_loop(self, loop: asyncio.AbstractEventLoop):
+        """uvloop가 아닌 이벤트 루프 사용 시 한 번만 경고"""
+        global _LOOP_WARNING_EMITTED
+        if _LOOP_WARNING_EMITTED or type(loop).__module__.startswith("uvloop"):
+            return
+        _LOOP_WARNING_EMITTED = True
+        logger.warning(
+            "메트릭스 수집 루프가 기본 asyncio 이벤트 루프에서 실행됩니다. "
+            "rfs-framework[performance] 설치 후 uvloop.install()을 권장합니다"
+        )
+
     def stop_collection(self):
         """메트릭스 수집 중지"""
         if self._collection_task and (not self._collection_task.done()):
@@ -123,139 +366,377 @@ class MetricsCollector(metaclass=SingletonMeta):
 
     async def _collection_loop(self):
         """메트릭스 수집 루프"""
+        loop = asyncio.get_running_loop()
+        # 수집 소요 시간만큼 주기가 밀리지 않도록 절대 시각 기준으로 대기
+        deadline = loop.time() + self._collection_interval
         while True:
             try:
-                await asyncio.sleep(self._collection_interval)
+                sleep_for = deadline - loop.time()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
                 await self.collect_all_metrics()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"메트릭스 수집 오류: {e}")
+            interval = self._collection_interval
+            deadline += interval
+            now = loop.time()
+            if deadline <= now:
+                # 수집이 주기보다 오래 걸렸으면 밀린 주기는 건너뜀
+                deadline += ((now - deadline) // interval + 1) * interval
 
     async def collect_all_metrics(self):
         """모든 캐시의 메트릭스 수집"""
         try:
             cache_manager = get_cache_manager()
-            current_time = datetime.now()
-            for cache_name, cache_backend in cache_manager.caches.items():
-                metrics = await self.collect_cache_metrics(cache_name, cache_backend)
-                time_key = current_time.strftime("%Y-%m-%d %H:%M")
-                self.metrics_history[cache_name] = self.metrics_history[cache_name] + [
-                    {"timestamp": time_key, "metrics": metrics.to_dict()}
-                ]
-                await self._check_alerts(cache_name, metrics)
+            caches = list(cache_manager.caches.items())
+            # 수집 주기당 한 번만 시각을 계산해 모든 캐시에 전달
+            current_time = datetime.now().replace(second=0, microsecond=0)
+            time_key = current_time.strftime("%Y-%m-%d %H:%M")
+            epoch = int(current_time.timestamp())
+            results = await self._collect_many(caches, current_time)
+            collected = []
+            for (cache_name, _), metrics in zip(caches, results):
+                if metrics is None:
+                    continue
+                self._append_history(
+                    cache_name,
+                    epoch,
+                    {
+                        "timestamp": time_key,
+                        "epoch": epoch,
+                        "metrics": metrics.to_dict(),
+                    },
+                )
+                collected.append((cache_name, metrics))
+            await asyncio.gather(
+                *(
+                    self._check_alerts(cache_name, metrics)
+                    for cache_name, metrics in collected
+                ),
+                return_exceptions=True,
+            )
         except Exception as e:
             logger.error(f"전체 메트릭스 수집 실패: {e}")
 
     async def collect_cache_metrics(
-        self, cache_name: str, cache_backend: CacheBackend
+        self,
+        cache_name: str,
+        cache_backend: CacheBackend,
+        *,
+        current_time: Optional[datetime] = None,
     ) -> CacheMetrics:
         """개별 캐시 메트릭스 수집"""
         try:
-            stats = cache_backend.get_stats()
-            metrics = CacheMetrics(
-                hits=stats.get("hits", 0),
-                misses=stats.get("misses", 0),
-                sets=stats.get("sets", 0),
-                deletes=stats.get("deletes", 0),
-                errors=stats.get("errors", 0),
-            )
-            operation_times = self.operation_times.get(cache_name, deque())
-            if operation_times:
-                get_times = [t for t in operation_times if t.get("operation") == "get"]
-                set_times = [t for t in operation_times if t.get("operation") == "set"]
-                if get_times:
-                    get_durations = [t["duration"] for t in get_times]
-                    metrics.avg_get_time = sum(get_durations) / len(get_durations)
-                    metrics.max_get_time = max(get_durations)
-                if set_times:
-                    set_durations = [t["duration"] for t in set_times]
-                    metrics.avg_set_time = sum(set_durations) / len(set_durations)
-                    metrics.max_set_time = max(set_durations)
-            current_hour = datetime.now().strftime("%H")
-            metrics.hourly_hits = {
-                **metrics.hourly_hits,
-                current_hour: stats.get("hits", 0),
-            }
-            metrics.hourly_misses = {
-                **metrics.hourly_misses,
-                current_hour: stats.get("misses", 0),
-            }
-            metrics.hot_keys = self._get_hot_keys(cache_name)
-            if hasattr(cache_backend, "_current_memory"):
-                metrics.memory_usage = cache_backend._current_memory
-                metrics.memory_limit = cache_backend.config.max_memory
-            if hasattr(cache_backend, "redis") and cache_backend.redis:
-                try:
-                    info = await cache_backend.redis.info()
-                    metrics.connections_active = info.get("connected_clients", 0)
-                except:
-                    pass
+            await self._flush_async()
+            metrics = self._collect_sync(cache_name, cache_backend, current_time)
+            await self._collect_redis_info(cache_backend, metrics)
             return metrics
         except Exception as e:
             logger.error(f"캐시 메트릭스 수집 실패 ({cache_name}): {e}")
             return CacheMetrics()
 
+    def _collect_sync(
+        self,
+        cache_name: str,
+        cache_backend: CacheBackend,
+        current_time: Optional[datetime] = None,
+    ) -> CacheMetrics:
+        """이벤트 루프 없이 수집 가능한 메트릭스 스냅샷 (호출 전 flush 필요)"""
+        stats = cache_backend.get_stats()
+        metrics = CacheMetrics(
+            hits=stats.get("hits", 0),
+            misses=stats.get("misses", 0),
+            sets=stats.get("sets", 0),
+            deletes=stats.get("deletes", 0),
+            errors=stats.get("errors", 0),
+        )
+        with self._lock:
+            get_count = self.op_count.get((cache_name, "get"), 0)
+            if get_count:
+                metrics.avg_get_time = (
+                    self.op_sum[(cache_name, "get")] / get_count / 1e9
+                )
+                metrics.max_get_time = self.op_max[(cache_name, "get")] / 1e9
+            set_count = self.op_count.get((cache_name, "set"), 0)
+            if set_count:
+                metrics.avg_set_time = (
+                    self.op_sum[(cache_name, "set")] / set_count / 1e9
+                )
+                metrics.max_set_time = self.op_max[(cache_name, "set")] / 1e9
+            hot_keys = self._get_hot_keys(cache_name)
+            hourly_hits, hourly_misses = self._record_hourly(
+                cache_name, metrics.hits, metrics.misses, current_time or datetime.now()
+            )
+        metrics.hourly_hits = hourly_hits
+        metrics.hourly_misses = hourly_misses
+        metrics.hot_keys = hot_keys
+        if self._backend_capabilities(cache_backend) & CAP_MEMORY:
+            metrics.memory_usage = cache_backend._current_memory
+            metrics.memory_limit = cache_backend.config.max_memory
+        return metrics
+
+    def _record_hourly(
+        self, cache_name: str, hits: int, misses: int, current_time: datetime
+    ) -> Tuple[array, array]:
+        """직전 수집 대비 증가분을 시간대별 슬롯에 누적하고 스냅샷 반환"""
+        hour_index = current_time.toordinal() * 24 + current_time.hour
+        slots = self._hourly.get(cache_name)
+        if slots is None:
+            slots = self._hourly[cache_name] = (
+                array("q", [0]) * 24,
+                array("q", [0]) * 24,
+            )
+        hourly_hits, hourly_misses = slots
+        prev_hits, prev_misses, last_hour_index = self._last_totals.get(
+            cache_name, (0, 0, hour_index)
+        )
+        # 마지막 수집 이후 새로 시작된 시간대 슬롯은 이전 날짜 값이 남지 않도록 비움
+        for index in range(max(last_hour_index + 1, hour_index - 23), hour_index + 1):
+            hourly_hits[index % 24] = 0
+            hourly_misses[index % 24] = 0
+        # 통계가 초기화되어 누적값이 줄었으면 현재값 전체를 증가분으로 간주
+        delta_hits = hits - prev_hits if hits >= prev_hits else hits
+        delta_misses = misses - prev_misses if misses >= prev_misses else misses
+        hourly_hits[current_time.hour] += delta_hits
+        hourly_misses[current_time.hour] += delta_misses
+        self._last_totals[cache_name] = (hits, misses, hour_index)
+        return array("q", hourly_hits), array("q", hourly_misses)
+
+    async def _collect_many(
+        self, caches: List[Tuple[str, CacheBackend]], current_time: datetime
+    ) -> List[Optional[CacheMetrics]]:
+        """여러 캐시의 메트릭스를 수집 (실패한 캐시는 None)"""
+        await self._flush_async()
+        results: List[Optional[CacheMetrics]] = []
+        # 같은 커넥션 풀을 공유하는 캐시는 Redis INFO를 한 번만 조회
+        pools: Dict[int, Tuple[Any, List[CacheMetrics]]] = {}
+        for cache_name, cache_backend in caches:
+            try:
+                metrics = self._collect_sync(cache_name, cache_backend, current_time)
+            except Exception as e:
+                logger.error(f"캐시 메트릭스 수집 실패 ({cache_name}): {e}")
+                results.append(None)
+                continue
+            results.append(metrics)
+            if self._backend_capabilities(cache_backend) & CAP_REDIS:
+                client = cache_backend.redis
+                if client:
+                    pool_id = id(getattr(client, "connection_pool", client))
+                    pools.setdefault(pool_id, (client, []))[1].append(metrics)
+        if pools:
+            await asyncio.gather(
+                *(
+                    self._collect_pool_info(client, pool_metrics)
+                    for client, pool_metrics in pools.values()
+                )
+            )
+        return results
+
+    async def _collect_pool_info(self, client: Any, pool_metrics: List[CacheMetrics]):
+        """커넥션 풀 단위 Redis INFO 조회 결과를 캐시별 메트릭스에 반영"""
+        try:
+            info = await client.info()
+        except Exception:
+            return
+        connections_active = info.get("connected_clients", 0)
+        for metrics in pool_metrics:
+            metrics.connections_active = connections_active
+
+    async def _collect_redis_info(
+        self, cache_backend: CacheBackend, metrics: CacheMetrics
+    ):
+        """Redis INFO 기반 연결 메트릭스 수집"""
+        if (
+            self._backend_capabilities(cache_backend) & CAP_REDIS
+            and cache_backend.redis
+        ):
+            try:
+                info = await cache_backend.redis.info()
+                metrics.connections_active = info.get("connected_clients", 0)
+            except:
+                pass
+
+    def _backend_capabilities(self, cache_backend: CacheBackend) -> int:
+        """백엔드 기능 비트마스크 (최초 조회 시 한 번만 검사)"""
+        backend_id = id(cache_backend)
+        caps = self._backend_caps.get(backend_id)
+        if caps is not None:
+            return caps
+        caps = 0
+        if hasattr(cache_backend, "_current_memory"):
+            caps |= CAP_MEMORY
+        if hasattr(cache_backend, "redis"):
+            caps |= CAP_REDIS
+        try:
+            weakref.finalize(cache_backend, self._backend_caps.pop, backend_id, None)
+        except TypeError:
+            # 약한 참조를 지원하지 않으면 id 재사용 위험이 있어 캐시하지 않음
+            return caps
+        self._backend_caps[backend_id] = caps
+        return caps
+
     def record_operation(
         self, cache_name: str, operation: str, key: str, duration: float
     ):
-        """작업 기록"""
-        self.key_access_count[f"{cache_name}:{key}"] = self.key_access_count[
-            f"{cache_name}:{key}"
-        ] + (1)
-        self.operation_times[cache_name] = self.operation_times[cache_name] + [
-            {
-                "operation": operation,
-                "key": key,
-                "duration": duration,
-                "timestamp": time.time(),
-            }
-        ]
+        """작업 기록 (초 단위)"""
+        self.record_operation_ns(
+            cache_name, operation, key, int(duration * 1_000_000_000)
+        )
+
+    def record_operation_ns(
+        self, cache_name: str, operation: str, key: str, duration: int
+    ):
+        """작업 기록 (나노초 단위)"""
+        if self._worker is None:
+            self._start_worker()
+        self._queue.put_nowait((cache_name, operation, key, duration))
+
+    def _start_worker(self):
+        """백그라운드 집계 스레드 시작"""
+        with self._lock:
+            if self._worker is not None:
+                return
+            worker = threading.Thread(
+                target=self._drain_loop, name="rfs-cache-metrics", daemon=True
+            )
+            worker.start()
+            self._worker = worker
+
+    def flush(self, timeout: float = 1.0):
+        """대기 중인 작업 기록을 집계에 반영 (최대 timeout초 대기하므로 동기 호출 전용)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._drain_pending()
+            return
+        # 큐는 FIFO이므로 마커가 처리되면 앞선 기록도 모두 반영된 상태
+        done = threading.Event()
+        self._queue.put_nowait(done)
+        done.wait(timeout)
+
+    async def _flush_async(self):
+        """이벤트 루프를 막지 않고 flush (대기는 실행기 스레드에서)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._drain_pending()
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def _drain_loop(self):
+        """백그라운드 집계 루프"""
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < self._batch_size:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+            self._apply_batch(batch)
+
+    def _drain_pending(self):
+        """큐에 남은 기록을 호출 스레드에서 집계"""
+        batch = []
+        try:
+            while True:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self._apply_batch(batch)
+
+    def _apply_batch(self, batch: List[Any]):
+        """작업 기록 배치 집계"""
+        with self._lock:
+            for record in batch:
+                if isinstance(record, threading.Event):
+                    record.set()
+                    continue
+                try:
+                    self._apply_operation(*record)
+                except Exception as e:
+                    logger.error(f"작업 기록 집계 실패: {e}")
+
+    def _apply_operation(
+        self, cache_name: str, operation: str, key: str, duration: int
+    ):
+        """단일 작업 기록 집계"""
+        interned = self._interned_names
+        cache_name = interned.get(cache_name) or interned.setdefault(
+            cache_name, sys.intern(cache_name)
+        )
+        operation = interned.get(operation) or interned.setdefault(
+            operation, sys.intern(operation)
+        )
+        self.key_access_count[cache_name][key] += 1
+        op_key = (cache_name, operation)
+        durations = self.op_durations[op_key]
+        max_window = self._op_max_window[op_key]
+        if len(durations) == durations.maxlen:
+            # 윈도우에서 밀려나는 값은 누적 합계/개수/최대값 후보에서 제외
+            evicted = durations[0]
+            self.op_sum[op_key] -= evicted
+            self.op_count[op_key] -= 1
+            if max_window[0] == evicted:
+                max_window.popleft()
+        durations.append(duration)
+        while max_window and max_window[-1] < duration:
+            max_window.pop()
+        max_window.append(duration)
+        self.op_sum[op_key] += duration
+        self.op_count[op_key] += 1
+        self.op_max[op_key] = max_window[0]
+
+    def reset(self, cache_name: str = None):
+        """수집된 메트릭스 초기화"""
+        self.flush()
+        with self._lock:
+            if cache_name:
+                self.metrics_history.pop(cache_name, None)
+                for op_key in [k for k in self.op_durations if k[0] == cache_name]:
+                    self.op_durations.pop(op_key, None)
+                    self.op_sum.pop(op_key, None)
+                    self.op_max.pop(op_key, None)
+                    self._op_max_window.pop(op_key, None)
+                    self.op_count.pop(op_key, None)
+                self.key_access_count.pop(cache_name, None)
+                self._last_totals.pop(cache_name, None)
+                self._hourly.pop(cache_name, None)
+            else:
+                self.metrics_history.clear()
+                self.op_durations.clear()
+                self.op_sum.clear()
+                self.op_max.clear()
+                self._op_max_window.clear()
+                self.op_count.clear()
+                self.key_access_count.clear()
+                self._last_totals.clear()
+                self._hourly.clear()
 
     def _get_hot_keys(self, cache_name: str, limit: int = 10) -> List[str]:
         """Hot keys 추출"""
-        cache_keys = {
-            k: v
-            for k, v in self.key_access_count.items()
-            if k.startswith(f"{cache_name}:")
-        }
-        sorted_keys = sorted(cache_keys.items(), key=lambda x: x[1], reverse=True)
-        return [k.split(":", 1)[1] for k, _ in sorted_keys[:limit]]
+        access_count = self.key_access_count.get(cache_name)
+        if not access_count:
+            return []
+        return [k for k, _ in access_count.most_common(limit)]
 
     async def _check_alerts(self, cache_name: str, metrics: CacheMetrics):
         """알림 확인"""
+        if not self.alert_callbacks:
+            return
         alerts = []
-        if metrics.hit_rate < self.alert_thresholds["hit_rate_min"]:
-            alerts = alerts + [
-                {
-                    "type": "low_hit_rate",
-                    "cache": cache_name,
-                    "value": metrics.hit_rate,
-                    "threshold": self.alert_thresholds["hit_rate_min"],
-                    "message": f"캐시 히트율이 낮습니다: {metrics.hit_rate:.2%}",
-                }
-            ]
-        if metrics.error_rate > self.alert_thresholds["error_rate_max"]:
-            alerts = alerts + [
-                {
-                    "type": "high_error_rate",
-                    "cache": cache_name,
-                    "value": metrics.error_rate,
-                    "threshold": self.alert_thresholds["error_rate_max"],
-                    "message": f"캐시 에러율이 높습니다: {metrics.error_rate:.2%}",
-                }
-            ]
-        max_response_time = max(metrics.avg_get_time, metrics.avg_set_time)
-        if max_response_time > self.alert_thresholds["response_time_max"]:
-            alerts = alerts + [
-                {
-                    "type": "high_response_time",
-                    "cache": cache_name,
-                    "value": max_response_time,
-                    "threshold": self.alert_thresholds["response_time_max"],
-                    "message": f"캐시 응답시간이 느립니다: {max_response_time:.3f}s",
-                }
-            ]
+        for alert_type, getter, compare, threshold, format_message in self._alert_specs:
+            value = getter(metrics)
+            if compare(value, threshold):
+                alerts.append(
+                    {
+                        "type": alert_type,
+                        "cache": cache_name,
+                        "value": value,
+                        "threshold": threshold,
+                        "message": format_message(value),
+                    }
+                )
         for alert in alerts:
             for callback in self.alert_callbacks:
                 try:
@@ -266,6 +747,14 @@ class MetricsCollector(metaclass=SingletonMeta):
                 except Exception as e:
                     logger.error(f"알림 콜백 실행 실패: {e}")
 
+    def _compile_alert_specs(self):
+        """임계값 기준 알림 검사 규칙 생성"""
+        self._alert_specs = [
+            (alert_type, getter, compare, self.alert_thresholds[metric], format_message)
+            for metric, alert_type, getter, compare, format_message in _ALERT_RULES
+            if metric in self.alert_thresholds
+        ]
+
     def add_alert_callback(self, callback: Callable):
         """알림 콜백 추가"""
         self.alert_callbacks = self.alert_callbacks + [callback]
@@ -273,64 +762,144 @@ class MetricsCollector(metaclass=SingletonMeta):
     def set_alert_threshold(self, metric: str, threshold: float):
         """알림 임계값 설정"""
         self.alert_thresholds = {**self.alert_thresholds, metric: threshold}
+        self._compile_alert_specs()
 
     def get_metrics_history(self, cache_name: str, hours: int = 24) -> List[Dict]:
         """메트릭스 히스토리 조회"""
-        history = self.metrics_history.get(cache_name, deque())
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        filtered_history = []
-        for entry in history:
-            entry_time = datetime.strptime(entry["timestamp"], "%Y-%m-%d %H:%M")
-            if entry_time >= cutoff_time:
-                filtered_history = filtered_history + [entry]
-        return filtered_history
+        tiers = self.metrics_history.get(cache_name)
+        if not tiers:
+            return []
+        span = hours * 3600
+        cutoff = int(time.time()) - span
+        # 조회 범위를 덮는 가장 거친 단계부터 세밀한 단계 순으로 이어 붙임
+        coarsest = 0
+        while (
+            coarsest + 1 < len(_HISTORY_TIERS)
+            and span > _HISTORY_TIERS[coarsest][1] * _HISTORY_TIERS[coarsest][2]
+        ):
+            coarsest += 1
+        history = []
+        boundary = cutoff
+        for name, seconds, _ in reversed(_HISTORY_TIERS[: coarsest + 1]):
+            ring = tiers[name]
+            entries = ring.since(boundary)
+            if entries:
+                history.extend(entries)
+                boundary = ring.epochs[-1] + seconds
+        return history
+
+    def _append_history(self, cache_name: str, epoch: int, entry: Dict[str, Any]):
+        """히스토리 항목 추가 (완료된 구간은 상위 단계로 롤업)"""
+        tiers = self.metrics_history[cache_name]
+        # 수집 간격이 1분보다 짧아도 minute 단계는 분당 한 항목만 유지
+        # (고정 길이 링이 항상 한 시간을 덮어 시간 롤업이 구간 전체를 반영)
+        minute_ring = tiers[_HISTORY_TIERS[0][0]]
+        minute_seconds = _HISTORY_TIERS[0][1]
+        if (
+            minute_ring.epochs
+            and minute_ring.epochs[-1] // minute_seconds == epoch // minute_seconds
+        ):
+            minute_ring.merge_last(entry)
+            return
+        for index, (name, _, _) in enumerate(_HISTORY_TIERS):
+            ring = tiers[name]
+            rollup = None
+            if index + 1 < len(_HISTORY_TIERS) and ring.epochs:
+                bucket_seconds = _HISTORY_TIERS[index + 1][1]
+                bucket_start = ring.epochs[-1] // bucket_seconds * bucket_seconds
+                if epoch >= bucket_start + bucket_seconds:
+                    rollup = _rollup_entries(ring.since(bucket_start), bucket_start)
+            ring.append(epoch, entry)
+            if rollup is None:
+                break
+            epoch, entry = rollup
 
     def generate_report(self, cache_name: str = None) -> Dict[str, Any]:
         """메트릭스 보고서 생성"""
         try:
             cache_manager = get_cache_manager()
+            current_time = datetime.now()
+            self.flush()
             if cache_name:
                 cache_backend = cache_manager.get_cache(cache_name)
                 if not cache_backend:
                     return {"error": f"캐시를 찾을 수 없습니다: {cache_name}"}
-                metrics = asyncio.run(
-                    self.collect_cache_metrics(cache_name, cache_backend)
-                )
-                return {
-                    "cache_name": cache_name,
-                    "metrics": metrics.to_dict(),
-                    "history": self.get_metrics_history(cache_name, 1)[-10:],
-                    "hot_keys": metrics.hot_keys,
+                collected = {
+                    cache_name: self._collect_sync(
+                        cache_name, cache_backend, current_time
+                    )
                 }
             else:
-                report = {"summary": {}, "caches": {}, "alerts": []}
-                total_metrics = CacheMetrics()
-                for name, cache_backend in cache_manager.caches.items():
-                    metrics = asyncio.run(
-                        self.collect_cache_metrics(name, cache_backend)
-                    )
-                    report["caches"] = {**report["caches"], name: metrics.to_dict()}
-                    hits = hits + metrics.hits
-                    misses = misses + metrics.misses
-                    sets = sets + metrics.sets
-                    deletes = deletes + metrics.deletes
-                    errors = errors + metrics.errors
-                report["summary"] = {"summary": total_metrics.to_dict()}
-                return report
+                collected = {
+                    name: self._collect_sync(name, cache_backend, current_time)
+                    for name, cache_backend in cache_manager.caches.items()
+                }
+            return self._build_report(cache_name, collected)
         except Exception as e:
             logger.error(f"보고서 생성 실패: {e}")
             return {"error": str(e)}
 
+    async def generate_report_async(self, cache_name: str = None) -> Dict[str, Any]:
+        """실행 중인 이벤트 루프에서 메트릭스 보고서 생성"""
+        try:
+            cache_manager = get_cache_manager()
+            current_time = datetime.now()
+            if cache_name:
+                cache_backend = cache_manager.get_cache(cache_name)
+                if not cache_backend:
+                    return {"error": f"캐시를 찾을 수 없습니다: {cache_name}"}
+                caches = [(cache_name, cache_backend)]
+            else:
+                caches = list(cache_manager.caches.items())
+            results = await self._collect_many(caches, current_time)
+            collected = {
+                name: metrics or CacheMetrics()
+                for (name, _), metrics in zip(caches, results)
+            }
+            return self._build_report(cache_name, collected)
+        except Exception as e:
+            logger.error(f"보고서 생성 실패: {e}")
+            return {"error": str(e)}
 
-_metrics_collector: Optional[MetricsCollector] = None
+    def _build_report(
+        self, cache_name: Optional[str], collected: Dict[str, CacheMetrics]
+    ) -> Dict[str, Any]:
+        """수집된 메트릭스로 보고서 구성"""
+        if cache_name:
+            metrics = collected[cache_name]
+            return {
+                "cache_name": cache_name,
+                "metrics": metrics.to_dict(),
+                "history": self.get_metrics_history(cache_name, 1)[-10:],
+                "hot_keys": metrics.hot_keys or [],
+            }
+        report = {"summary": {}, "caches": {}, "alerts": []}
+        totals = Counter()
+        for name, metrics in collected.items():
+            metrics_dict = metrics.to_dict()
+            report["caches"][name] = metrics_dict
+            totals.update({key: metrics_dict[key] for key in _SUMMARY_COUNTERS})
+        hits, misses, errors = totals["hits"], totals["misses"], totals["errors"]
+        total_reads = hits + misses
+        total_operations = total_reads + totals["sets"] + totals["deletes"]
+        hit_rate_bp = _ratio_bp(hits, total_reads) if total_reads else 0
+        error_rate_bp = _ratio_bp(errors, total_operations) if total_operations else 0
+        report["summary"] = {
+            "summary": {
+                **{key: totals[key] for key in _SUMMARY_COUNTERS},
+                "total_operations": total_operations,
+                "hit_rate": hit_rate_bp / 10000,
+                "miss_rate": (10000 - hit_rate_bp) / 10000,
+                "error_rate": error_rate_bp / 10000,
+            }
+        }
+        return report
 
 
 def get_metrics_collector() -> MetricsCollector:
     """메트릭스 수집기 인스턴스 반환"""
-    # global _metrics_collector - removed for functional programming
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
+    # MetricsCollector는 싱글톤이므로 생성자 호출이 곧 공유 인스턴스 조회
+    return MetricsCollector()
 
 
 def get_cache_metrics(cache_name: str = None) -> Result[Dict[str, Any], str]:
@@ -356,54 +925,63 @@ def reset_cache_metrics(cache_name: str = None) -> Result[None, str]:
         else:
             for cache_backend in cache_manager.caches.values():
                 cache_backend.reset_stats()
-        collector = get_metrics_collector()
-        if cache_name:
-            metrics_history = {
-                k: v for k, v in metrics_history.items() if k != "cache_name, None"
-            }
-            operation_times = {
-                k: v for k, v in operation_times.items() if k != "cache_name, None"
-            }
-            keys_to_remove = [
-                k
-                for k in collector.key_access_count.keys()
-                if k.startswith(f"{cache_name}:")
-            ]
-            for key in keys_to_remove:
-                del collector.key_access_count[key]
-        else:
-            metrics_history = {}
-            operation_times = {}
-            key_access_count = {}
+        get_metrics_collector().reset(cache_name)
         return Success(None)
     except Exception as e:
         return Failure(f"메트릭스 초기화 실패: {str(e)}")
 
 
+def set_metrics_enabled(enabled: bool):
+    """캐시 작업 추적 활성화 여부 설정"""
+    global _METRICS_ENABLED
+    _METRICS_ENABLED = enabled
+
+
 def track_cache_operation(cache_name: str = None):
     """캐시 작업 추적 데코레이터"""
 
     def decorator(func: Callable) -> Callable:
+        operation = func.__name__
+        name = cache_name or "default"
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not _METRICS_ENABLED:
+                    return await func(*args, **kwargs)
+                start_time = time.perf_counter_ns()
+                try:
+                    result = await func(*args, **kwargs)
+                    duration = time.perf_counter_ns() - start_time
+                    if len(args) >= 2:
+                        get_metrics_collector().record_operation_ns(
+                            name, operation, str(args[1]), duration
+                        )
+                    return result
+                except Exception as e:
+                    logger.error(f"캐시 작업 실패 ({operation}): {e}")
+                    raise
+
+            return wrapper
 
         @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            operation = func.__name__
+        def sync_wrapper(*args, **kwargs):
+            if not _METRICS_ENABLED:
+                return func(*args, **kwargs)
+            start_time = time.perf_counter_ns()
             try:
-                result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                result = func(*args, **kwargs)
+                duration = time.perf_counter_ns() - start_time
                 if len(args) >= 2:
-                    key = str(args[1])
-                    collector = get_metrics_collector()
-                    collector.record_operation(
-                        cache_name or "default", operation, key, duration
+                    get_metrics_collector().record_operation_ns(
+                        name, operation, str(args[1]), duration
                     )
                 return result
             except Exception as e:
-                duration = time.time() - start_time
                 logger.error(f"캐시 작업 실패 ({operation}): {e}")
                 raise
 
-        return wrapper
+        return sync_wrapper
 
     return decorator
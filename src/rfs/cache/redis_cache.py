@@ -5,9 +5,10 @@ Redis 캐시 구현
 """
 
 import asyncio
+import functools
 import json
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 try:
     import aioredis
@@ -18,10 +19,153 @@ except ImportError:
     REDIS_AVAILABLE = False
 from ..core.enhanced_logging import get_logger
 from ..core.result import Failure, Result, Success
-from .base import CacheBackend, CacheConfig
+from .base import CacheBackend, CacheConfig, SerializationType
 
 logger = get_logger(__name__)
 
+# 공통 TTL로 여러 키를 저장하는 Lua 스크립트 (마지막 ARGV가 TTL)
+_SET_MANY_SCRIPT = """
+local ttl = ARGV[#ARGV]
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, ARGV[i], 'EX', ttl)
+end
+return #KEYS
+"""
+
+# 값을 읽으면서 TTL을 갱신하는 Lua 스크립트 (GETEX 미지원 서버용)
+_GET_AND_TOUCH_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return value
+"""
+
+# 이 개수를 넘는 배치 저장은 EVALSHA 한 번으로 처리
+_SET_MANY_SCRIPT_THRESHOLD = 1000
+
+# CLIENT TRACKING 무효화 메시지가 전달되는 채널 (RESP2 REDIRECT 방식)
+_INVALIDATION_CHANNEL = "__redis__:invalidate"
+
+# 압축 사용 시 값 앞에 붙는 2바이트 표식. 선두 0xc1은 msgpack이 쓰지 않고
+# UTF-8(JSON)·pickle 값도 이 바이트로 시작하지 않아 표식 없는 기존 값과 구분됨
+_MARKER_LEAD = b"\xc1"
+_RAW_MARKER = _MARKER_LEAD + b"\x00"
+_COMPRESSION_MARKERS = {"zstd": _MARKER_LEAD + b"\x01", "lz4": _MARKER_LEAD + b"\x02"}
+
+_PARSER_WARNING_EMITTED = False
+
+
+def _warn_if_python_parser():
+    """hiredis 없이 순수 Python RESP 파서를 쓰는 경우 한 번만 경고"""
+    global _PARSER_WARNING_EMITTED
+    if _PARSER_WARNING_EMITTED:
+        return
+    _PARSER_WARNING_EMITTED = True
+    # aioredis/redis-py는 hiredis가 설치되어 있으면 자동으로 C 파서를 사용
+    if getattr(getattr(aioredis, "connection", None), "HIREDIS_AVAILABLE", False):
+        return
+    logger.warning(
+        "hiredis가 설치되지 않아 Python RESP 파서를 사용합니다. "
+        "rfs-framework[performance] 설치 후 uvloop.install()을 권장합니다"
+    )
+
+
+class _RedisNotConnected(ConnectionError):
+    """연결되지 않은 상태에서 Redis 명령 호출"""
+
+
+class _DisconnectedRedis:
+    """연결 전/해제 후 self.redis 자리를 채우는 객체 (모든 명령에서 예외 발생)"""
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        raise _RedisNotConnected("Redis 연결이 없습니다")
+
+
+_DISCONNECTED = _DisconnectedRedis()
+
+
+def _resolve_compressor(
+    compression: str,
+) -> Optional[Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    """압축 방식별 (압축, 해제) 함수 반환"""
+    try:
+        match compression:
+            case "zstd":
+                import zstandard
+
+                # 압축기/해제기는 인스턴스별로 재사용
+                compressor = zstandard.ZstdCompressor(level=1)
+                decompressor = zstandard.ZstdDecompressor()
+                return compressor.compress, decompressor.decompress
+            case "lz4":
+                import lz4.frame
+
+                return lz4.frame.compress, lz4.frame.decompress
+    except ImportError:
+        logger.warning(f"{compression} 패키지를 사용할 수 없어 압축 없이 저장합니다")
+    return None
+
+
+def _compressed_codec(
+    encode: Callable[[Any], bytes],
+    decode: Callable[[bytes], Any],
+    compression: str,
+    threshold: int,
+) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    """임계값 이상의 값만 압축하는 코덱으로 감싸기"""
+    compressor = _resolve_compressor(compression)
+    if compressor is None:
+        return encode, decode
+    compress, decompress = compressor
+    marker = _COMPRESSION_MARKERS[compression]
+
+    def encode_compressed(value: Any) -> bytes:
+        data = encode(value)
+        if len(data) >= threshold:
+            return marker + compress(data)
+        return _RAW_MARKER + data
+
+    def decode_compressed(data: bytes) -> Any:
+        head = data[:2]
+        if head == marker:
+            return decode(decompress(data[2:]))
+        if head == _RAW_MARKER:
+            return decode(data[2:])
+        # 압축 설정 이전에 저장된 값
+        return decode(data)
+
+    return encode_compressed, decode_compressed
+
+
+def redis_operation(operation: str) -> Callable:
+    """예외를 Failure로 변환하는 Redis 명령 데코레이터"""
+
+    error_prefix = f"Redis {operation} 실패: "
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            # 연결 여부는 미리 검사하지 않고 _DisconnectedRedis 예외로 판단
+            try:
+                return await func(self, *args, **kwargs)
+            except _RedisNotConnected:
+                return Failure("Redis 연결이 없습니다")
+            except Exception as e:
+                self._errors += 1
+                error_msg = error_prefix + str(e)
+                logger.error(error_msg)
+                return Failure(error_msg)
+
+        return wrapper
+
+    return decorator
+
 
 @dataclass
 class RedisCacheConfig(CacheConfig):
@@ -33,6 +177,8 @@ class RedisCacheConfig(CacheConfig):
     ssl_ca_certs: Optional[str] = None
     ssl_certfile: Optional[str] = None
     ssl_keyfile: Optional[str] = None
+    # connect() 시 미리 열어 둘 연결 수와 풀 상한
+    # (유휴 연결마다 서버 메모리/파일 디스크립터를 쓰므로 부하에 맞게 조정)
     pool_min_size: int = 1
     pool_max_size: int = 20
     cluster_mode: bool = False
@@ -41,18 +187,54 @@ class RedisCacheConfig(CacheConfig):
     socket_keepalive: bool = True
     socket_keepalive_options: Dict[str, Any] = field(default_factory=dict)
     health_check_interval: int = 30
+    pipeline_batch_size: int = 500
+    # 결과가 필요 없는 DELETE/EXPIRE를 모아 파이프라인으로 지연 전송
+    write_behind: bool = False
+    write_behind_flush_ms: int = 1
+    # compress_threshold 바이트 이상의 값 압축 ("none", "zstd", "lz4")
+    compression: Literal["none", "zstd", "lz4"] = "none"
+    # 서버 무효화 알림(CLIENT TRACKING)을 받는 로컬 캐시로 반복 조회의 왕복 제거
+    client_tracking: bool = False
+    local_cache_size: int = 10000
 
 
 class RedisCache(CacheBackend):
     """Redis 캐시 구현"""
 
+    # MSET/Lua 등 여러 키를 한 명령으로 다룰 수 있는지 여부
+    _multi_key_writes = True
+
     def __init__(self, config: RedisCacheConfig):
         if not REDIS_AVAILABLE:
             raise ImportError("aioredis 패키지가 필요합니다: pip install aioredis")
         super().__init__(config)
         self.config: RedisCacheConfig = config
-        self.redis: Optional[aioredis.Redis] = None
-        self.pool: Optional[aioredis.ConnectionPool] = None
+        self.redis: aioredis.Redis = _DISCONNECTED
+        self.pool: Optional[aioredis.BlockingConnectionPool] = None
+        if config.compression != "none":
+            self._encode, self._decode = _compressed_codec(
+                self._encode,
+                self._decode,
+                config.compression,
+                config.compress_threshold,
+            )
+        # JSON 외 직렬화/압축 값은 디코딩 없이 bytes 그대로 역직렬화에 넘김
+        self._decode_responses = (
+            config.decode_responses
+            and config.serialization == SerializationType.JSON
+            and config.compression == "none"
+        )
+        self._script_shas: Dict[str, str] = {}
+        self._getex_supported = True
+        self._write_behind_pending: List[Tuple[str, tuple]] = []
+        self._write_behind_task: Optional[asyncio.Task] = None
+        self._local_cache: Optional[Dict[str, Any]] = None
+        # 조회 중인 키 -> 표식 (그 사이 무효화되면 지워져 가져온 값을 저장하지 않음)
+        self._local_pending: Dict[str, object] = {}
+        self._tracking_connection: Optional[Any] = None
+        # CLIENT TRACKING을 켠 연결 (추적 상태가 연결에 묶이므로 수명 동안 보유)
+        self._tracking_owner: Optional[Any] = None
+        self._tracking_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> Result[None, str]:
         """Redis 연결"""
@@ -60,28 +242,40 @@ class RedisCache(CacheBackend):
             if self._connected:
                 return Success(None)
             if self.config.redis_url:
-                self.pool = aioredis.ConnectionPool.from_url(
+                self.pool = aioredis.BlockingConnectionPool.from_url(
                     self.config.redis_url,
                     max_connections=self.config.pool_max_size,
+                    timeout=self.config.connection_timeout,
                     retry_on_timeout=True,
-                    decode_responses=self.config.decode_responses,
+                    decode_responses=self._decode_responses,
                 )
             else:
-                self.pool = aioredis.ConnectionPool(
+                self.pool = aioredis.BlockingConnectionPool(
                     host=self.config.host,
                     port=self.config.port,
                     db=self.config.db,
                     password=self.config.password,
                     max_connections=self.config.pool_max_size,
+                    timeout=self.config.connection_timeout,
                     retry_on_timeout=True,
-                    decode_responses=self.config.decode_responses,
+                    decode_responses=self._decode_responses,
                     socket_keepalive=self.config.socket_keepalive,
                     socket_keepalive_options=self.config.socket_keepalive_options,
                     socket_connect_timeout=self.config.connection_timeout,
                     socket_timeout=self.config.socket_timeout,
                 )
-            self.redis = aioredis.Redis(connection_pool=self.pool)
-            await self.redis.ping()
+            client = aioredis.Redis(connection_pool=self.pool)
+            # 동시 PING으로 pool_min_size개 연결을 미리 수립 (전체를 연결 타임아웃으로 제한)
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(client.ping() for _ in range(max(1, self.config.pool_min_size)))
+                ),
+                timeout=self.config.connection_timeout,
+            )
+            self.redis = client
+            _warn_if_python_parser()
+            if self.config.client_tracking:
+                await self._enable_client_tracking()
             self._connected = True
             logger.info(f"Redis 연결 성공: {self.config.host}:{self.config.port}")
             return Success(None)
@@ -95,10 +289,13 @@ class RedisCache(CacheBackend):
         try:
             if not self._connected:
                 return Success(None)
+            await self._stop_write_behind()
+            await self._disable_client_tracking()
             if self.redis:
                 await self.redis.close()
             if self.pool:
                 await self.pool.disconnect()
+            self.redis = _DISCONNECTED
             self._connected = False
             logger.info("Redis 연결 해제")
             return Success(None)
@@ -107,227 +304,383 @@ class RedisCache(CacheBackend):
             logger.error(error_msg)
             return Failure(error_msg)
 
+    @redis_operation("GET")
     async def get(self, key: str) -> Result[Optional[Any], str]:
         """값 조회"""
+        cache_key = self._make_key(key)
+        local_cache = self._local_cache
+        marker = None
+        if local_cache is not None and not self._tracking_alive():
+            local_cache = None
+        if local_cache is not None:
+            if cache_key in local_cache:
+                self._hits += 1
+                return Success(local_cache[cache_key])
+            marker = object()
+            self._local_pending[cache_key] = marker
+        fresh = False
         try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
             data = await self.redis.get(cache_key)
-            if data is None:
-                self._stats = {**self._stats, "misses": self._stats["misses"] + 1}
-                return Success(None)
-            if type(data).__name__ == "bytes":
-                value = self._deserialize(data)
-            elif type(data).__name__ == "str":
-                value = self._deserialize(data.encode())
-            else:
-                value = data
-            self._stats = {**self._stats, "hits": self._stats["hits"] + 1}
-            return Success(value)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis GET 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
+        finally:
+            if marker is not None and self._local_pending.get(cache_key) is marker:
+                del self._local_pending[cache_key]
+                fresh = True
+        if data is None:
+            self._misses += 1
+            return Success(None)
+        value = self._deserialize(data)
+        if fresh and self._local_cache is local_cache:
+            if len(local_cache) >= self.config.local_cache_size:
+                del local_cache[next(iter(local_cache))]
+            local_cache[cache_key] = value
+        self._hits += 1
+        return Success(value)
+
+    @redis_operation("GETEX")
+    async def get_and_touch(
+        self, key: str, ttl: int = None
+    ) -> Result[Optional[Any], str]:
+        """값 조회와 동시에 TTL 갱신"""
+        cache_key = self._make_key(key)
+        ttl = self._validate_ttl(ttl)
+        data = None
+        if self._getex_supported:
+            try:
+                data = await self.redis.getex(cache_key, ex=ttl)
+            except Exception as e:
+                # Redis 6.2 미만 서버는 GETEX가 없으므로 Lua 스크립트로 대체
+                if "unknown command" not in str(e).lower():
+                    raise
+                self._getex_supported = False
+        if not self._getex_supported:
+            data = await self._run_script(_GET_AND_TOUCH_SCRIPT, [cache_key], [ttl])
+        if data is None:
+            self._misses += 1
+            return Success(None)
+        self._hits += 1
+        return Success(self._deserialize(data))
 
+    @redis_operation("SET")
     async def set(self, key: str, value: Any, ttl: int = None) -> Result[None, str]:
         """값 저장"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
-            ttl = self._validate_ttl(ttl)
-            serialized_value = self._serialize(value)
-            await self.redis.setex(cache_key, ttl, serialized_value)
-            self._stats = {**self._stats, "sets": self._stats["sets"] + 1}
-            return Success(None)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis SET 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
-
+        cache_key = self._make_key(key)
+        ttl = self._validate_ttl(ttl)
+        serialized_value = self._serialize(value)
+        await self.redis.setex(cache_key, ttl, serialized_value)
+        if self._local_cache is not None:
+            self._local_cache.pop(cache_key, None)
+        self._sets += 1
+        return Success(None)
+
+    @redis_operation("DELETE")
     async def delete(self, key: str) -> Result[None, str]:
         """값 삭제"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
-            await self.redis.delete(cache_key)
-            self._stats = {**self._stats, "deletes": self._stats["deletes"] + 1}
-            return Success(None)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis DELETE 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
-
+        cache_key = self._make_key(key)
+        if self.config.write_behind:
+            self._write_behind("unlink", cache_key)
+        else:
+            await self.redis.unlink(cache_key)
+        if self._local_cache is not None:
+            self._local_cache.pop(cache_key, None)
+        self._deletes += 1
+        return Success(None)
+
+    @redis_operation("EXISTS")
     async def exists(self, key: str) -> Result[bool, str]:
         """키 존재 확인"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
-            exists = await self.redis.exists(cache_key)
-            return Success(bool(exists))
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis EXISTS 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
+        cache_key = self._make_key(key)
+        exists = await self.redis.exists(cache_key)
+        return Success(bool(exists))
 
+    @redis_operation("EXPIRE")
     async def expire(self, key: str, ttl: int) -> Result[None, str]:
         """TTL 설정"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
-            ttl = self._validate_ttl(ttl)
+        cache_key = self._make_key(key)
+        ttl = self._validate_ttl(ttl)
+        if self.config.write_behind:
+            self._write_behind("expire", cache_key, ttl)
+        else:
             await self.redis.expire(cache_key, ttl)
-            return Success(None)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis EXPIRE 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
+        return Success(None)
 
+    @redis_operation("TTL")
     async def ttl(self, key: str) -> Result[int, str]:
         """TTL 조회"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
-            remaining_ttl = await self.redis.ttl(cache_key)
-            return Success(remaining_ttl)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis TTL 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
+        cache_key = self._make_key(key)
+        remaining_ttl = await self.redis.ttl(cache_key)
+        return Success(remaining_ttl)
 
+    @redis_operation("CLEAR")
     async def clear(self) -> Result[None, str]:
         """모든 키 삭제"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            if self.namespace:
-                pattern = f"{self.namespace}:*"
-                keys = await self.redis.keys(pattern)
-                if keys:
-                    await self.redis.delete(*keys)
-            else:
-                await self.redis.flushdb()
-            return Success(None)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis CLEAR 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
-
+        if self.namespace:
+            # KEYS는 전체 키 공간을 막으므로 SCAN으로 나눠 UNLINK
+            batch_size = max(1, self.config.pipeline_batch_size)
+            buffer = []
+            async for key in self.redis.scan_iter(
+                match=f"{self.namespace}:*", count=1000
+            ):
+                buffer.append(key)
+                if len(buffer) >= batch_size:
+                    await self.redis.unlink(*buffer)
+                    buffer = []
+            if buffer:
+                await self.redis.unlink(*buffer)
+        else:
+            await self.redis.flushdb(asynchronous=True)
+        if self._local_cache is not None:
+            self._local_cache.clear()
+        return Success(None)
+
+    @redis_operation("MGET")
     async def get_many(self, keys: List[str]) -> Result[Dict[str, Any], str]:
         """다중 조회 (Redis MGET 사용)"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_keys = [self._make_key(key) for key in keys]
-            values = await self.redis.mget(cache_keys)
-            result = {}
-            for i, value in enumerate(values):
-                if value is not None:
-                    original_key = keys[i]
-                    if type(value).__name__ == "bytes":
-                        deserialized_value = self._deserialize(value)
-                    elif type(value).__name__ == "str":
-                        deserialized_value = self._deserialize(value.encode())
-                    else:
-                        deserialized_value = value
-                    if deserialized_value is not None:
-                        result = {
-                            **result,
-                            original_key: {original_key: deserialized_value},
-                        }
-                        self._stats = {**self._stats, "hits": self._stats["hits"] + 1}
-                    else:
-                        self._stats = {
-                            **self._stats,
-                            "misses": self._stats["misses"] + 1,
-                        }
-                else:
-                    self._stats = {**self._stats, "misses": self._stats["misses"] + 1}
-            return Success(result)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis MGET 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
-
+        prefix = self._key_prefix
+        cache_keys = [prefix + key for key in keys]
+        replies = await asyncio.gather(
+            *(self.redis.mget(chunk) for chunk in self._chunks(cache_keys))
+        )
+        values = [value for reply in replies for value in reply]
+        result = {}
+        for original_key, value in zip(keys, values):
+            if value is None:
+                continue
+            deserialized_value = self._deserialize(value)
+            if deserialized_value is not None:
+                result[original_key] = {original_key: deserialized_value}
+        # 통계는 루프 밖에서 한 번에 반영
+        self._hits += len(result)
+        self._misses += len(keys) - len(result)
+        return Success(result)
+
+    @redis_operation("배치 저장")
     async def set_many(
         self, data: Dict[str, Any], ttl: int = None
     ) -> Result[None, str]:
         """다중 저장 (Redis Pipeline 사용)"""
+        if not data:
+            return Success(None)
+        ttl = self._validate_ttl(ttl)
+        prefix, serialize = self._key_prefix, self._serialize
+        mapping = {prefix + key: serialize(value) for key, value in data.items()}
+        if self._multi_key_writes and len(mapping) > _SET_MANY_SCRIPT_THRESHOLD:
+            for chunk in self._chunks(list(mapping.items())):
+                await self._set_many_script(dict(chunk), ttl)
+        else:
+            # 배치 크기마다 파이프라인을 비워 버퍼 메모리를 제한
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for chunk in self._chunks(list(mapping.items())):
+                    if self._multi_key_writes:
+                        pipe.mset(dict(chunk))
+                        for cache_key, _ in chunk:
+                            pipe.expire(cache_key, ttl)
+                    else:
+                        for cache_key, serialized_value in chunk:
+                            pipe.setex(cache_key, ttl, serialized_value)
+                    await pipe.execute()
+        if self._local_cache is not None:
+            for cache_key in mapping:
+                self._local_cache.pop(cache_key, None)
+        self._sets += len(data)
+        return Success(None)
+
+    async def _enable_client_tracking(self) -> None:
+        """서버 지원 클라이언트 캐싱 활성화 (CLIENT TRACKING BCAST)"""
+        connection = owner = None
         try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            ttl = self._validate_ttl(ttl)
-            async with self.redis.pipeline(transaction=True) as pipe:
-                for key, value in data.items():
-                    cache_key = self._make_key(key)
-                    serialized_value = self._serialize(value)
-                    pipe.setex(cache_key, ttl, serialized_value)
+            # 무효화 메시지를 받을 전용 연결을 구독 상태로 두고 나머지 연결은 그대로 사용
+            connection = await self.pool.get_connection("SUBSCRIBE")
+            await connection.send_command("CLIENT", "ID")
+            client_id = await connection.read_response()
+            await connection.send_command("SUBSCRIBE", _INVALIDATION_CHANNEL)
+            await connection.read_response()
+            # 추적은 명령을 보낸 연결에 묶이므로 풀이 재활용하지 않도록 별도 연결을 보유
+            owner = await self.pool.get_connection("CLIENT")
+            prefix = ("PREFIX", self._key_prefix) if self._key_prefix else ()
+            await owner.send_command(
+                "CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefix
+            )
+            await owner.read_response()
+        except Exception as e:
+            # Redis 6 미만 등 미지원 서버는 로컬 캐시 없이 동작
+            logger.warning(f"클라이언트 캐싱 활성화 실패: {str(e)}")
+            for held in (connection, owner):
+                if held is not None:
+                    await self._release_tracking_connection(held)
+            return
+        self._tracking_connection = connection
+        self._tracking_owner = owner
+        self._local_cache = {}
+        self._local_pending.clear()
+        self._tracking_task = asyncio.create_task(self._invalidation_loop())
+
+    async def _disable_client_tracking(self) -> None:
+        """클라이언트 캐싱 중지"""
+        self._stop_local_cache()
+        if self._tracking_task:
+            self._tracking_task.cancel()
+            self._tracking_task = None
+        for attr in ("_tracking_connection", "_tracking_owner"):
+            held = getattr(self, attr)
+            if held is not None:
+                setattr(self, attr, None)
+                await self._release_tracking_connection(held)
+
+    async def _release_tracking_connection(self, connection: Any) -> None:
+        """추적용 연결을 끊고 풀에 반환 (재사용 시 새 연결로 다시 수립됨)"""
+        await connection.disconnect()
+        await self.pool.release(connection)
+
+    def _tracking_alive(self) -> bool:
+        """추적 연결이 살아 있는지 확인하고, 끊겼으면 로컬 캐시 중단"""
+        owner = self._tracking_owner
+        if owner is None or owner.is_connected:
+            return True
+        # 재연결된 연결에는 추적이 없으므로 무효화를 받을 수 없음
+        logger.warning("클라이언트 캐싱 추적 연결이 끊겨 로컬 캐시를 중단합니다")
+        self._stop_local_cache()
+        return False
+
+    def _stop_local_cache(self) -> None:
+        """로컬 캐시 사용 중단"""
+        self._local_cache = None
+        self._local_pending.clear()
+
+    async def _invalidation_loop(self) -> None:
+        """무효화 메시지를 받아 로컬 캐시에서 제거"""
+        while True:
+            try:
+                message = await self._tracking_connection.read_response()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if "Timeout" in type(e).__name__:
+                    if not self._tracking_alive():
+                        return
+                    continue
+                # 무효화를 더 받을 수 없으면 오래된 값을 내주지 않도록 로컬 캐시 중단
+                logger.warning(f"클라이언트 캐싱 무효화 수신 중단: {str(e)}")
+                self._stop_local_cache()
+                return
+            self._invalidate_local(message)
+
+    def _invalidate_local(self, message: Any) -> None:
+        """무효화 메시지 처리 (키 목록이 None이면 전체 삭제)"""
+        local_cache = self._local_cache
+        if local_cache is None or not isinstance(message, list) or len(message) < 3:
+            return
+        kind = message[0]
+        if (kind.decode() if isinstance(kind, bytes) else kind) != "message":
+            return
+        keys = message[2]
+        pending = self._local_pending
+        if keys is None:
+            local_cache.clear()
+            pending.clear()
+            return
+        for key in keys:
+            key = key.decode() if isinstance(key, bytes) else key
+            local_cache.pop(key, None)
+            pending.pop(key, None)
+
+    def _write_behind(self, command: str, *args: Any) -> None:
+        """명령을 지연 전송 버퍼에 추가 (연결이 없으면 버퍼링하지 않고 실패)"""
+        if not self.redis:
+            raise _RedisNotConnected("Redis 연결이 없습니다")
+        self._write_behind_pending.append((command, args))
+        if self._write_behind_task is None:
+            self._write_behind_task = asyncio.create_task(self._write_behind_loop())
+
+    async def _stop_write_behind(self) -> None:
+        """지연 전송 루프를 중단하고 남은 명령을 전송 (연결 해제 전 호출)"""
+        if self._write_behind_task:
+            self._write_behind_task.cancel()
+            self._write_behind_task = None
+        await self._flush_write_behind()
+
+    async def _write_behind_loop(self) -> None:
+        """버퍼가 빌 때까지 주기적으로 전송"""
+        try:
+            while self._write_behind_pending:
+                await asyncio.sleep(self.config.write_behind_flush_ms / 1000)
+                await self._flush_write_behind()
+        finally:
+            self._write_behind_task = None
+
+    async def _flush_write_behind(self) -> None:
+        """지연 전송 버퍼를 한 번의 파이프라인으로 실행"""
+        pending, self._write_behind_pending = self._write_behind_pending, []
+        if not pending:
+            return
+        if not self.redis:
+            self._errors += len(pending)
+            logger.error(
+                f"Redis 연결이 없어 지연 전송 명령 {len(pending)}개를 버립니다"
+            )
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for command, args in pending:
+                    getattr(pipe, command)(*args)
                 await pipe.execute()
-            self._stats = {**self._stats, "sets": self._stats["sets"] + len(data)}
-            return Success(None)
         except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis 배치 저장 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
+            self._errors += 1
+            logger.error(f"Redis 지연 전송 실패: {str(e)}")
+
+    def _chunks(self, items: List[Any]) -> List[List[Any]]:
+        """pipeline_batch_size 단위로 분할"""
+        size = max(1, self.config.pipeline_batch_size)
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    async def _set_many_script(self, mapping: Dict[str, bytes], ttl: int) -> None:
+        """Lua 스크립트로 배치 저장 (EVALSHA)"""
+        await self._run_script(
+            _SET_MANY_SCRIPT, list(mapping), [*mapping.values(), ttl]
+        )
+
+    async def _run_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """등록된 SHA로 Lua 스크립트 실행 (EVALSHA)"""
+        sha = self._script_shas.get(script)
+        if sha is None:
+            sha = self._script_shas[script] = await self.redis.script_load(script)
+        try:
+            return await self.redis.evalsha(sha, len(keys), *keys, *args)
+        except Exception as e:
+            # SCRIPT FLUSH 등으로 서버 캐시에서 사라진 경우 한 번만 재등록
+            if "NOSCRIPT" not in str(e):
+                raise
+            sha = self._script_shas[script] = await self.redis.script_load(script)
+            return await self.redis.evalsha(sha, len(keys), *keys, *args)
 
+    @redis_operation("배치 삭제")
     async def delete_many(self, keys: List[str]) -> Result[None, str]:
         """다중 삭제"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            if not keys:
-                return Success(None)
-            cache_keys = [self._make_key(key) for key in keys]
-            await self.redis.delete(*cache_keys)
-            self._stats = {**self._stats, "deletes": self._stats["deletes"] + len(keys)}
+        if not keys:
             return Success(None)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis 배치 삭제 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
-
+        prefix = self._key_prefix
+        cache_keys = [prefix + key for key in keys]
+        await asyncio.gather(
+            *(self.redis.unlink(*chunk) for chunk in self._chunks(cache_keys))
+        )
+        if self._local_cache is not None:
+            for cache_key in cache_keys:
+                self._local_cache.pop(cache_key, None)
+        self._deletes += len(keys)
+        return Success(None)
+
+    @redis_operation("INCREMENT")
     async def increment(self, key: str, amount: int = 1) -> Result[int, str]:
         """값 증가"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
-            new_value = await self.redis.incrby(cache_key, amount)
-            return Success(new_value)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis INCREMENT 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
+        cache_key = self._make_key(key)
+        new_value = await self.redis.incrby(cache_key, amount)
+        return Success(new_value)
 
+    @redis_operation("DECREMENT")
     async def decrement(self, key: str, amount: int = 1) -> Result[int, str]:
         """값 감소"""
-        try:
-            if not self._connected or not self.redis:
-                return Failure("Redis 연결이 없습니다")
-            cache_key = self._make_key(key)
-            new_value = await self.redis.decrby(cache_key, amount)
-            return Success(new_value)
-        except Exception as e:
-            self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
-            error_msg = f"Redis DECREMENT 실패: {str(e)}"
-            logger.error(error_msg)
-            return Failure(error_msg)
+        cache_key = self._make_key(key)
+        new_value = await self.redis.decrby(cache_key, amount)
+        return Success(new_value)
 
 
 @dataclass
@@ -342,12 +695,15 @@ class RedisClusterConfig(RedisCacheConfig):
 class RedisClusterCache(RedisCache):
     """Redis 클러스터 캐시 구현"""
 
+    # 키가 여러 슬롯에 흩어지므로 MSET/Lua 대신 키별 명령 사용
+    _multi_key_writes = False
+
     def __init__(self, config: RedisClusterConfig):
         if not REDIS_AVAILABLE:
             raise ImportError("aioredis 패키지가 필요합니다: pip install aioredis")
         super().__init__(config)
         self.config: RedisClusterConfig = config
-        self.cluster: Optional[aioredis.RedisCluster] = None
+        self.cluster: aioredis.RedisCluster = _DISCONNECTED
 
     async def connect(self) -> Result[None, str]:
         """Redis 클러스터 연결"""
@@ -356,13 +712,15 @@ class RedisClusterCache(RedisCache):
                 return Success(None)
             if not self.config.startup_nodes:
                 return Failure("Redis 클러스터 노드가 설정되지 않았습니다")
-            self.cluster = aioredis.RedisCluster(
+            cluster = aioredis.RedisCluster(
                 startup_nodes=self.config.startup_nodes,
-                decode_responses=self.config.decode_responses,
+                decode_responses=self._decode_responses,
                 skip_full_coverage_check=self.config.skip_full_coverage_check,
                 max_connections_per_node=self.config.max_connections_per_node,
             )
-            await self.cluster.ping()
+            await cluster.ping()
+            self.redis = self.cluster = cluster
+            _warn_if_python_parser()
             self._connected = True
             logger.info(
                 f"Redis 클러스터 연결 성공: {len(self.config.startup_nodes)}개 노드"
@@ -378,8 +736,10 @@ class RedisClusterCache(RedisCache):
         try:
             if not self._connected:
                 return Success(None)
+            await self._stop_write_behind()
             if self.cluster:
                 await self.cluster.close()
+            self.redis = self.cluster = _DISCONNECTED
             self._connected = False
             logger.info("Redis 클러스터 연결 해제")
             return Success(None)
@@ -387,13 +747,3 @@ class RedisClusterCache(RedisCache):
             error_msg = f"Redis 클러스터 연결 해제 실패: {str(e)}"
             logger.error(error_msg)
             return Failure(error_msg)
-
-    @property
-    def redis(self) -> Optional[Any]:
-        """Redis 클러스터 인스턴스"""
-        return self.cluster
-
-    @redis.setter
-    def redis(self, value):
-        """Redis 클러스터 인스턴스 설정"""
-        self.cluster = value
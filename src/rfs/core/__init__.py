@@ -9,117 +9,9 @@ Core module (RFS v4)
 - 설정 검증 및 타입 안전성
 """
 
-from .annotation_processor import (
-    AnnotationProcessor,
-    ProcessingContext,
-    ProcessingResult,
-    auto_register,
-    auto_register_classes,
-    auto_scan_package,
-)
-from .annotation_registry import (
-    AnnotationRegistry,
-    DependencyGraph,
-    RegistrationResult,
-    get_annotation_registry,
-    register_classes,
-)
-
-# 어노테이션 시스템 (RFS v4.1 신규)
-from .annotations import (
-    Adapter,
-    AnnotationMetadata,
-    AnnotationType,
-    Component,
-    Controller,
-    Port,
-    Repository,
-    Service,
-    ServiceScope,
-    UseCase,
-    get_annotation_metadata,
-    has_annotation,
-    validate_hexagonal_architecture,
-)
-
-# 설정 관리 시스템 (v4 통합)
-from .config import (
-    ConfigManager,
-    Environment,
-    RFSConfig,
-    check_pydantic_compatibility,
-    export_cloud_run_yaml,
-    is_cloud_run_environment,
-    validate_environment,
-)
-
-# 환경별 설정 프로파일
-from .config_profiles import (
-    ConfigProfile,
-    DevelopmentProfile,
-    ProductionProfile,
-    ProfileManager,
-    TestProfile,
-    create_profile_config,
-    detect_current_environment,
-    get_environment_summary,
-    profile_manager,
-    validate_current_environment,
-)
-
-# 설정 검증 시스템
-from .config_validation import (
-    ConfigValidator,
-    SecurityValidator,
-    ValidationLevel,
-    ValidationResult,
-    ValidationSeverity,
-    export_validation_report,
-    quick_validate,
-    validate_config,
-    validate_security,
-)
-
-# Enhanced Logging System (NEW v4.1)
-from .enhanced_logging import (
-    EnhancedLogger,
-    LogContext,
-    LogEntry,
-    LogLevel,
-    get_default_logger,
-    get_log_context,
-    get_logger,
-    log_critical,
-)
-from .enhanced_logging import log_debug as enhanced_log_debug
-from .enhanced_logging import log_error as enhanced_log_error
-from .enhanced_logging import (
-    log_execution,
-)
-from .enhanced_logging import log_info as enhanced_log_info
-from .enhanced_logging import log_warning as enhanced_log_warning
-from .enhanced_logging import (
-    set_log_context,
-    with_log_context,
-)
+import importlib
+from typing import Any
 
-# 헬퍼 함수들
-from .helpers import (
-    create_event,
-    get,
-    get_config,
-    get_enhanced_logger,
-    get_event_bus,
-    log_debug,
-    log_error,
-    log_info,
-    log_warning,
-    log_with_context,
-    monitor_performance,
-    publish_event,
-    record_metric,
-    setup_logging,
-)
 from .registry import ServiceRegistry
 
 # Result 패턴 및 함수형 프로그래밍
@@ -137,22 +29,132 @@ from .result import (
 
 # 싱글톤 및 레지스트리
 from .singleton import StatelessRegistry, stateless
-from .transaction_decorators import (
-    DistributedTransaction,
-    RedisTransaction,
-    Transactional,
-    TransactionalContextManager,
-    transactional_context,
-    with_transaction,
-)
 
-# Transaction Management System (NEW v4.1)
-from .transactions import (
-    DistributedTransaction,
-    RedisTransactionManager,
-    TransactionManager,
-    get_transaction_manager,
-)
+# 나머지 서브시스템은 첫 접근 시 로드 (PEP 562)
+# 공개 이름 -> (서브모듈, 속성)
+_LAZY_IMPORTS = {
+    # 어노테이션 시스템 (RFS v4.1 신규)
+    "AnnotationProcessor": ("annotation_processor", "AnnotationProcessor"),
+    "ProcessingContext": ("annotation_processor", "ProcessingContext"),
+    "ProcessingResult": ("annotation_processor", "ProcessingResult"),
+    "auto_register": ("annotation_processor", "auto_register"),
+    "auto_register_classes": ("annotation_processor", "auto_register_classes"),
+    "auto_scan_package": ("annotation_processor", "auto_scan_package"),
+    "flush_pending_registrations": (
+        "annotation_registry",
+        "flush_pending_registrations",
+    ),
+    "AnnotationRegistry": ("annotation_registry", "AnnotationRegistry"),
+    "DependencyGraph": ("annotation_registry", "DependencyGraph"),
+    "RegistrationResult": ("annotation_registry", "RegistrationResult"),
+    "get_annotation_registry": ("annotation_registry", "get_annotation_registry"),
+    "register_classes": ("annotation_registry", "register_classes"),
+    "Adapter": ("annotations", "Adapter"),
+    "AnnotationMetadata": ("annotations", "AnnotationMetadata"),
+    "AnnotationType": ("annotations", "AnnotationType"),
+    "Component": ("annotations", "Component"),
+    "Controller": ("annotations", "Controller"),
+    "Port": ("annotations", "Port"),
+    "Repository": ("annotations", "Repository"),
+    "Service": ("annotations", "Service"),
+    "ServiceScope": ("annotations", "ServiceScope"),
+    "UseCase": ("annotations", "UseCase"),
+    "get_annotation_metadata": ("annotations", "get_annotation_metadata"),
+    "has_annotation": ("annotations", "has_annotation"),
+    "validate_hexagonal_architecture": (
+        "annotations",
+        "validate_hexagonal_architecture",
+    ),
+    # 설정 관리 시스템 (v4 통합)
+    "ConfigManager": ("config", "ConfigManager"),
+    "Environment": ("config", "Environment"),
+    "RFSConfig": ("config", "RFSConfig"),
+    "check_pydantic_compatibility": ("config", "check_pydantic_compatibility"),
+    "export_cloud_run_yaml": ("config", "export_cloud_run_yaml"),
+    "is_cloud_run_environment": ("config", "is_cloud_run_environment"),
+    "validate_environment": ("config", "validate_environment"),
+    # 환경별 설정 프로파일
+    "ConfigProfile": ("config_profiles", "ConfigProfile"),
+    "DevelopmentProfile": ("config_profiles", "DevelopmentProfile"),
+    "ProductionProfile": ("config_profiles", "ProductionProfile"),
+    "ProfileManager": ("config_profiles", "ProfileManager"),
+    "TestProfile": ("config_profiles", "TestProfile"),
+    "create_profile_config": ("config_profiles", "create_profile_config"),
+    "detect_current_environment": ("config_profiles", "detect_current_environment"),
+    "get_environment_summary": ("config_profiles", "get_environment_summary"),
+    "profile_manager": ("config_profiles", "profile_manager"),
+    "validate_current_environment": ("config_profiles", "validate_current_environment"),
+    # 설정 검증 시스템
+    "ConfigValidator": ("config_validation", "ConfigValidator"),
+    "SecurityValidator": ("config_validation", "SecurityValidator"),
+    "ValidationLevel": ("config_validation", "ValidationLevel"),
+    "ValidationResult": ("config_validation", "ValidationResult"),
+    "ValidationSeverity": ("config_validation", "ValidationSeverity"),
+    "export_validation_report": ("config_validation", "export_validation_report"),
+    "quick_validate": ("config_validation", "quick_validate"),
+    "validate_config": ("config_validation", "validate_config"),
+    "validate_security": ("config_validation", "validate_security"),
+    # Enhanced Logging System (NEW v4.1)
+    "EnhancedLogger": ("enhanced_logging", "EnhancedLogger"),
+    "LogContext": ("enhanced_logging", "LogContext"),
+    "LogEntry": ("enhanced_logging", "LogEntry"),
+    "LogLevel": ("enhanced_logging", "LogLevel"),
+    "get_default_logger": ("enhanced_logging", "get_default_logger"),
+    "get_log_context": ("enhanced_logging", "get_log_context"),
+    "get_logger": ("enhanced_logging", "get_logger"),
+    "log_critical": ("enhanced_logging", "log_critical"),
+    "enhanced_log_debug": ("enhanced_logging", "log_debug"),
+    "enhanced_log_error": ("enhanced_logging", "log_error"),
+    "log_execution": ("enhanced_logging", "log_execution"),
+    "enhanced_log_info": ("enhanced_logging", "log_info"),
+    "enhanced_log_warning": ("enhanced_logging", "log_warning"),
+    "set_log_context": ("enhanced_logging", "set_log_context"),
+    "with_log_context": ("enhanced_logging", "with_log_context"),
+    # 헬퍼 함수들
+    "create_event": ("helpers", "create_event"),
+    "get": ("helpers", "get"),
+    "get_config": ("helpers", "get_config"),
+    "get_enhanced_logger": ("helpers", "get_enhanced_logger"),
+    "get_event_bus": ("helpers", "get_event_bus"),
+    "log_debug": ("helpers", "log_debug"),
+    "log_error": ("helpers", "log_error"),
+    "log_info": ("helpers", "log_info"),
+    "log_warning": ("helpers", "log_warning"),
+    "log_with_context": ("helpers", "log_with_context"),
+    "monitor_performance": ("helpers", "monitor_performance"),
+    "publish_event": ("helpers", "publish_event"),
+    "record_metric": ("helpers", "record_metric"),
+    "setup_logging": ("helpers", "setup_logging"),
+    # Transaction Management System (NEW v4.1)
+    "DistributedTransaction": ("transactions", "DistributedTransaction"),
+    "RedisTransaction": ("transaction_decorators", "RedisTransaction"),
+    "Transactional": ("transaction_decorators", "Transactional"),
+    "TransactionalContextManager": (
+        "transaction_decorators",
+        "TransactionalContextManager",
+    ),
+    "transactional_context": ("transaction_decorators", "transactional_context"),
+    "with_transaction": ("transaction_decorators", "with_transaction"),
+    "RedisTransactionManager": ("transactions", "RedisTransactionManager"),
+    "TransactionManager": ("transactions", "TransactionManager"),
+    "get_transaction_manager": ("transactions", "get_transaction_manager"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """지연 로드 대상 이름을 첫 접근 시 임포트"""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 # v4 핵심 exports
 __all__ = [
@@ -199,6 +201,7 @@ __all__ = [
     "auto_scan_package",
     "auto_register_classes",
     "auto_register",
+    "flush_pending_registrations",
     # 설정 관리
     "RFSConfig",
     "ConfigManager",
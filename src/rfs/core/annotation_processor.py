@@ -10,39 +10,72 @@ Annotation Processor
 """
 
 import importlib
-import inspect
 import logging
 import os
-import pkgutil
+import re
 import sys
-from collections import defaultdict, deque
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
-from .annotation_registry import AnnotationRegistry, RegistrationResult
+from .annotation_registry import (
+    _PENDING_REGISTRATIONS,
+    AnnotationRegistry,
+    RegistrationResult,
+    flush_pending_registrations,
+)
 from .annotations import (
     AnnotationMetadata,
     AnnotationType,
     has_annotation,
     validate_hexagonal_architecture,
 )
-from .annotations.base import get_component_metadata
+from .annotations.base import ComponentMetadata, get_component_metadata
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 @dataclass
 class ProcessingContext:
     """처리 컨텍스트"""
 
     profile: str = "default"
-    base_packages: List[str] = field(default_factory=list)
-    exclude_patterns: List[str] = field(default_factory=list)
+    base_packages: Tuple[str, ...] = ()
+    exclude_patterns: Tuple[str, ...] = ()
     auto_register: bool = True
     validate_architecture: bool = True
     resolve_dependencies: bool = True
 
+    def __post_init__(self):
+        # 리스트로 전달되어도 튜플로 고정 (스캔 캐시 키로 그대로 사용)
+        self.base_packages = tuple(self.base_packages or ())
+        self.exclude_patterns = tuple(self.exclude_patterns or ())
+
+
+@dataclass(slots=True)
+class _ResolvedMeta:
+    """의존성 해결에 필요한 컴포넌트 메타데이터 스냅샷"""
+
+    name: str
+    is_port: bool
+    deps: Tuple[str, ...]
+    profile: Optional[str]
+    cls: Type
+
 
 @dataclass
 class ProcessingResult:
@@ -69,10 +102,22 @@ class AnnotationProcessor:
     5. 아키텍처 유효성 검증
     """
 
-    def __init__(self, registry: AnnotationRegistry = None):
+    def __init__(self, registry: AnnotationRegistry = None, strict_marker: bool = True):
         self.registry = registry or AnnotationRegistry()
+        # True: __rfs_has_annotations__ 표시가 없는 모듈은 검사하지 않음
+        self.strict_marker = strict_marker
         self._discovered_classes: Dict[str, Type] = {}
         self._processing_cache: Dict[str, bool] = {}
+        # (패키지, 제외 패턴) -> 제외 필터를 통과한 모듈 이름 목록
+        self._walk_cache: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+        # 클래스 -> 컴포넌트 메타데이터 (등록/정렬 단계에서 반복 조회 방지)
+        self._meta_cache: Dict[Type, Optional[ComponentMetadata]] = {}
+        # 의존성 해결용 메타데이터 스냅샷 (_merge_discovered 시 무효화)
+        self._resolved: Optional[List[_ResolvedMeta]] = None
+        # import에 실패한 모듈 -> 예외 (재스캔 시 import 재시도 방지)
+        self._import_failures: Dict[str, Exception] = {}
+        # 발견된 클래스가 바뀌지 않았다면 직전 아키텍처 검증 결과 재사용
+        self._validation_cache: Optional[List[str]] = None
 
     def scan_package(
         self, package_name: str, context: ProcessingContext
@@ -87,46 +132,61 @@ class AnnotationProcessor:
         Returns:
             ProcessingResult: 처리 결과
         """
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        flush_pending_registrations()
         result = ProcessingResult()
         try:
-            package = importlib.import_module(package_name)
-            package_path = package.__path__
+            exclude_patterns = context.exclude_patterns
+            cache_key = (package_name, exclude_patterns)
+            modnames = self._walk_cache.get(cache_key)
+            if modnames is None:
+                package = importlib.import_module(package_name)
+                prefix = f"{package_name}."
+                excluded = (
+                    re.compile("|".join(map(re.escape, exclude_patterns))).search
+                    if exclude_patterns
+                    else None
+                )
+                modnames = [
+                    modname
+                    for package_path in package.__path__
+                    for modname in self._iter_package_modules(
+                        package_path, prefix, excluded
+                    )
+                ]
+                self._walk_cache[cache_key] = modnames
             discovered_modules = []
-            for importer, modname, ispkg in pkgutil.walk_packages(
-                package_path, prefix=f"{package_name}.", onerror=lambda x: None
-            ):
-                if self._should_exclude_module(modname, context.exclude_patterns or []):
-                    continue
+            _sys_modules = sys.modules
+            import_failures = self._import_failures
+            self._import_concurrently(
+                [
+                    modname
+                    for modname in modnames
+                    if modname not in _sys_modules and modname not in import_failures
+                ]
+            )
+            modules_append = discovered_modules.append
+            warnings_append = result.warnings.append
+            import_module = self._import_module
+            for modname in modnames:
                 try:
-                    module = importlib.import_module(modname)
-                    discovered_modules = discovered_modules + [module]
+                    modules_append(import_module(modname))
                 except Exception as e:
-                    result.warnings = result.warnings + [
-                        f"Failed to import module {modname}: {e}"
-                    ]
+                    warnings_append(f"Failed to import module {modname}: {e}")
+            # 모듈별 결과는 지역 dict에 모은 뒤 한 번만 병합
+            found: Dict[str, Type] = {}
             for module in discovered_modules:
                 module_classes = self._discover_classes_in_module(module)
-                # 함수형 패턴: update 대신 스프레드 연산자 사용
-                self._discovered_classes = {
-                    **self._discovered_classes,
-                    **module_classes,
-                }
-                total_scanned = total_scanned + len(module_classes)
-            if context.auto_register:
-                registration_results = self._register_discovered_classes(context)
-                self._process_registration_results(registration_results, result)
-            if context.validate_architecture:
-                validation_errors = self._validate_architecture()
-                result.validation_errors = result.validation_errors + validation_errors
+                found.update(module_classes)
+                result.total_scanned += len(module_classes)
+            self._merge_discovered(found)
+            return self._finalize(result, context, start_ns)
         except Exception as e:
             result.validation_errors = result.validation_errors + [
                 f"Package scan failed: {e}"
             ]
             logger.error(f"Failed to scan package {package_name}: {e}")
-        result.processing_time_ms = (time.time() - start_time) * 1000
+        result.processing_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         return result
 
     def scan_modules(
@@ -142,35 +202,25 @@ class AnnotationProcessor:
         Returns:
             ProcessingResult: 처리 결과
         """
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        flush_pending_registrations()
         result = ProcessingResult()
+        found: Dict[str, Type] = {}
         for module_item in modules:
             try:
                 if type(module_item).__name__ == "str":
-                    module = importlib.import_module(module_item)
+                    module = self._import_module(module_item)
                 else:
                     module = module_item
                 module_classes = self._discover_classes_in_module(module)
-                # 함수형 패턴: update 대신 스프레드 연산자 사용
-                self._discovered_classes = {
-                    **self._discovered_classes,
-                    **module_classes,
-                }
-                total_scanned = total_scanned + len(module_classes)
+                found.update(module_classes)
+                result.total_scanned += len(module_classes)
             except Exception as e:
                 result.warnings = result.warnings + [
                     f"Failed to process module {module_item}: {e}"
                 ]
-        if context.auto_register:
-            registration_results = self._register_discovered_classes(context)
-            self._process_registration_results(registration_results, result)
-        if context.validate_architecture:
-            validation_errors = self._validate_architecture()
-            result.validation_errors = result.validation_errors + validation_errors
-        result.processing_time_ms = (time.time() - start_time) * 1000
-        return result
+        self._merge_discovered(found)
+        return self._finalize(result, context, start_ns)
 
     def process_classes(
         self, classes: List[Type], context: ProcessingContext
@@ -185,113 +235,237 @@ class AnnotationProcessor:
         Returns:
             ProcessingResult: 처리 결과
         """
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        flush_pending_registrations()
         result = ProcessingResult()
         annotated_classes = {}
         for cls in classes:
             if has_annotation(cls):
                 annotated_classes = {
                     **annotated_classes,
-                    cls.__name__: {cls.__name__: cls},
+                    cls.__name__: cls,
                 }
-        # 함수형 패턴: update 대신 스프레드 연산자 사용
-        self._discovered_classes = {**self._discovered_classes, **annotated_classes}
+        self._merge_discovered(annotated_classes)
         result.total_scanned = len(annotated_classes)
+        return self._finalize(result, context, start_ns)
+
+    def _finalize(
+        self, result: ProcessingResult, context: ProcessingContext, start_ns: int
+    ) -> ProcessingResult:
+        """스캔 공통 마무리: 등록, 아키텍처 검증, 처리 시간 기록"""
         if context.auto_register:
             registration_results = self._register_discovered_classes(context)
             self._process_registration_results(registration_results, result)
         if context.validate_architecture:
-            validation_errors = self._validate_architecture()
-            result.validation_errors = result.validation_errors + validation_errors
-        result.processing_time_ms = (time.time() - start_time) * 1000
+            result.validation_errors.extend(self._validate_architecture())
+        result.processing_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         return result
 
+    def _import_module(self, modname: str) -> Any:
+        """
+        모듈 import (호출 스레드에서 수행)
+
+        로드된 모듈은 sys.modules에서 가져오고, ImportError로 실패했던
+        모듈은 재시도하지 않는다.
+        """
+        module = sys.modules.get(modname)
+        if module is not None:
+            return module
+        error = self._import_failures.get(modname)
+        if error is None:
+            try:
+                return importlib.import_module(modname)
+            except ImportError as e:
+                self._import_failures[modname] = e
+                raise
+        raise error.with_traceback(None)
+
+    def _import_concurrently(self, modnames: List[str]) -> None:
+        """
+        아직 로드되지 않은 모듈들을 스레드 풀에서 미리 import
+
+        풀에서의 실패는 기록하지 않는다. 메인 스레드 전용 API나 순환 import
+        교착처럼 스레드에서만 나는 실패가 있으므로, 실패한 모듈은 이후
+        _import_module이 호출 스레드에서 다시 import해 판정한다.
+        """
+        if len(modnames) < 2:
+            return
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, len(modnames))) as executor:
+            for modname in modnames:
+                executor.submit(importlib.import_module, modname)
+
+    def _iter_package_modules(
+        self,
+        pkg_path: str,
+        prefix: str,
+        excluded: Optional[Callable[[str], Any]] = None,
+    ) -> Iterator[str]:
+        """
+        os.scandir로 패키지 디렉터리를 순회하며 모듈 이름 생성
+
+        제외된 하위 패키지는 디렉터리 단계에서 가지치기하여 내려가지 않는다.
+        """
+        try:
+            with os.scandir(pkg_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not name.isidentifier() or not os.path.exists(
+                    os.path.join(entry.path, "__init__.py")
+                ):
+                    continue
+                modname = f"{prefix}{name}"
+                if excluded and excluded(modname):
+                    continue
+                yield modname
+                yield from self._iter_package_modules(
+                    entry.path, f"{modname}.", excluded
+                )
+            elif name.endswith(".py") and name != "__init__.py":
+                stem = name[:-3]
+                if stem.isidentifier():
+                    modname = f"{prefix}{stem}"
+                    if not (excluded and excluded(modname)):
+                        yield modname
+
     def _discover_classes_in_module(self, module: Any) -> Dict[str, Type]:
         """모듈에서 어노테이션 클래스들 발견"""
+        if self.strict_marker and not getattr(module, "__rfs_has_annotations__", False):
+            return {}
         discovered = {}
-        for name in dir(module):
+        module_name = module.__name__
+        _has = has_annotation
+        for name, obj in vars(module).items():
             try:
-                obj = getattr(module, name)
                 if (
-                    inspect.isclass(obj)
-                    and has_annotation(obj)
-                    and (obj.__module__ == module.__name__)
+                    isinstance(obj, type)
+                    and _has(obj)
+                    and (obj.__module__ == module_name)
                 ):
-                    discovered[obj.__name__] = {obj.__name__: obj}
+                    discovered[obj.__name__] = obj
             except Exception as e:
-                logger.debug(f"Failed to inspect {name} in {module.__name__}: {e}")
+                logger.debug(f"Failed to inspect {name} in {module_name}: {e}")
         return discovered
 
+    def _merge_discovered(self, classes: Dict[str, Type]):
+        """발견된 클래스 병합 (실제로 바뀐 경우에만 검증 캐시 무효화)"""
+        discovered = self._discovered_classes
+        if any(discovered.get(name) is not cls for name, cls in classes.items()):
+            # 함수형 패턴: update 대신 스프레드 연산자 사용
+            self._discovered_classes = {**discovered, **classes}
+            self._validation_cache = None
+            self._resolved = None
+
+    def _get_meta(self, cls: Type) -> Optional[ComponentMetadata]:
+        """컴포넌트 메타데이터 조회 (프로세서 단위 캐시)"""
+        meta = self._meta_cache.get(cls, _MISSING)
+        if meta is _MISSING:
+            meta = get_component_metadata(cls)
+            self._meta_cache[cls] = meta
+        return meta
+
     def _register_discovered_classes(
         self, context: ProcessingContext
     ) -> List[RegistrationResult]:
         """발견된 클래스들을 등록"""
         results = []
+        profile = context.profile
         if context.resolve_dependencies:
-            ordered_classes = self._resolve_registration_order()
-        else:
-            ordered_classes = list(self._discovered_classes.values())
-        for cls in ordered_classes:
-            component_metadata = get_component_metadata(cls)
+            for resolved in self._order_resolved():
+                if resolved.profile and resolved.profile != profile:
+                    continue
+                results.append(self.registry.register_class(resolved.cls))
+            return results
+        for cls in self._discovered_classes.values():
+            component_metadata = self._get_meta(cls)
             if (
                 component_metadata
                 and component_metadata.profile
-                and (component_metadata.profile != context.profile)
+                and (component_metadata.profile != profile)
             ):
                 continue
-            result = self.registry.register_class(cls)
-            results = results + [result]
+            results.append(self.registry.register_class(cls))
         return results
 
+    def _resolved_metas(self) -> List["_ResolvedMeta"]:
+        """의존성 해결용 메타데이터 스냅샷 (발견된 클래스가 바뀔 때까지 재사용)"""
+        if self._resolved is None:
+            by_name = {}
+            for cls in self._discovered_classes.values():
+                component_metadata = self._get_meta(cls)
+                if not component_metadata:
+                    continue
+                by_name[component_metadata.component_id] = _ResolvedMeta(
+                    name=component_metadata.component_id,
+                    # Check if it's a port by looking at metadata
+                    is_port=component_metadata.metadata.get("type") == "port",
+                    deps=tuple(dep.name for dep in component_metadata.dependencies),
+                    profile=component_metadata.profile,
+                    cls=cls,
+                )
+            self._resolved = list(by_name.values())
+        return self._resolved
+
     def _resolve_registration_order(self) -> List[Type]:
         """
         의존성을 고려한 등록 순서 해결 (Topological Sort)
         """
-        dependency_graph = defaultdict(list)
-        in_degree = defaultdict(int)
-        class_by_name = {}
-        for cls in self._discovered_classes.values():
-            component_metadata = get_component_metadata(cls)
-            if not component_metadata:
+        return [resolved.cls for resolved in self._order_resolved()]
+
+    def _order_resolved(self) -> List["_ResolvedMeta"]:
+        """메타데이터 스냅샷을 의존성 순서로 정렬"""
+        resolved = self._resolved_metas()
+        # 이름 -> 정수 인덱스, 진입 차수/인접 리스트는 인덱스 기반 배열
+        index = {meta.name: i for i, meta in enumerate(resolved)}
+        in_degree = [0] * len(resolved)
+        dependents = [[] for _ in resolved]
+        for i, meta in enumerate(resolved):
+            if meta.is_port:
                 continue
-            name = component_metadata.component_id
-            class_by_name[name] = cls
-            # Check if it's a port by looking at metadata
-            if component_metadata.metadata.get("type") == "port":
-                in_degree[name] = 0
-            else:
-                deps = [dep.name for dep in component_metadata.dependencies]
-                in_degree[name] = len(deps)
-                for dep in deps:
-                    dependency_graph[dep] = dependency_graph[dep] + [name]
-        queue = deque([name for name, degree in in_degree.items() if degree == 0])
-        ordered_names = []
+            # 발견되지 않은 의존성은 해소되지 않으므로 차수에 그대로 남는다
+            in_degree[i] = len(meta.deps)
+            for dep in meta.deps:
+                j = index.get(dep)
+                if j is not None:
+                    dependents[j].append(i)
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        ordered = []
+        popleft = queue.popleft
+        enqueue = queue.append
+        order_append = ordered.append
         while queue:
-            current = queue.popleft()
-            ordered_names = ordered_names + [current]
-            for neighbor in dependency_graph[current]:
-                in_degree[neighbor] = in_degree[neighbor] - 1
+            current = popleft()
+            order_append(current)
+            for neighbor in dependents[current]:
+                in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
-                    queue = queue + [neighbor]
-        if len(ordered_names) != len(class_by_name):
-            remaining = set(class_by_name.keys()) - set(ordered_names)
-            logger.warning(f"Circular dependencies detected in: {remaining}")
-            ordered_names = ordered_names + remaining
-        ordered_classes = []
-        for name in ordered_names:
-            if name in class_by_name:
-                ordered_classes = ordered_classes + [class_by_name[name]]
-        return ordered_classes
+                    enqueue(neighbor)
+        if len(ordered) != len(resolved):
+            placed = bytearray(len(resolved))
+            for i in ordered:
+                placed[i] = 1
+            remaining = [i for i in range(len(resolved)) if not placed[i]]
+            logger.warning(
+                "Circular dependencies detected in: "
+                f"{[resolved[i].name for i in remaining]}"
+            )
+            ordered.extend(remaining)
+        return [resolved[i] for i in ordered]
 
     def _validate_architecture(self) -> List[str]:
         """아키텍처 유효성 검증"""
-        classes = list(self._discovered_classes.values())
-        return validate_hexagonal_architecture(classes)
+        if self._validation_cache is None:
+            classes = list(self._discovered_classes.values())
+            self._validation_cache = validate_hexagonal_architecture(classes)
+        return list(self._validation_cache)
 
     def _should_exclude_module(
-        self, module_name: str, exclude_patterns: List[str]
+        self, module_name: str, exclude_patterns: Tuple[str, ...]
     ) -> bool:
         """모듈 제외 여부 확인"""
         for pattern in exclude_patterns:
@@ -303,20 +477,21 @@ class AnnotationProcessor:
         self, results: List[RegistrationResult], processing_result: ProcessingResult
     ):
         """등록 결과를 ProcessingResult에 반영"""
-        for result in results:
-            if result.success:
-                processing_result.successful_registrations = (
-                    processing_result.successful_registrations + [result.service_name]
-                )
-                total_registered = total_registered + 1
-            else:
-                processing_result.failed_registrations = (
-                    processing_result.failed_registrations + [result.service_name]
-                )
-                processing_result.validation_errors = (
-                    processing_result.validation_errors + result.errors
-                )
-            processing_result.warnings = processing_result.warnings + result.warnings
+        successes = [result for result in results if result.success]
+        failures = [result for result in results if not result.success]
+        processing_result.successful_registrations.extend(
+            result.service_name for result in successes
+        )
+        processing_result.failed_registrations.extend(
+            result.service_name for result in failures
+        )
+        processing_result.total_registered += len(successes)
+        processing_result.validation_errors.extend(
+            error for result in failures for error in result.errors
+        )
+        processing_result.warnings.extend(
+            warning for result in results for warning in result.warnings
+        )
 
     def get_discovered_classes(self) -> Dict[str, Type]:
         """발견된 클래스들 조회"""
@@ -326,6 +501,11 @@ class AnnotationProcessor:
         """캐시 정리"""
         self._discovered_classes = {}
         self._processing_cache = {}
+        self._walk_cache = {}
+        self._meta_cache = {}
+        self._validation_cache = None
+        self._import_failures = {}
+        self._resolved = None
 
 
 def auto_scan_package(
@@ -374,7 +554,11 @@ def auto_register_classes(*classes: Type, profile: str = "default") -> Processin
 
 def auto_register(registry: AnnotationRegistry = None):
     """
-    클래스 데코레이터: import 시점에 자동 등록
+    클래스 데코레이터: 등록 대기열에 추가
+
+    실제 등록은 레지스트리를 처음 읽을 때(get_annotation_registry,
+    get, get_by_port, build_dependency_graph), 스캔 시작 시, 또는
+    flush_pending_registrations() 호출 시 수행되어 import 비용을 줄인다.
 
     Example:
         @auto_register()
@@ -384,17 +568,7 @@ def auto_register(registry: AnnotationRegistry = None):
     """
 
     def decorator(cls: Type) -> Type:
-        if not registry:
-            from .annotation_registry import get_annotation_registry
-
-            current_registry = get_annotation_registry()
-        else:
-            current_registry = registry
-        result = current_registry.register_class(cls)
-        if not result.success:
-            logger.warning(
-                f"Auto registration failed for {cls.__name__}: {result.errors}"
-            )
+        _PENDING_REGISTRATIONS.append((cls, registry))
         return cls
 
     return decorator
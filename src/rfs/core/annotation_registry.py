@@ -6,12 +6,26 @@ Annotation Registry
 헥사고날 아키텍처 패턴과 어노테이션 기반 구성을 지원
 """
 
-import inspect
+import json
 import logging
+import sys
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import reduce
-from typing import Any, Callable, Dict, List, Optional, Set, Type
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+)
 
 from .annotations import (
     AnnotationMetadata,
@@ -27,8 +41,18 @@ from .singleton import StatelessRegistry
 
 logger = logging.getLogger(__name__)
 
+# 컴포넌트 메타데이터의 "type" 값 -> AnnotationType (그 외는 COMPONENT)
+_ANNOTATION_TYPES = {
+    "port": AnnotationType.PORT,
+    "adapter": AnnotationType.ADAPTER,
+    "use_case": AnnotationType.USE_CASE,
+    "controller": AnnotationType.CONTROLLER,
+    "service": AnnotationType.SERVICE,
+    "repository": AnnotationType.REPOSITORY,
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class RegistrationResult:
     """등록 결과 정보"""
 
@@ -39,7 +63,7 @@ class RegistrationResult:
     warnings: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyGraph:
     """의존성 그래프 정보"""
 
@@ -49,6 +73,16 @@ class DependencyGraph:
     circular_dependencies: List[List[str]] = field(default_factory=list)
 
 
+# auto_register로 지연된 (클래스, 레지스트리) 등록 대기열
+# 스캔 시작 또는 레지스트리를 처음 읽을 때 처리된다
+_PENDING_REGISTRATIONS: Deque[Tuple[Type, Optional["AnnotationRegistry"]]] = deque()
+
+
+def _dependency_names(component_metadata) -> List[str]:
+    """의존성 이름 목록 (그래프/인덱스 키로 쓰이므로 intern)"""
+    return [sys.intern(dep.name) for dep in component_metadata.dependencies]
+
+
 class AnnotationRegistry(ServiceRegistry):
     """
     어노테이션 기반 의존성 주입 레지스트리
@@ -66,11 +100,18 @@ class AnnotationRegistry(ServiceRegistry):
         self._annotation_metadata: Dict[str, AnnotationMetadata] = {}
         self._ports: Dict[str, Type] = {}
         self._adapters_by_port: Dict[str, List[str]] = {}
+        # (포트, 프로파일) -> 어댑터 이름 목록 (프로파일 필터 조회용)
+        self._adapters_by_port_profile: Dict[Tuple[str, str], List[str]] = {}
         self._registration_order: List[str] = []
+        # 등록 시점에 갱신되는 인접 인덱스 (이름 기반)
+        self._forward_edges: Dict[str, List[str]] = {}
+        self._reverse_edges: Dict[str, List[str]] = {}
+        self._cached_graph: Optional[DependencyGraph] = None
+        self._graph_dirty = True
         self._registration_stats = {
             "total_registered": 0,
-            "by_type": {},
-            "by_scope": {},
+            "by_type": Counter(),
+            "by_scope": Counter(),
             "errors": [],
         }
 
@@ -101,19 +142,21 @@ class AnnotationRegistry(ServiceRegistry):
             )
 
         # Extract the annotation type from metadata
-        annotation_type = AnnotationType.COMPONENT
-        if component_metadata.metadata.get("type") == "port":
-            annotation_type = AnnotationType.PORT
-        elif component_metadata.metadata.get("type") == "adapter":
-            annotation_type = AnnotationType.ADAPTER
-        elif component_metadata.metadata.get("type") == "use_case":
-            annotation_type = AnnotationType.USE_CASE
-        elif component_metadata.metadata.get("type") == "controller":
-            annotation_type = AnnotationType.CONTROLLER
-        elif component_metadata.metadata.get("type") == "service":
-            annotation_type = AnnotationType.SERVICE
-        elif component_metadata.metadata.get("type") == "repository":
-            annotation_type = AnnotationType.REPOSITORY
+        annotation_type = _ANNOTATION_TYPES.get(
+            component_metadata.metadata.get("type"), AnnotationType.COMPONENT
+        )
+
+        # 다른 프로파일의 컴포넌트는 등록 준비 없이 바로 건너뜀
+        profile = component_metadata.profile
+        if profile and profile != self.current_profile:
+            return RegistrationResult(
+                success=False,
+                service_name=component_metadata.component_id,
+                annotation_type=annotation_type,
+                warnings=[
+                    f"Skipping {component_metadata.component_id} - profile {profile} != {self.current_profile}"
+                ],
+            )
 
         result = RegistrationResult(
             success=False,
@@ -121,14 +164,6 @@ class AnnotationRegistry(ServiceRegistry):
             annotation_type=annotation_type,
         )
         try:
-            if (
-                component_metadata.profile
-                and component_metadata.profile != self.current_profile
-            ):
-                result.warnings = result.warnings + [
-                    f"Skipping {component_metadata.component_id} - profile {component_metadata.profile} != {self.current_profile}"
-                ]
-                return result
             match annotation_type:
                 case AnnotationType.PORT:
                     self._register_port(cls, component_metadata, result)
@@ -141,9 +176,11 @@ class AnnotationRegistry(ServiceRegistry):
                 self._annotation_metadata[component_metadata.component_id] = (
                     component_metadata
                 )
-                self._registration_order = self._registration_order + [
-                    component_metadata.component_id
-                ]
+                self._index_edges(
+                    component_metadata.component_id,
+                    _dependency_names(component_metadata),
+                )
+                self._registration_order.append(component_metadata.component_id)
                 self._update_stats(component_metadata, annotation_type)
                 logger.debug(
                     f"Successfully registered {annotation_type.value}: {component_metadata.component_id}"
@@ -156,10 +193,9 @@ class AnnotationRegistry(ServiceRegistry):
     def _register_port(self, cls: Type, component_metadata, result: RegistrationResult):
         """Port 등록"""
         port_name = component_metadata.component_id
-        self._ports = {**self._ports, port_name: cls}
+        self._ports[port_name] = cls
         result.success = True
-        if port_name not in self._adapters_by_port:
-            self._adapters_by_port = {**self._adapters_by_port, port_name: []}
+        self._adapters_by_port.setdefault(port_name, [])
 
     def _register_adapter(
         self, cls: Type, component_metadata, result: RegistrationResult
@@ -169,12 +205,13 @@ class AnnotationRegistry(ServiceRegistry):
         if not port_name:
             result.errors = result.errors + ["Adapter must specify a port_name"]
             return
+        port_name = sys.intern(port_name)
         if port_name not in self._ports:
             result.warnings = result.warnings + [
                 f"Port {port_name} not found - will be validated later"
             ]
 
-        dependencies = [dep.name for dep in component_metadata.dependencies]
+        dependencies = _dependency_names(component_metadata)
         super().register(
             name=component_metadata.component_id,
             service_class=cls,
@@ -183,19 +220,21 @@ class AnnotationRegistry(ServiceRegistry):
             lazy=component_metadata.lazy_init,
         )
 
-        # 함수형 패턴: 조건부 업데이트를 삼항 연산자와 스프레드로 처리
-        existing_adapters = self._adapters_by_port.get(port_name, [])
-        self._adapters_by_port = {
-            **self._adapters_by_port,
-            port_name: existing_adapters + [component_metadata.component_id],
-        }
+        # 등록마다 인덱스 전체를 복사하지 않도록 제자리 갱신
+        self._adapters_by_port.setdefault(port_name, []).append(
+            component_metadata.component_id
+        )
+        if component_metadata.profile:
+            self._adapters_by_port_profile.setdefault(
+                (port_name, component_metadata.profile), []
+            ).append(component_metadata.component_id)
         result.success = True
 
     def _register_component(
         self, cls: Type, component_metadata, result: RegistrationResult
     ):
         """일반 Component, UseCase, Controller 등록"""
-        dependencies = [dep.name for dep in component_metadata.dependencies]
+        dependencies = _dependency_names(component_metadata)
         super().register(
             name=component_metadata.component_id,
             service_class=cls,
@@ -205,6 +244,12 @@ class AnnotationRegistry(ServiceRegistry):
         )
         result.success = True
 
+    def get(self, name: str) -> Any:
+        """서비스 인스턴스 가져오기 (대기 중인 auto_register 등록을 먼저 처리)"""
+        if _PENDING_REGISTRATIONS:
+            flush_pending_registrations()
+        return super().get(name)
+
     def get_by_port(self, port_name: str, profile: str = None) -> Any:
         """
         Port 이름으로 Adapter 인스턴스 조회
@@ -216,21 +261,13 @@ class AnnotationRegistry(ServiceRegistry):
         Returns:
             Adapter 인스턴스
         """
+        if _PENDING_REGISTRATIONS:
+            flush_pending_registrations()
         adapters = self._adapters_by_port.get(port_name, [])
         if not adapters:
             raise ValueError(f"No adapters found for port '{port_name}'")
         if profile:
-            # 함수형 패턴: filter를 사용한 어댑터 필터링
-            filtered_adapters = list(
-                filter(
-                    lambda adapter_name: (
-                        (metadata := self._annotation_metadata.get(adapter_name))
-                        and metadata.profile == profile
-                    ),
-                    adapters,
-                )
-            )
-            adapters = filtered_adapters
+            adapters = self._adapters_by_port_profile.get((port_name, profile), [])
         if not adapters:
             raise ValueError(
                 f"No adapters found for port '{port_name}' with profile '{profile}'"
@@ -247,13 +284,16 @@ class AnnotationRegistry(ServiceRegistry):
         Returns:
             List[RegistrationResult]: 등록 결과들
         """
-        # 함수형 패턴: map과 filter 조합
-        module_objects = map(lambda name: getattr(module, name), dir(module))
-        annotated_classes = filter(
-            lambda obj: inspect.isclass(obj) and has_annotation(obj), module_objects
-        )
-        results = list(map(self.register_class, annotated_classes))
-        return results
+        # 모듈 dict를 직접 순회하고, 다른 모듈에서 re-export된 클래스는 제외
+        module_name = module.__name__
+        annotated_classes = [
+            obj
+            for obj in vars(module).values()
+            if isinstance(obj, type)
+            and obj.__module__ == module_name
+            and has_annotation(obj)
+        ]
+        return list(map(self.register_class, annotated_classes))
 
     def validate_registrations(self) -> List[str]:
         """
@@ -285,134 +325,138 @@ class AnnotationRegistry(ServiceRegistry):
 
     def _validate_dependencies(self) -> List[str]:
         """의존성 유효성 검증"""
-
-        # 함수형 패턴: 중첩된 리스트 컴프리헨션을 filter와 map으로 변환
-        def validate_dependency(service_name: str, dep_name: str) -> Optional[str]:
-            if dep_name not in self._definitions and dep_name not in self._ports:
-                return f"Service '{service_name}' has unknown dependency '{dep_name}'"
-            return None
-
-        # 모든 서비스와 의존성 조합 생성
-        dependency_pairs = [
-            (service_name, dep_name)
+        # 서비스/포트 이름 합집합을 한 번만 구성
+        known_names = self._definitions.keys() | self._ports.keys()
+        return [
+            f"Service '{service_name}' has unknown dependency '{dep_name}'"
             for service_name, definition in self._definitions.items()
             for dep_name in definition.dependencies
+            if dep_name not in known_names
         ]
 
-        # 에러 메시지 필터링
-        errors = list(
-            filter(
-                lambda x: x is not None,
-                map(lambda pair: validate_dependency(*pair), dependency_pairs),
-            )
-        )
-        return errors
-
     def _validate_port_adapter_matching(self) -> List[str]:
         """Port-Adapter 매칭 검증"""
-        # 함수형 패턴: filter와 map 조합
-        adapter_items = filter(
-            lambda item: item[1].annotation_type == AnnotationType.ADAPTER,
-            self._annotation_metadata.items(),
-        )
+        ports = self._ports
+        adapter_items = [
+            (name, metadata.metadata.get("port_name"))
+            for name, metadata in self._annotation_metadata.items()
+            if metadata.metadata.get("type") == "adapter"
+        ]
+        return [
+            f"Adapter '{name}' references unknown port '{port_name}'"
+            for name, port_name in adapter_items
+            if port_name not in ports
+        ]
 
-        errors = list(
-            filter(
-                lambda x: x is not None,
-                map(
-                    lambda item: (
-                        f"Adapter '{item[0]}' references unknown port '{item[1].port_name}'"
-                        if item[1].port_name not in self._ports
-                        else None
-                    ),
-                    adapter_items,
-                ),
-            )
-        )
-        return errors
+    def _index_edges(self, name: str, dependencies: List[str]):
+        """등록된 서비스의 정방향/역방향 간선 갱신"""
+        reverse_edges = self._reverse_edges
+        for dep_name in self._forward_edges.get(name, ()):
+            dependents = reverse_edges.get(dep_name)
+            if dependents and name in dependents:
+                dependents.remove(name)
+        self._forward_edges[name] = dependencies
+        for dep_name in dependencies:
+            reverse_edges.setdefault(dep_name, []).append(name)
+        self._graph_dirty = True
 
     def build_dependency_graph(self) -> DependencyGraph:
-        """의존성 그래프 구성"""
-        graph = DependencyGraph()
-
-        # 함수형 패턴: reduce를 사용한 그래프 노드 구성
-        from functools import reduce
-
-        def add_node(acc, item):
-            name, metadata = item
-            acc["nodes"][name] = metadata
-            acc["edges"][name] = metadata.dependencies.copy()
-            acc["reverse_edges"][name] = []
-            return acc
-
-        initial_graph = {"nodes": {}, "edges": {}, "reverse_edges": {}}
-        graph_data = reduce(add_node, self._annotation_metadata.items(), initial_graph)
-
-        graph.nodes = graph_data["nodes"]
-        graph.edges = graph_data["edges"]
-        graph.reverse_edges = graph_data["reverse_edges"]
+        """
+        의존성 그래프 구성
 
-        # reverse_edges 구성을 함수형으로
-        for service_name, dependencies in graph.edges.items():
-            for dep_name in dependencies:
-                if dep_name in graph.reverse_edges:
-                    graph.reverse_edges[dep_name] = graph.reverse_edges[dep_name] + [
-                        service_name
-                    ]
+        등록 변경이 없으면 캐시된 그래프를 복사해 반환한다 (순환 검출 생략).
+        """
+        if _PENDING_REGISTRATIONS:
+            flush_pending_registrations()
+        if self._graph_dirty or self._cached_graph is None:
+            self._cached_graph = self._compute_dependency_graph()
+            self._graph_dirty = False
+        cached = self._cached_graph
+        # 호출자가 그래프를 수정해도 캐시가 오염되지 않도록 컨테이너를 복사
+        return DependencyGraph(
+            nodes=dict(cached.nodes),
+            edges={name: list(deps) for name, deps in cached.edges.items()},
+            reverse_edges={
+                name: list(deps) for name, deps in cached.reverse_edges.items()
+            },
+            circular_dependencies=[
+                list(cycle) for cycle in cached.circular_dependencies
+            ],
+        )
 
-        graph.circular_dependencies = self._detect_circular_dependencies(graph.edges)
-        return graph
+    def _compute_dependency_graph(self) -> DependencyGraph:
+        """등록 정보와 간선 인덱스로 의존성 그래프 생성"""
+        nodes = dict(self._annotation_metadata)
+        edges = {name: list(self._forward_edges.get(name, ())) for name in nodes}
+        # 역방향 간선은 등록된 노드 사이에서만 유지
+        reverse_edges = {
+            name: [
+                dependent
+                for dependent in self._reverse_edges.get(name, ())
+                if dependent in nodes
+            ]
+            for name in nodes
+        }
+        return DependencyGraph(
+            nodes=nodes,
+            edges=edges,
+            reverse_edges=reverse_edges,
+            circular_dependencies=self._detect_circular_dependencies(edges),
+        )
 
     def _detect_circular_dependencies(
         self, edges: Dict[str, List[str]]
     ) -> List[List[str]]:
-        """순환 의존성 검출"""
-        visited = set()
-        rec_stack = set()
-        cycles = []
+        """
+        순환 의존성 검출 (반복형 3색 DFS)
 
-        def dfs(node: str, path: List[str]):
-            nonlocal cycles  # cycles를 외부 스코프에서 수정
-            if node in rec_stack:
-                cycle_start = path.index(node)
-                cycles = cycles + [path[cycle_start:] + [node]]
-                return
-            if node in visited:
-                return
-            visited.add(node)
-            rec_stack.add(node)
-            for neighbor in edges.get(node, []):
-                dfs(neighbor, path + [node])
-            rec_stack.remove(node)  # set의 remove 메서드 사용
-
-        for node in edges:
-            if node not in visited:
-                dfs(node, [])
+        모든 시작 노드가 하나의 색 정보를 공유하므로 각 노드는 한 번만 방문된다.
+        검출된 순환은 가장 작은 노드부터 시작하도록 회전해 중복을 제거한다.
+        """
+        WHITE, GRAY, BLACK = 0, 1, 2
+        color: Dict[str, int] = {}
+        seen: Set[tuple] = set()
+        cycles = []
+        for start in edges:
+            if color.get(start, WHITE) != WHITE:
+                continue
+            color[start] = GRAY
+            path = [start]
+            stack = [iter(edges.get(start, ()))]
+            while stack:
+                for neighbor in stack[-1]:
+                    state = color.get(neighbor, WHITE)
+                    if state == GRAY:
+                        cycle = path[path.index(neighbor) :]
+                        pivot = cycle.index(min(cycle))
+                        canonical = tuple(cycle[pivot:] + cycle[:pivot])
+                        if canonical not in seen:
+                            seen.add(canonical)
+                            cycles.append(list(canonical) + [canonical[0]])
+                    elif state == WHITE:
+                        color[neighbor] = GRAY
+                        path.append(neighbor)
+                        stack.append(iter(edges.get(neighbor, ())))
+                        break
+                else:
+                    stack.pop()
+                    color[path.pop()] = BLACK
         return cycles
 
     def _update_stats(self, component_metadata, annotation_type: AnnotationType):
         """통계 정보 업데이트"""
-        # 함수형 패턴: 불변성을 유지하면서 업데이트
-        type_name = annotation_type.value
-        scope_name = component_metadata.scope.value
-
-        # 함수형 업데이트 헬퍼
-        def update_counter(counter_dict: dict, key: str) -> dict:
-            return {**counter_dict, key: counter_dict.get(key, 0) + 1}
-
-        self._registration_stats = {
-            **self._registration_stats,
-            "total_registered": self._registration_stats["total_registered"] + 1,
-            "by_type": update_counter(self._registration_stats["by_type"], type_name),
-            "by_scope": update_counter(
-                self._registration_stats["by_scope"], scope_name
-            ),
-        }
+        stats = self._registration_stats
+        stats["total_registered"] += 1
+        stats["by_type"][annotation_type.value] += 1
+        stats["by_scope"][component_metadata.scope.value] += 1
 
     def get_registration_stats(self) -> Dict[str, Any]:
         """등록 통계 조회"""
+        stats = self._registration_stats
         return {
-            **self._registration_stats,
+            **stats,
+            "by_type": dict(stats["by_type"]),
+            "by_scope": dict(stats["by_scope"]),
             "current_profile": self.current_profile,
             "ports": len(self._ports),
             "adapters": sum(
@@ -423,61 +467,79 @@ class AnnotationRegistry(ServiceRegistry):
 
     def get_port_info(self) -> Dict[str, Any]:
         """Port 정보 조회"""
+        return dict(self.get_port_info_iter())
 
-        # 함수형 패턴: map과 filter를 사용한 포트 정보 구성
-        def build_adapter_detail(adapter_name: str) -> Optional[dict]:
-            metadata = self._annotation_metadata.get(adapter_name)
-            if metadata:
-                return {
-                    "name": adapter_name,
-                    "class": metadata.target_class.__name__,
-                    "scope": metadata.scope.value,
-                    "profile": metadata.profile,
-                }
-            return None
-
-        def build_port_entry(port_item: tuple) -> tuple:
-            port_name, port_class = port_item
+    def get_port_info_iter(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Port 정보를 (port_name, info) 쌍으로 지연 생성"""
+        for port_name, port_class in self._ports.items():
             adapters = self._adapters_by_port.get(port_name, [])
-
-            # adapter_details를 함수형으로 구성
-            adapter_details = list(
-                filter(lambda x: x is not None, map(build_adapter_detail, adapters))
-            )
-
-            return (
-                port_name,
-                {
-                    "class": port_class.__name__,
-                    "adapters": adapter_details,
-                    "adapter_count": len(adapters),
-                },
-            )
-
-        # 전체 port_info를 함수형으로 구성
-        port_info = dict(map(build_port_entry, self._ports.items()))
-        return port_info
+            adapter_details = []
+            for adapter_name in adapters:
+                metadata = self._annotation_metadata.get(adapter_name)
+                if metadata:
+                    adapter_details.append(
+                        {
+                            "name": adapter_name,
+                            "class": metadata.component_type.__name__,
+                            "scope": metadata.scope.value,
+                            "profile": metadata.profile,
+                        }
+                    )
+            yield port_name, {
+                "class": port_class.__name__,
+                "adapters": adapter_details,
+                "adapter_count": len(adapters),
+            }
+
+    def _configuration_items(self) -> Iterator[Tuple[str, Any]]:
+        """export 항목을 순서대로 생성 (port_info는 지연 이터레이터)"""
+        yield "profile", self.current_profile
+        yield "registration_stats", self.get_registration_stats()
+        yield "port_info", self.get_port_info_iter()
+        yield "dependency_graph", {
+            "nodes": len(self._annotation_metadata),
+            "edges": sum(
+                len(metadata.dependencies)
+                for metadata in self._annotation_metadata.values()
+            ),
+        }
+        yield "timestamp", datetime.now().isoformat()
 
     def export_configuration(self) -> Dict[str, Any]:
         """현재 구성을 dict로 export"""
-        # 함수형 패턴: map을 사용한 의존성 카운트
-        edge_count = sum(
-            map(
-                lambda metadata: len(metadata.dependencies),
-                self._annotation_metadata.values(),
-            )
-        )
+        config = dict(self._configuration_items())
+        config["port_info"] = dict(config["port_info"])
+        return config
 
-        return {
-            "profile": self.current_profile,
-            "registration_stats": self.get_registration_stats(),
-            "port_info": self.get_port_info(),
-            "dependency_graph": {
-                "nodes": len(self._annotation_metadata),
-                "edges": edge_count,
-            },
-            "timestamp": datetime.now().isoformat(),
-        }
+    def export_configuration_stream(self, writer: TextIO) -> None:
+        """
+        현재 구성을 JSON으로 점진적으로 기록
+
+        port_info 전체를 메모리에 만들지 않고 포트 단위로 인코딩한다.
+
+        Args:
+            writer: write()를 지원하는 텍스트 출력 대상
+        """
+        encoder = json.JSONEncoder()
+        write = writer.write
+        write("{")
+        for index, (key, value) in enumerate(self._configuration_items()):
+            if index:
+                write(", ")
+            write(f"{encoder.encode(key)}: ")
+            if key != "port_info":
+                for chunk in encoder.iterencode(value):
+                    write(chunk)
+                continue
+            write("{")
+            for port_index, (port_name, info) in enumerate(value):
+                if port_index:
+                    write(", ")
+                write(f"{encoder.encode(port_name)}: ")
+                for chunk in encoder.iterencode(info):
+                    write(chunk)
+            write("}")
+        write("}")
 
 
 # 싱글톤 패턴을 클래스 속성으로 구현
@@ -503,10 +565,36 @@ class RegistryManager:
 
 
 def get_annotation_registry(profile: str = "default") -> AnnotationRegistry:
-    """전역 어노테이션 레지스트리 조회"""
+    """전역 어노테이션 레지스트리 조회 (대기 중인 auto_register 등록을 먼저 처리)"""
+    if _PENDING_REGISTRATIONS:
+        flush_pending_registrations()
     return RegistryManager.get_registry(profile)
 
 
+def flush_pending_registrations() -> List[RegistrationResult]:
+    """
+    auto_register로 지연된 등록 처리
+
+    Returns:
+        List[RegistrationResult]: 처리된 등록 결과
+    """
+    results = []
+    while _PENDING_REGISTRATIONS:
+        try:
+            cls, registry = _PENDING_REGISTRATIONS.popleft()
+        except IndexError:
+            break
+        if not registry:
+            registry = RegistryManager.get_registry()
+        result = registry.register_class(cls)
+        if not result.success:
+            logger.warning(
+                f"Auto registration failed for {cls.__name__}: {result.errors}"
+            )
+        results.append(result)
+    return results
+
+
 def register_classes(*classes: Type) -> List[RegistrationResult]:
     """편의 함수: 여러 클래스를 한 번에 등록"""
     registry = get_annotation_registry()
@@ -5,10 +5,12 @@ Base Annotation Definitions and Metadata for RFS Framework
 """
 
 import inspect
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Set, Type
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type
 
 
 class ServiceScope(Enum):
@@ -40,15 +42,21 @@ class AnnotationType(Enum):
     COMPONENT = "component"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnnotationMetadata:
-    """애노테이션 메타데이터"""
+    """애노테이션 메타데이터 (생성 후 불변)"""
 
     annotation_type: str
-    parameters: Dict[str, Any]
+    parameters: Mapping[str, Any] = field(hash=False)
     target: Any
     target_type: str
 
+    def __post_init__(self):
+        if not isinstance(self.parameters, MappingProxyType):
+            object.__setattr__(
+                self, "parameters", MappingProxyType(dict(self.parameters))
+            )
+
     def get_param(self, key: str, default: Any = None) -> Any:
         """파라미터 조회"""
         return self.parameters.get(key, default)
@@ -58,7 +66,7 @@ class AnnotationMetadata:
         return key in self.parameters
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyMetadata:
     """의존성 메타데이터"""
 
@@ -71,7 +79,7 @@ class DependencyMetadata:
     default_value: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentMetadata:
     """컴포넌트 메타데이터"""
 
@@ -140,6 +148,9 @@ def get_component_metadata(component_type: Type) -> Optional[ComponentMetadata]:
 def set_component_metadata(component_type: Type, metadata: ComponentMetadata):
     """컴포넌트 메타데이터 저장"""
     global _component_metadata
+    # 레지스트리 곳곳에서 dict 키로 쓰이므로 intern
+    if type(metadata.component_id) is str:
+        metadata.component_id = sys.intern(metadata.component_id)
     _component_metadata[component_type] = metadata
 
 
@@ -169,6 +180,11 @@ def set_annotation_metadata(target: Any, metadata: AnnotationMetadata):
     if target not in _annotation_metadata:
         _annotation_metadata[target] = []
     _annotation_metadata[target].append(metadata)
+    if inspect.isclass(target):
+        # 스캐너가 어노테이션 클래스가 없는 모듈을 건너뛸 수 있도록 모듈에 표시
+        module = sys.modules.get(target.__module__)
+        if module is not None:
+            module.__rfs_has_annotations__ = True
 
 
 def create_annotation_decorator(
@@ -215,22 +231,74 @@ def create_annotation_decorator(
     return decorator
 
 
+_dependency_cache: Dict[Type, Tuple[DependencyMetadata, ...]] = {}
+
+
+def _annotated_parameters(func: Callable) -> List[Tuple[str, Any, bool]]:
+    """타입이 지정된 파라미터의 (이름, 타입, 필수 여부) 목록
+
+    일반 함수는 Signature 객체를 만들지 않고 __code__ 에서 직접 읽는다.
+    """
+    code = getattr(func, "__code__", None)
+    if code is None or hasattr(func, "__wrapped__") or hasattr(func, "__signature__"):
+        empty = inspect.Parameter.empty
+        return [
+            (name, param.annotation, param.default is empty)
+            for name, param in inspect.signature(func).parameters.items()
+            if param.annotation is not empty
+        ]
+    annotations = getattr(func, "__annotations__", None)
+    if not annotations:
+        return []
+
+    names = code.co_varnames
+    positional = code.co_argcount
+    keyword_only = positional + code.co_kwonlyargcount
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    first_default = positional - len(defaults)
+
+    # 선언 순서: 위치 인자, *args, 키워드 전용 인자, **kwargs
+    params = [
+        (name, index < first_default) for index, name in enumerate(names[:positional])
+    ]
+    extra = keyword_only
+    if code.co_flags & inspect.CO_VARARGS:
+        params.append((names[extra], True))
+        extra += 1
+    params.extend(
+        (name, name not in kwdefaults) for name in names[positional:keyword_only]
+    )
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        params.append((names[extra], True))
+
+    return [
+        (name, annotations[name], required)
+        for name, required in params
+        if name in annotations
+    ]
+
+
 def extract_dependencies(cls: Type) -> List[DependencyMetadata]:
-    """클래스에서 의존성 추출"""
-    dependencies = []
-    if hasattr(cls, "__init__"):
-        sig = inspect.signature(cls.__init__)
-        for param_name, param in sig.parameters.items():
-            if param_name == "self":
-                continue
-            if param.annotation != inspect.Parameter.empty:
-                dep = DependencyMetadata(
-                    name=param_name,
-                    type=param.annotation,
-                    required=param.default == inspect.Parameter.empty,
-                    injection_type=InjectionType.CONSTRUCTOR,
-                )
-                dependencies = dependencies + [dep]
+    """클래스에서 의존성 추출 (클래스별 캐시, 호출마다 새 복사본 반환)"""
+    cached = _dependency_cache.get(cls)
+    if cached is None:
+        cached = _dependency_cache[cls] = tuple(_extract_dependencies(cls))
+    return [replace(dep) for dep in cached]
+
+
+def _extract_dependencies(cls: Type) -> List[DependencyMetadata]:
+    """생성자 파라미터와 Autowired 필드에서 의존성 생성"""
+    dependencies = [
+        DependencyMetadata(
+            name=param_name,
+            type=param_type,
+            required=required,
+            injection_type=InjectionType.CONSTRUCTOR,
+        )
+        for param_name, param_type, required in _annotated_parameters(cls.__init__)
+        if param_name != "self"
+    ]
     if hasattr(cls, "__annotations__"):
         for field_name, field_type in cls.__annotations__.items():
             if hasattr(cls, field_name):
@@ -11,16 +11,23 @@ RFS Framework Cache 시스템 포괄적 단위 테스트
 """
 
 import asyncio
+import sys
 import threading
 import time
 from dataclasses import asdict
+from types import SimpleNamespace
 from typing import Any, Dict, List
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from rfs.cache.base import CacheBackend, CacheConfig, CacheType, SerializationType
-from rfs.cache.memory_cache import CacheItem, MemoryCache, MemoryCacheConfig
+from rfs.cache.memory_cache import (
+    CacheItem,
+    MemoryCache,
+    MemoryCacheConfig,
+    ShardedMemoryCache,
+)
 from rfs.core.result import Failure, Success
 
 
@@ -151,6 +158,27 @@ class TestCacheItem:
         assert item.access_count == initial_access_count + 1
         assert item.accessed_at > initial_accessed_at
 
+    def test_cache_item_explicit_now(self):
+        """호출자가 전달한 시각으로 만료/접근 처리"""
+        item = CacheItem("test_key", "test_value", ttl=10, now=100.0)
+
+        assert item.created_at == 100.0
+        assert item.expires_at == 110.0
+        assert not item.is_expired(105.0)
+        assert item.is_expired(110.5)
+
+        item.touch(105.0)
+        assert item.accessed_at == 105.0
+        assert item.access_count == 2
+
+    def test_cache_item_uses_slots(self):
+        """캐시 아이템은 인스턴스 __dict__ 없이 슬롯만 사용"""
+        item = CacheItem("test_key", "test_value")
+
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.unknown_attribute = 1
+
     def test_cache_item_size_estimation(self):
         """캐시 아이템 크기 추정 테스트"""
         small_item = CacheItem("key", "small")
@@ -158,6 +186,20 @@ class TestCacheItem:
 
         assert large_item.size > small_item.size
 
+    def test_cache_item_fast_size_estimation(self):
+        """기본 타입은 sys.getsizeof 없이 크기 추정"""
+        assert CacheItem("key", "abc").size == 52
+        assert CacheItem("key", b"abc").size == 36
+        assert CacheItem("key", 42).size == 28
+        assert CacheItem("key", None).size == 16
+        assert CacheItem("key", [1, 2, 3]).size > 0
+
+    def test_cache_item_explicit_size(self):
+        """크기를 지정하면 추정을 건너뜀"""
+        item = CacheItem("key", "x" * 10000, size=1)
+
+        assert item.size == 1
+
     def test_cache_item_comparison(self):
         """캐시 아이템 비교 테스트 (TTL 기반 정렬)"""
         item1 = CacheItem("key1", "value1", ttl=100)
@@ -428,6 +470,64 @@ class TestMemoryCache:
         assert memory_cache._stats["sets"] >= initial_stats["sets"]
         assert memory_cache._stats["deletes"] >= initial_stats["deletes"]
 
+    @pytest.mark.asyncio
+    async def test_memory_cache_stats_counters(self, memory_cache):
+        """통계 카운터와 스냅샷 일관성 테스트"""
+        memory_cache.reset_stats()
+
+        await memory_cache.set("counter_key", "value")
+        await memory_cache.get("counter_key")
+        await memory_cache.get("missing_key")
+        await memory_cache.delete("counter_key")
+
+        assert memory_cache._stats == {
+            "hits": 1,
+            "misses": 1,
+            "sets": 1,
+            "deletes": 1,
+            "errors": 0,
+        }
+        stats = memory_cache.get_stats()
+        assert stats["hit_rate"] == 0.5
+        assert stats["total_operations"] == 2
+
+        memory_cache.reset_stats()
+        assert memory_cache._hits == 0
+        assert memory_cache._stats["sets"] == 0
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_sync_api(self, memory_cache):
+        """동기 API는 Result 없이 원시 값을 반환"""
+        memory_cache.set_sync("sync_key", {"a": 1})
+
+        assert memory_cache.get_sync("sync_key") == {"a": 1}
+        assert memory_cache.get_sync("missing") is None
+        assert memory_cache.exists_sync("sync_key") is True
+        assert (await memory_cache.get("sync_key")).unwrap() == {"a": 1}
+
+        assert memory_cache.delete_sync("sync_key") is True
+        assert memory_cache.delete_sync("sync_key") is False
+        assert memory_cache.exists_sync("sync_key") is False
+        assert memory_cache._stats["deletes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_item_pool_reuse(self, memory_cache):
+        """제거된 항목이 풀을 통해 재사용되는지 테스트"""
+        await memory_cache.set("pooled_key", "old_value")
+        old_item = memory_cache._data[memory_cache._make_key("pooled_key")]
+        await memory_cache.delete("pooled_key")
+
+        assert old_item in memory_cache._item_pool
+        assert old_item.value is None
+
+        await memory_cache.set("other_key", "new_value")
+        new_item = memory_cache._data[memory_cache._make_key("other_key")]
+
+        assert new_item is old_item
+        assert new_item.key == memory_cache._make_key("other_key")
+        assert new_item.access_count == 1
+        assert (await memory_cache.get("other_key")).unwrap() == "new_value"
+
     @pytest.mark.asyncio
     async def test_memory_cache_concurrent_access(self, memory_cache):
         """동시 접근 테스트"""
@@ -486,6 +586,175 @@ class TestMemoryCacheAdvanced:
         finally:
             await cache.disconnect()
 
+    @pytest.mark.asyncio
+    async def test_memory_cache_ttl_eviction_uses_heap(self):
+        """TTL 정책은 힙 기준으로 가장 먼저 만료될 항목을 제거"""
+        config = MemoryCacheConfig(
+            max_size=2, eviction_policy="ttl", cleanup_interval=0
+        )
+        cache = MemoryCache(config)
+        await cache.connect()
+
+        try:
+            await cache.set("long", "value", ttl=600)
+            await cache.set("short", "value", ttl=100)
+            # 기존 힙 엔트리는 오래된 엔트리가 되어 건너뛰어야 함
+            await cache.expire("short", 1000)
+
+            await cache.set("new", "value", ttl=300)
+
+            assert (await cache.exists("long")).unwrap() is False
+            assert (await cache.exists("short")).unwrap() is True
+            assert (await cache.exists("new")).unwrap() is True
+        finally:
+            await cache.disconnect()
+
+    def test_memory_cache_deep_size_estimation(self):
+        """컨테이너는 깊은 크기로 추정하고 원소당 크기를 재사용"""
+        cache = MemoryCache(MemoryCacheConfig())
+        nested = [{"name": "x" * 100} for _ in range(10)]
+
+        size = cache._estimate_value_size(nested)
+        per_item = cache._size_cache[list]
+
+        assert size > sys.getsizeof(nested)
+        assert per_item == size // len(nested)
+        # 샘플링 주기 전까지는 원소당 크기로 외삽
+        assert cache._estimate_value_size(nested * 2) == per_item * 20
+
+    def test_memory_cache_size_of_variable_scalars(self):
+        """길이가 다른 비컨테이너 값은 값마다 크기를 추정"""
+        cache = MemoryCache(MemoryCacheConfig())
+
+        small = cache._estimate_value_size(bytearray(10))
+        large = cache._estimate_value_size(bytearray(10_000_000))
+        assert large - small == 10_000_000 - 10
+        assert cache._estimate_value_size(memoryview(bytes(1000))) >= 1000
+        assert cache._estimate_value_size(10**100) == sys.getsizeof(10**100)
+        assert cache._estimate_value_size("가" * 10) == sys.getsizeof("가" * 10)
+        assert cache._estimate_value_size(
+            SimpleNamespace(data="x" * 100_000)
+        ) > cache._estimate_value_size(SimpleNamespace(data="x"))
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_size_estimation_disabled(self):
+        """크기 추정 비활성화 시 고정 크기 사용"""
+        cache = MemoryCache(MemoryCacheConfig(estimate_size=False, cleanup_interval=0))
+        await cache.connect()
+
+        try:
+            await cache.set("key", "x" * 10000)
+            assert cache._current_memory == 1
+        finally:
+            await cache.disconnect()
+
+    @pytest.mark.parametrize(
+        "policy, selector",
+        [
+            ("lru", "_select_lru_victim"),
+            ("LFU", "_select_lfu_victim"),
+            ("fifo", "_select_fifo_victim"),
+            ("ttl", "_select_ttl_victim"),
+            ("random", "_select_any_victim"),
+        ],
+    )
+    def test_memory_cache_victim_selector_resolved_once(self, policy, selector):
+        """희생자 선택 함수가 생성 시점에 정책별로 결정되는지 테스트"""
+        cache = MemoryCache(MemoryCacheConfig(eviction_policy=policy))
+
+        assert cache._select_victim == getattr(cache, selector)
+        assert cache._select_victim() is None
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_set_without_ttl_skips_heap(self, memory_cache):
+        """TTL 없는 저장은 TTL 힙을 건드리지 않음"""
+        for i in range(10):
+            await memory_cache.set(f"plain_{i}", i)
+
+        assert memory_cache._ttl_heap == []
+        assert (await memory_cache.ttl("plain_0")).unwrap() == -1
+
+        await memory_cache.set("with_ttl", "value", ttl=120)
+        assert len(memory_cache._ttl_heap) == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_ttl_heap_compaction(self):
+        """반복 TTL 갱신으로 쌓인 오래된 힙 엔트리 정리"""
+        cache = MemoryCache(MemoryCacheConfig(cleanup_interval=0))
+        await cache.connect()
+
+        try:
+            await cache.set("a", "value", ttl=100)
+            await cache.set("b", "value", ttl=100)
+            for ttl in range(100, 120):
+                await cache.expire("a", ttl)
+
+            assert len(cache._ttl_heap) <= 4 * cache._current_size
+            live = {
+                (item.expires_at, key)
+                for key, item in cache._data.items()
+                if item.expires_at is not None
+            }
+            assert live <= set(cache._ttl_heap)
+        finally:
+            await cache.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_ttl_count_tracks_live_entries(self):
+        """TTL 항목 수 추적과 힙 크기 상한 테스트"""
+        cache = MemoryCache(MemoryCacheConfig(cleanup_interval=0))
+        await cache.connect()
+
+        try:
+            await cache.set("a", "value", ttl=100)
+            await cache.set("b", "value", ttl=100)
+            await cache.set("c", "value")
+            await cache.expire("c", 200)
+            await cache.persist("a")
+            await cache.set("b", "value", ttl=300)
+            await cache.delete("c")
+
+            live = [
+                (item.expires_at, key)
+                for key, item in cache._data.items()
+                if item.expires_at is not None
+            ]
+            assert cache._ttl_count == len(live) == 1
+
+            # 다음 힙 삽입 시 오래된 엔트리가 정리됨
+            await cache.set("d", "value", ttl=100)
+            assert cache._ttl_count == 2
+            assert len(cache._ttl_heap) <= 2 * cache._ttl_count
+            assert live[0] in cache._ttl_heap
+        finally:
+            await cache.disconnect()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy", ["lru", "fifo"])
+    async def test_memory_cache_batch_eviction_by_memory(self, policy):
+        """큰 값 저장 시 필요한 만큼의 항목을 한 번에 제거"""
+        config = MemoryCacheConfig(
+            max_size=100, memory_limit=500, eviction_policy=policy, cleanup_interval=0
+        )
+        cache = MemoryCache(config)
+        await cache.connect()
+
+        try:
+            for i in range(5):
+                await cache.set(f"small_{i}", "a" * 51)  # 항목당 100 바이트
+            assert cache._current_memory == 500
+
+            await cache.set("big", "b" * 251)  # 300 바이트
+
+            assert cache._current_size == 3
+            assert cache._current_memory == 500
+            for i in range(3):
+                assert (await cache.exists(f"small_{i}")).unwrap() is False
+            for i in range(3, 5):
+                assert (await cache.exists(f"small_{i}")).unwrap() is True
+        finally:
+            await cache.disconnect()
+
     @pytest.mark.asyncio
     async def test_memory_cache_memory_limit(self):
         """메모리 제한 테스트"""
@@ -535,6 +804,45 @@ class TestMemoryCacheAdvanced:
             await cache.disconnect()
 
 
+class TestShardedMemoryCache:
+    """샤딩 메모리 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sharded_cache_basic_operations(self):
+        """샤드로 분산된 기본 연산 및 통계 합산"""
+        config = MemoryCacheConfig(max_size=400, cleanup_interval=0)
+        cache = ShardedMemoryCache(config, shard_count=4)
+        await cache.connect()
+
+        try:
+            assert cache.is_connected
+            assert all(shard.config.max_size == 100 for shard in cache._shards)
+
+            for i in range(40):
+                assert (await cache.set(f"key_{i}", i)).is_success()
+            for i in range(40):
+                assert (await cache.get(f"key_{i}")).unwrap() == i
+
+            await cache.delete("key_0")
+            assert (await cache.exists("key_0")).unwrap() is False
+            assert (await cache.get("missing")).unwrap() is None
+
+            stats = cache.get_stats()
+            assert stats["sets"] == 40
+            assert stats["hits"] == 40
+            assert stats["misses"] == 1
+            assert stats["deletes"] == 1
+            assert stats["current_size"] == 39
+            assert stats["shard_count"] == 4
+            assert sum(shard._current_size > 0 for shard in cache._shards) > 1
+
+            await cache.clear()
+            assert cache.get_stats()["current_size"] == 0
+        finally:
+            await cache.disconnect()
+            assert not cache.is_connected
+
+
 class TestCacheBackendInterface:
     """캐시 백엔드 인터페이스 테스트"""
 
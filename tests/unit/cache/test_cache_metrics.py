@@ -0,0 +1,720 @@
+"""
+RFS Framework Cache 메트릭스 단위 테스트
+
+MetricsCollector의 작업 기록, 메트릭스 집계, 초기화 기능을 테스트합니다.
+"""
+
+import asyncio
+import gc
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from rfs.cache.memory_cache import MemoryCache, MemoryCacheConfig
+from rfs.cache.metrics import (
+    CAP_MEMORY,
+    CAP_REDIS,
+    CacheMetrics,
+    MetricsCollector,
+    set_metrics_enabled,
+    track_cache_operation,
+)
+
+
+@pytest.fixture
+def collector():
+    """싱글톤을 우회한 독립 수집기 fixture"""
+    instance = MetricsCollector.__new__(MetricsCollector)
+    instance.__init__()
+    return instance
+
+
+@pytest.fixture
+def memory_backend():
+    """메모리 캐시 백엔드 fixture"""
+    return MemoryCache(MemoryCacheConfig(cleanup_interval=0))
+
+
+class TestCacheMetrics:
+    """CacheMetrics 테스트"""
+
+    def test_cache_metrics_slots(self):
+        """__slots__ 사용으로 인스턴스 딕셔너리 없음"""
+        metrics = CacheMetrics()
+
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(AttributeError):
+            metrics.unknown = 1
+
+    def test_collection_fields_lazy(self):
+        """컬렉션 필드는 지연 할당되고 직렬화 시 빈 값으로 대체"""
+        metrics = CacheMetrics()
+
+        assert metrics.hourly_hits is None
+        assert metrics.hot_keys is None
+        result = metrics.to_dict()
+        assert result["hourly_stats"] == {"hits": [], "misses": []}
+        assert result["key_analysis"] == {"patterns": {}, "hot_keys": []}
+
+    def test_to_dict_rates(self):
+        """비율 필드 반올림"""
+        metrics = CacheMetrics(hits=2, misses=1, errors=1)
+        result = metrics.to_dict()
+
+        assert result["hit_rate"] == round(2 / 3, 4)
+        assert result["miss_rate"] == round(1 / 3, 4)
+        assert result["error_rate"] == round(1 / 3, 4)
+        assert CacheMetrics().to_dict()["miss_rate"] == 1.0
+
+    def test_to_dict_matches_properties(self):
+        """직렬화 결과가 프로퍼티 계산과 일치"""
+        metrics = CacheMetrics(hits=7, misses=3, sets=5, deletes=1, errors=2)
+        result = metrics.to_dict()
+
+        assert result["total_operations"] == metrics.total_operations
+        assert result["hit_rate"] == round(metrics.hit_rate, 4)
+        assert result["miss_rate"] == round(metrics.miss_rate, 4)
+        assert result["error_rate"] == round(metrics.error_rate, 4)
+
+    def test_to_dict_cached_until_mutation(self):
+        """변경 전까지 캐시된 딕셔너리 재사용"""
+        metrics = CacheMetrics(hits=1)
+        first = metrics.to_dict()
+
+        with patch.object(CacheMetrics, "_build_dict") as build:
+            assert metrics.to_dict() == first
+            build.assert_not_called()
+
+        metrics.hits += 1
+        second = metrics.to_dict()
+
+        assert second is not first
+        assert second["hits"] == 2
+
+    def test_to_dict_result_is_independent(self):
+        """반환된 딕셔너리를 수정해도 캐시에 영향 없음"""
+        metrics = CacheMetrics(hits=1, hot_keys=["a"])
+        first = metrics.to_dict()
+
+        first["extra"] = True
+        first["hourly_stats"]["hits"].append(1)
+        first["key_analysis"]["hot_keys"].append("b")
+
+        second = metrics.to_dict()
+        assert "extra" not in second
+        assert second["hourly_stats"]["hits"] == []
+        assert second["key_analysis"]["hot_keys"] == ["a"]
+
+
+class TestRecordOperation:
+    """작업 기록 테스트"""
+
+    def test_record_operation_running_aggregates(self, collector):
+        """작업별 누적 합계/최대/개수 유지"""
+        collector.record_operation("main", "get", "a", 0.2)
+        collector.record_operation("main", "get", "b", 0.4)
+        collector.record_operation("main", "set", "a", 0.1)
+
+        collector.flush()
+        assert collector.op_count[("main", "get")] == 2
+        assert collector.op_sum[("main", "get")] == 600_000_000
+        assert collector.op_max[("main", "get")] == 400_000_000
+        assert collector.op_count[("main", "set")] == 1
+
+    def test_record_operation_bounded_window(self, collector):
+        """윈도우를 벗어난 값은 집계에서 제외"""
+        collector.record_operation("main", "get", "key", 5.0)
+        for _ in range(1000):
+            collector.record_operation("main", "get", "key", 1.0)
+
+        collector.flush()
+        op_key = ("main", "get")
+        assert len(collector.op_durations[op_key]) == 1000
+        assert collector.op_count[op_key] == 1000
+        assert collector.op_sum[op_key] == 1000 * 1_000_000_000
+        assert collector.op_max[op_key] == 1_000_000_000
+
+    def test_record_operation_sliding_max(self, collector):
+        """윈도우 최대값은 밀려난 값을 제외하고 갱신"""
+        op_key = ("main", "get")
+        for value in (3, 1, 2):
+            collector.record_operation_ns("main", "get", "key", value)
+        for _ in range(998):
+            collector.record_operation_ns("main", "get", "key", 0)
+        collector.flush()
+
+        assert collector.op_max[op_key] == 2
+
+        collector.record_operation_ns("main", "get", "key", 0)
+        collector.record_operation_ns("main", "get", "key", 0)
+        collector.flush()
+
+        assert collector.op_max[op_key] == 0
+
+    def test_hot_keys_most_accessed_first(self, collector):
+        """접근 빈도 순 Hot keys 추출"""
+        for key, count in (("a", 1), ("b", 3), ("c", 2)):
+            for _ in range(count):
+                collector.record_operation("main", "get", key, 0.01)
+        collector.record_operation("other", "get", "z", 0.01)
+
+        collector.flush()
+        assert collector._get_hot_keys("main") == ["b", "c", "a"]
+        assert collector._get_hot_keys("main", limit=1) == ["b"]
+        assert collector._get_hot_keys("missing") == []
+
+    def test_hot_keys_preserve_colons(self, collector):
+        """콜론이 포함된 키도 그대로 반환"""
+        collector.record_operation("main", "get", "user:1:profile", 0.01)
+
+        collector.flush()
+        assert collector._get_hot_keys("main") == ["user:1:profile"]
+
+    def test_record_operation_interns_names(self, collector):
+        """캐시 이름과 작업 이름은 intern된 문자열로 집계"""
+        cache_name = "".join(["ma", "in"])
+        operation = "".join(["g", "et"])
+        collector.record_operation(cache_name, operation, "key", 0.1)
+        collector.flush()
+
+        stored_name, stored_operation = next(iter(collector.op_count))
+        assert stored_name is sys.intern("main")
+        assert stored_operation is sys.intern("get")
+
+    def test_record_operation_is_queued(self, collector):
+        """기록은 큐에 적재되고 백그라운드 스레드가 집계"""
+        assert collector._worker is None
+
+        collector.record_operation("main", "get", "key", 0.1)
+        collector.flush()
+
+        assert collector._worker.is_alive()
+
+        assert collector._queue.empty()
+        assert collector.op_count[("main", "get")] == 1
+
+    def test_flush_before_first_record(self, collector):
+        """기록 전 flush는 스레드를 시작하지 않음"""
+        collector.flush()
+
+        assert collector._worker is None
+
+    def test_flush_without_worker(self, collector):
+        """백그라운드 스레드가 없으면 호출 스레드에서 집계"""
+        collector._worker = Mock(is_alive=Mock(return_value=False))
+        collector._queue = queue.SimpleQueue()
+        collector.record_operation("main", "get", "key", 0.1)
+
+        collector.flush()
+
+        assert collector.op_count[("main", "get")] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_collection_does_not_block_loop(
+        self, collector, memory_backend
+    ):
+        """비동기 수집 경로의 flush 대기는 이벤트 루프 밖에서 수행"""
+        collector.record_operation("main", "get", "key", 0.1)
+        loop_thread = threading.current_thread()
+        flushed_on = []
+        blocking_flush = collector.flush
+
+        def flush(timeout=1.0):
+            flushed_on.append(threading.current_thread())
+            blocking_flush(timeout)
+
+        with patch.object(collector, "flush", flush):
+            await collector.collect_cache_metrics("main", memory_backend)
+
+        assert flushed_on and flushed_on[0] is not loop_thread
+        assert collector.op_count[("main", "get")] == 1
+
+    def test_reset_single_cache(self, collector):
+        """특정 캐시의 수집 데이터만 초기화"""
+        collector.record_operation("main", "get", "a", 0.1)
+        collector.record_operation("other", "get", "b", 0.1)
+
+        collector.reset("main")
+
+        assert ("main", "get") not in collector.op_count
+        assert "main" not in collector.key_access_count
+        assert collector.op_count[("other", "get")] == 1
+
+
+class TestCollectCacheMetrics:
+    """개별 캐시 메트릭스 수집 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_collect_cache_metrics_timings(self, collector, memory_backend):
+        """평균/최대 응답 시간 집계"""
+        collector.record_operation("main", "get", "a", 0.2)
+        collector.record_operation("main", "get", "b", 0.4)
+        collector.record_operation("main", "set", "a", 0.1)
+
+        metrics = await collector.collect_cache_metrics("main", memory_backend)
+
+        assert isinstance(metrics, CacheMetrics)
+        assert metrics.avg_get_time == pytest.approx(0.3)
+        assert metrics.max_get_time == 0.4
+        assert metrics.avg_set_time == pytest.approx(0.1)
+        assert metrics.max_set_time == 0.1
+
+    @pytest.mark.asyncio
+    async def test_collect_cache_metrics_memory_usage(self, collector, memory_backend):
+        """메모리 백엔드의 메모리 사용량 수집"""
+        memory_backend.set_sync("key", "value")
+
+        metrics = await collector.collect_cache_metrics("main", memory_backend)
+
+        assert metrics.memory_usage == memory_backend._current_memory
+        assert metrics.memory_limit == memory_backend.config.max_memory
+
+    def test_backend_capabilities_cached(self, collector):
+        """백엔드 기능은 한 번만 검사하고 소멸 시 제거"""
+        backend = MemoryCache(MemoryCacheConfig(cleanup_interval=0))
+        caps = collector._backend_capabilities(backend)
+
+        assert caps & CAP_MEMORY
+        assert not caps & CAP_REDIS
+        assert collector._backend_caps[id(backend)] == caps
+
+        backend_id = id(backend)
+        del backend
+        gc.collect()
+
+        assert backend_id not in collector._backend_caps
+
+    @pytest.mark.asyncio
+    async def test_collect_redis_connections(self, collector):
+        """Redis 백엔드의 연결 수 수집"""
+
+        class RedisBackend:
+            def __init__(self):
+                self.redis = Mock()
+                self.redis.info = AsyncMock(return_value={"connected_clients": 3})
+
+            def get_stats(self):
+                return {}
+
+        backend = RedisBackend()
+
+        metrics = await collector.collect_cache_metrics("redis", backend)
+
+        assert collector._backend_capabilities(backend) == CAP_REDIS
+        assert metrics.connections_active == 3
+
+
+class TestCollectAllMetrics:
+    """전체 캐시 메트릭스 수집 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_collect_all_metrics_records_history(self, collector):
+        """모든 캐시의 메트릭스를 히스토리에 기록"""
+        caches = {
+            "first": MemoryCache(MemoryCacheConfig(cleanup_interval=0)),
+            "second": MemoryCache(MemoryCacheConfig(cleanup_interval=0)),
+        }
+        manager = Mock(caches=caches)
+
+        with patch("rfs.cache.metrics.get_cache_manager", return_value=manager):
+            await collector.collect_all_metrics()
+
+        assert len(collector.metrics_history["first"]["minute"]) == 1
+        assert len(collector.metrics_history["second"]["minute"]) == 1
+        entry = collector.metrics_history["first"]["minute"].entries[0]
+        assert entry["timestamp"] == datetime.fromtimestamp(entry["epoch"]).strftime(
+            "%Y-%m-%d %H:%M"
+        )
+        assert collector.get_metrics_history("first", 1) == [entry]
+
+    @pytest.mark.asyncio
+    async def test_collect_all_metrics_isolates_failures(self, collector):
+        """한 캐시의 수집 실패가 다른 캐시에 영향 없음"""
+        broken = Mock()
+        broken.get_stats.side_effect = RuntimeError("boom")
+        caches = {
+            "broken": broken,
+            "healthy": MemoryCache(MemoryCacheConfig(cleanup_interval=0)),
+        }
+        manager = Mock(caches=caches)
+
+        with patch("rfs.cache.metrics.get_cache_manager", return_value=manager):
+            await collector.collect_all_metrics()
+
+        assert "broken" not in collector.metrics_history
+        assert len(collector.metrics_history["healthy"]["minute"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_collect_all_metrics_shares_redis_info_per_pool(self, collector):
+        """같은 커넥션 풀을 쓰는 캐시는 Redis INFO를 한 번만 조회"""
+
+        class RedisBackend:
+            def __init__(self, redis):
+                self.redis = redis
+
+            def get_stats(self):
+                return {}
+
+        shared = Mock(connection_pool=object())
+        shared.info = AsyncMock(return_value={"connected_clients": 5})
+        other = Mock(connection_pool=object())
+        other.info = AsyncMock(return_value={"connected_clients": 2})
+        caches = {
+            "a": RedisBackend(shared),
+            "b": RedisBackend(shared),
+            "c": RedisBackend(other),
+        }
+        manager = Mock(caches=caches)
+
+        with patch("rfs.cache.metrics.get_cache_manager", return_value=manager):
+            await collector.collect_all_metrics()
+
+        assert shared.info.await_count == 1
+        assert other.info.await_count == 1
+        history = collector.metrics_history
+        assert history["a"]["minute"].entries[0]["metrics"]["connections_active"] == 5
+        assert history["b"]["minute"].entries[0]["metrics"]["connections_active"] == 5
+        assert history["c"]["minute"].entries[0]["metrics"]["connections_active"] == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_cache_metrics_uses_given_time(
+        self, collector, memory_backend
+    ):
+        """전달된 시각 기준으로 시간대별 통계 기록"""
+        memory_backend.set_sync("key", "value")
+        memory_backend.get_sync("key")
+        current_time = datetime(2024, 1, 1, 7, 30)
+
+        metrics = await collector.collect_cache_metrics(
+            "main", memory_backend, current_time=current_time
+        )
+
+        assert len(metrics.hourly_hits) == 24
+        assert metrics.hourly_hits[7] == 1
+        assert sum(metrics.hourly_hits) == 1
+
+    @pytest.mark.asyncio
+    async def test_hourly_stats_record_deltas(self, collector, memory_backend):
+        """시간대별 통계는 누적값이 아닌 증가분을 기록"""
+        memory_backend.set_sync("key", "value")
+        memory_backend.get_sync("key")
+        await collector.collect_cache_metrics(
+            "main", memory_backend, current_time=datetime(2024, 1, 1, 7, 0)
+        )
+        memory_backend.get_sync("key")
+        memory_backend.get_sync("missing")
+
+        metrics = await collector.collect_cache_metrics(
+            "main", memory_backend, current_time=datetime(2024, 1, 1, 8, 0)
+        )
+
+        assert metrics.hourly_hits[7] == 1
+        assert metrics.hourly_hits[8] == 1
+        assert metrics.hourly_misses[8] == 1
+
+    @pytest.mark.asyncio
+    async def test_hourly_stats_clear_stale_slots(self, collector, memory_backend):
+        """하루가 지나 다시 돌아온 시간대 슬롯은 비운 뒤 기록"""
+        memory_backend.set_sync("key", "value")
+        memory_backend.get_sync("key")
+        await collector.collect_cache_metrics(
+            "main", memory_backend, current_time=datetime(2024, 1, 1, 7, 0)
+        )
+
+        metrics = await collector.collect_cache_metrics(
+            "main", memory_backend, current_time=datetime(2024, 1, 2, 7, 0)
+        )
+
+        assert sum(metrics.hourly_hits) == 0
+
+    def test_get_metrics_history_filters_by_epoch(self, collector):
+        """보관 기간을 벗어난 히스토리 제외"""
+        now = int(time.time()) // 60 * 60
+        old = {"timestamp": "old", "epoch": now - 7200, "metrics": {}}
+        recent = {"timestamp": "recent", "epoch": now, "metrics": {}}
+        collector._append_history("main", old["epoch"], old)
+        collector._append_history("main", recent["epoch"], recent)
+
+        assert collector.get_metrics_history("main", 1) == [recent]
+        assert collector.get_metrics_history("missing") == []
+
+    def test_samples_within_a_minute_are_merged(self, collector):
+        """1분보다 짧은 수집 간격에서도 minute 단계는 분당 한 항목"""
+        hour_start = int(time.time()) // 3600 * 3600 - 2 * 3600
+        # 10초 간격으로 한 시간 동안 수집
+        for offset in range(0, 3600, 10):
+            epoch = hour_start + offset
+            collector._append_history(
+                "main",
+                epoch,
+                {"timestamp": str(epoch), "epoch": epoch, "metrics": {"hits": offset}},
+            )
+        next_hour = hour_start + 3600
+        collector._append_history(
+            "main",
+            next_hour,
+            {"timestamp": "next", "epoch": next_hour, "metrics": {"hits": 0}},
+        )
+
+        tiers = collector.metrics_history["main"]
+        # 61번째 분 항목이 들어오며 가장 오래된 분은 밀려남
+        assert len(tiers["minute"]) == 60
+        assert tiers["minute"].epochs[0] == hour_start + 60
+        assert tiers["minute"].entries[0]["metrics"]["hits"] == 85
+        # 시간 롤업은 한 시간 전체 샘플의 평균
+        (rollup,) = tiers["hour"].entries
+        assert rollup["epoch"] == hour_start
+        assert rollup["metrics"]["hits"] == 1795
+
+    def test_history_rolls_up_completed_hours(self, collector):
+        """완료된 시간 구간은 hour 단계로 평균 롤업"""
+        hour_start = int(time.time()) // 3600 * 3600 - 3 * 3600
+        for minute in range(3):
+            epoch = hour_start + minute * 60
+            collector._append_history(
+                "main",
+                epoch,
+                {"timestamp": str(epoch), "epoch": epoch, "metrics": {"hits": minute}},
+            )
+        latest = hour_start + 3600
+        collector._append_history(
+            "main",
+            latest,
+            {"timestamp": "latest", "epoch": latest, "metrics": {"hits": 10}},
+        )
+
+        tiers = collector.metrics_history["main"]
+        assert len(tiers["minute"]) == 4
+        assert len(tiers["hour"]) == 1
+        rollup = tiers["hour"].entries[0]
+        assert rollup["epoch"] == hour_start
+        assert rollup["metrics"]["hits"] == 1
+
+        history = collector.get_metrics_history("main", 4)
+        assert [entry["epoch"] for entry in history] == [hour_start, latest]
+
+    def test_history_tiers_bounded(self, collector):
+        """단계별 보관 개수 제한"""
+        start = int(time.time()) // 3600 * 3600 - 10 * 3600
+        for minute in range(600):
+            epoch = start + minute * 60
+            collector._append_history(
+                "main", epoch, {"timestamp": "", "epoch": epoch, "metrics": {}}
+            )
+
+        tiers = collector.metrics_history["main"]
+        assert len(tiers["minute"]) == 60
+        assert len(tiers["hour"]) == 9
+
+
+class TestGenerateReport:
+    """메트릭스 보고서 생성 테스트"""
+
+    def _manager(self, **caches):
+        manager = Mock(caches=caches)
+        manager.get_cache.side_effect = caches.get
+        return manager
+
+    def test_generate_report_single_cache(self, collector, memory_backend):
+        """단일 캐시 보고서 생성"""
+        memory_backend.set_sync("key", "value")
+        memory_backend.get_sync("key")
+        manager = self._manager(main=memory_backend)
+
+        with patch("rfs.cache.metrics.get_cache_manager", return_value=manager):
+            report = collector.generate_report("main")
+
+        assert report["cache_name"] == "main"
+        assert report["metrics"]["hits"] == 1
+
+    def test_generate_report_missing_cache(self, collector):
+        """존재하지 않는 캐시 보고서 요청"""
+        with patch("rfs.cache.metrics.get_cache_manager", return_value=self._manager()):
+            report = collector.generate_report("missing")
+
+        assert "error" in report
+
+    def test_generate_report_summary(self, collector):
+        """전체 캐시 요약 집계"""
+        first = MemoryCache(MemoryCacheConfig(cleanup_interval=0))
+        second = MemoryCache(MemoryCacheConfig(cleanup_interval=0))
+        first.set_sync("a", 1)
+        second.set_sync("b", 2)
+        second.get_sync("b")
+        manager = self._manager(first=first, second=second)
+
+        with patch("rfs.cache.metrics.get_cache_manager", return_value=manager):
+            report = collector.generate_report()
+
+        assert set(report["caches"]) == {"first", "second"}
+        summary = report["summary"]["summary"]
+        assert summary["sets"] == 2
+        assert summary["hits"] == 1
+        assert summary["total_operations"] == 3
+        assert summary["hit_rate"] == 1.0
+        assert summary["error_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_generate_report_inside_running_loop(self, collector, memory_backend):
+        """실행 중인 이벤트 루프 안에서도 보고서 생성"""
+        manager = self._manager(main=memory_backend)
+
+        with patch("rfs.cache.metrics.get_cache_manager", return_value=manager):
+            report = collector.generate_report("main")
+            async_report = await collector.generate_report_async("main")
+
+        assert "error" not in report
+        assert async_report["metrics"] == report["metrics"]
+
+
+class TestTrackCacheOperation:
+    """캐시 작업 추적 데코레이터 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_track_async_operation(self, collector):
+        """비동기 작업의 소요 시간을 나노초 정수로 기록"""
+
+        class Store:
+            @track_cache_operation("tracked")
+            async def get(self, key):
+                return key
+
+        with patch("rfs.cache.metrics.get_metrics_collector", return_value=collector):
+            assert await Store().get("key") == "key"
+
+        collector.flush()
+        op_key = ("tracked", "get")
+        assert collector.op_count[op_key] == 1
+        assert isinstance(collector.op_sum[op_key], int)
+        assert collector.key_access_count["tracked"]["key"] == 1
+
+    def test_track_sync_operation(self, collector):
+        """동기 함수는 동기 래퍼로 추적"""
+
+        class Store:
+            @track_cache_operation("tracked")
+            def get_sync(self, key):
+                return key
+
+        with patch("rfs.cache.metrics.get_metrics_collector", return_value=collector):
+            assert Store().get_sync("key") == "key"
+
+        collector.flush()
+        assert collector.op_count[("tracked", "get_sync")] == 1
+
+    def test_track_disabled(self, collector):
+        """비활성화 시 기록하지 않음"""
+
+        class Store:
+            @track_cache_operation("tracked")
+            def get_sync(self, key):
+                return key
+
+        set_metrics_enabled(False)
+        try:
+            with patch(
+                "rfs.cache.metrics.get_metrics_collector", return_value=collector
+            ):
+                assert Store().get_sync("key") == "key"
+        finally:
+            set_metrics_enabled(True)
+
+        collector.flush()
+        assert collector.op_count[("tracked", "get_sync")] == 0
+
+
+class TestCollectionLoop:
+    """메트릭스 수집 루프 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_start_collection_warns_once_on_default_loop(self, collector):
+        """기본 이벤트 루프에서는 경고를 한 번만 기록"""
+        with patch("rfs.cache.metrics._LOOP_WARNING_EMITTED", False):
+            with patch("rfs.cache.metrics.logger") as mock_logger:
+                collector.start_collection(interval=3600)
+                collector.stop_collection()
+                await asyncio.sleep(0)
+                collector.start_collection(interval=3600)
+                collector.stop_collection()
+                await asyncio.sleep(0)
+
+        assert mock_logger.warning.call_count == 1
+
+
+class TestAlerts:
+    """알림 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_check_alerts_triggers_rules(self, collector):
+        """임계값을 넘은 규칙만 알림 발생"""
+        alerts = []
+        collector.add_alert_callback(alerts.append)
+        metrics = CacheMetrics(hits=1, misses=9, avg_get_time=0.1)
+
+        await collector._check_alerts("main", metrics)
+
+        assert [alert["type"] for alert in alerts] == ["low_hit_rate"]
+        assert alerts[0]["cache"] == "main"
+        assert alerts[0]["message"] == "캐시 히트율이 낮습니다: 10.00%"
+
+    @pytest.mark.asyncio
+    async def test_set_alert_threshold_recompiles(self, collector):
+        """임계값 변경이 알림 검사에 반영"""
+        alerts = []
+        collector.add_alert_callback(alerts.append)
+        collector.set_alert_threshold("response_time_max", 0.05)
+
+        await collector._check_alerts("main", CacheMetrics(hits=1, avg_set_time=0.1))
+
+        assert [alert["type"] for alert in alerts] == ["high_response_time"]
+        assert alerts[0]["threshold"] == 0.05
+
+    @pytest.mark.asyncio
+    async def test_collection_loop_keeps_fixed_interval(self, collector):
+        """수집 소요 시간과 무관하게 일정한 주기로 수집"""
+        loop = asyncio.get_running_loop()
+        started = []
+
+        async def slow_collect():
+            started.append(loop.time())
+            await asyncio.sleep(0.03)
+
+        collector._collection_interval = 0.05
+        with patch.object(collector, "collect_all_metrics", side_effect=slow_collect):
+            task = asyncio.create_task(collector._collection_loop())
+            await asyncio.sleep(0.23)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert len(started) >= 3
+        gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+        assert all(gap == pytest.approx(0.05, abs=0.02) for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_collection_loop_skips_missed_ticks(self, collector):
+        """주기보다 오래 걸린 수집 뒤에는 밀린 주기를 건너뜀"""
+        loop = asyncio.get_running_loop()
+        started = []
+
+        async def very_slow_collect():
+            started.append(loop.time())
+            await asyncio.sleep(0.12 if len(started) == 1 else 0)
+
+        collector._collection_interval = 0.05
+        with patch.object(
+            collector, "collect_all_metrics", side_effect=very_slow_collect
+        ):
+            begin = loop.time()
+            task = asyncio.create_task(collector._collection_loop())
+            await asyncio.sleep(0.4)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        # 0.05에 시작한 수집이 0.17에 끝나면 0.10 주기는 건너뛰고 0.20에 재개
+        assert len(started) >= 2
+        assert started[1] - begin >= 0.19
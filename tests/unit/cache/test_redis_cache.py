@@ -0,0 +1,685 @@
+"""
+Unit tests for RedisCache
+
+aioredis 없이 모의 클라이언트로 Redis 캐시 동작 검증
+"""
+
+import asyncio
+import pickle
+import sys
+import types
+import zlib
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from rfs.cache.base import SerializationType, _resolve_codec
+from rfs.cache.redis_cache import (
+    _DISCONNECTED,
+    _SET_MANY_SCRIPT_THRESHOLD,
+    RedisCache,
+    RedisCacheConfig,
+    RedisClusterCache,
+    RedisClusterConfig,
+    _compressed_codec,
+)
+
+
+@pytest.fixture
+def make_cache():
+    """연결된 것으로 간주되는 RedisCache 팩토리"""
+
+    def _make(cache_cls=RedisCache, config_cls=RedisCacheConfig, **config_kwargs):
+        with patch("rfs.cache.redis_cache.REDIS_AVAILABLE", True):
+            cache = cache_cls(config_cls(**config_kwargs))
+        cache.redis = AsyncMock()
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock()
+        cache.redis.pipeline = Mock(return_value=pipe)
+        cache._connected = True
+        return cache
+
+    return _make
+
+
+class TestResolveCodec:
+    """직렬화 코덱 선택 테스트"""
+
+    def test_json_is_text(self):
+        encode, decode, is_binary = _resolve_codec(SerializationType.JSON)
+
+        assert is_binary is False
+        assert decode(encode({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_json_scalar_fast_path(self):
+        encode, decode, _ = _resolve_codec(SerializationType.JSON)
+
+        assert encode(42) == b"42"
+        assert encode(True) == b"true"
+        assert decode(b"42") == 42
+        assert decode("42") == 42
+        assert decode(b"-1") == -1
+
+    def test_pickle_is_binary(self):
+        encode, decode, is_binary = _resolve_codec(SerializationType.PICKLE)
+
+        assert is_binary is True
+        assert encode is pickle.dumps
+
+    def test_msgpack_prefers_msgspec(self):
+        encoder = Mock()
+        decoder = Mock()
+        msgspec = types.ModuleType("msgspec")
+        msgspec.msgpack = types.SimpleNamespace(
+            Encoder=Mock(return_value=encoder), Decoder=Mock(return_value=decoder)
+        )
+
+        with patch.dict(sys.modules, {"msgspec": msgspec}):
+            encode, decode, is_binary = _resolve_codec(SerializationType.MSGPACK)
+
+        assert is_binary is True
+        assert encode is encoder.encode
+        assert decode is decoder.decode
+
+    def test_msgpack_falls_back_to_json(self):
+        with patch.dict(sys.modules, {"msgspec": None, "msgpack": None}):
+            encode, decode, is_binary = _resolve_codec(SerializationType.MSGPACK)
+
+        assert is_binary is False
+        assert decode(encode({"a": 1})) == {"a": 1}
+
+
+class TestRedisSerialization:
+    """Redis 직렬화 경로 테스트"""
+
+    def test_binary_serialization_disables_decode_responses(self, make_cache):
+        cache = make_cache(serialization=SerializationType.PICKLE)
+
+        assert cache._decode_responses is False
+
+    def test_json_keeps_decode_responses(self, make_cache):
+        cache = make_cache()
+
+        assert cache._decode_responses is True
+
+    def test_string_serialization_disables_decode_responses(self, make_cache):
+        cache = make_cache(serialization=SerializationType.STRING)
+
+        assert cache._decode_responses is False
+
+    @pytest.mark.asyncio
+    async def test_get_decoded_json_value(self, make_cache):
+        cache = make_cache()
+        cache.redis.get.return_value = '{"a": 1}'
+
+        result = await cache.get("key")
+
+        assert result.unwrap() == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_binary_value(self, make_cache):
+        cache = make_cache(serialization=SerializationType.PICKLE)
+        cache.redis.get.return_value = pickle.dumps({"a": 1})
+
+        result = await cache.get("key")
+
+        assert result.unwrap() == {"a": 1}
+        assert cache._hits == 1
+
+
+class TestRedisSetMany:
+    """배치 저장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_set_many_uses_mset_and_expire(self, make_cache):
+        cache = make_cache(namespace="ns")
+
+        result = await cache.set_many({"a": 1, "b": 2}, ttl=60)
+
+        assert result.is_success()
+        cache.redis.pipeline.assert_called_once_with(transaction=False)
+        pipe = cache.redis.pipeline.return_value
+        pipe.mset.assert_called_once_with({"ns:a": b"1", "ns:b": b"2"})
+        assert pipe.expire.call_count == 2
+        pipe.execute.assert_awaited_once()
+        assert cache._sets == 2
+
+    @pytest.mark.asyncio
+    async def test_set_many_large_batch_uses_script(self, make_cache):
+        cache = make_cache()
+        cache.redis.script_load.return_value = "sha"
+        data = {f"k{i}": i for i in range(_SET_MANY_SCRIPT_THRESHOLD + 1)}
+
+        result = await cache.set_many(data, ttl=60)
+
+        assert result.is_success()
+        calls = cache.redis.evalsha.await_args_list
+        assert len(calls) == 3
+        assert calls[0].args[:3] == ("sha", 500, "rfs:k0")
+        assert calls[0].args[-1] == 60
+        cache.redis.pipeline.assert_not_called()
+
+        await cache.set_many(data, ttl=60)
+        cache.redis.script_load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_many_reloads_flushed_script(self, make_cache):
+        cache = make_cache()
+        cache.redis.script_load.return_value = "sha"
+        cache.redis.evalsha.side_effect = [Exception("NOSCRIPT"), 1, 1, 1]
+        data = {f"k{i}": i for i in range(_SET_MANY_SCRIPT_THRESHOLD + 1)}
+
+        result = await cache.set_many(data, ttl=60)
+
+        assert result.is_success()
+        assert cache.redis.script_load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cluster_set_many_uses_setex(self, make_cache):
+        cache = make_cache(RedisClusterCache, RedisClusterConfig)
+
+        await cache.set_many({"a": 1, "b": 2}, ttl=60)
+
+        pipe = cache.redis.pipeline.return_value
+        pipe.mset.assert_not_called()
+        assert pipe.setex.call_count == 2
+
+
+class TestRedisBatching:
+    """배치 분할 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_many_chunks_mget(self, make_cache):
+        cache = make_cache(namespace="", pipeline_batch_size=2)
+        cache.redis.mget.side_effect = [[b"1", None], [b"3"]]
+
+        result = await cache.get_many(["a", "b", "c"])
+
+        assert [call.args[0] for call in cache.redis.mget.await_args_list] == [
+            ["a", "b"],
+            ["c"],
+        ]
+        assert result.unwrap() == {"a": {"a": 1}, "c": {"c": 3}}
+        assert cache._hits == 2
+        assert cache._misses == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_many_chunks_unlink(self, make_cache):
+        cache = make_cache(namespace="", pipeline_batch_size=2)
+
+        await cache.delete_many(["a", "b", "c"])
+
+        cache.redis.delete.assert_not_called()
+        assert [call.args for call in cache.redis.unlink.await_args_list] == [
+            ("a", "b"),
+            ("c",),
+        ]
+        assert cache._deletes == 3
+
+    @pytest.mark.asyncio
+    async def test_set_many_flushes_each_chunk(self, make_cache):
+        cache = make_cache(namespace="", pipeline_batch_size=2)
+
+        await cache.set_many({"a": 1, "b": 2, "c": 3}, ttl=60)
+
+        pipe = cache.redis.pipeline.return_value
+        assert pipe.mset.call_count == 2
+        assert pipe.execute.await_count == 2
+
+
+class TestRedisClear:
+    """네임스페이스 삭제 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_clear_scans_and_unlinks_in_batches(self, make_cache):
+        cache = make_cache(namespace="ns", pipeline_batch_size=2)
+
+        async def scan_iter(match, count):
+            for key in ("ns:a", "ns:b", "ns:c"):
+                yield key
+
+        cache.redis.scan_iter = scan_iter
+
+        result = await cache.clear()
+
+        assert result.is_success()
+        assert [call.args for call in cache.redis.unlink.await_args_list] == [
+            ("ns:a", "ns:b"),
+            ("ns:c",),
+        ]
+        cache.redis.keys.assert_not_called()
+
+
+class TestRedisConnect:
+    """연결 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_connect_prewarms_blocking_pool(self):
+        aioredis = Mock()
+        client = aioredis.Redis.return_value
+        client.ping = AsyncMock()
+
+        with (
+            patch("rfs.cache.redis_cache.REDIS_AVAILABLE", True),
+            patch("rfs.cache.redis_cache.aioredis", aioredis),
+        ):
+            cache = RedisCache(RedisCacheConfig(pool_min_size=4))
+            result = await cache.connect()
+
+        assert result.is_success()
+        aioredis.BlockingConnectionPool.assert_called_once()
+        assert client.ping.await_count == 4
+        assert cache._connected is True
+
+    @pytest.mark.asyncio
+    async def test_connect_times_out_on_slow_ping(self):
+        aioredis = Mock()
+
+        async def slow_ping():
+            await asyncio.sleep(10)
+
+        aioredis.Redis.return_value.ping = slow_ping
+
+        with (
+            patch("rfs.cache.redis_cache.REDIS_AVAILABLE", True),
+            patch("rfs.cache.redis_cache.aioredis", aioredis),
+        ):
+            cache = RedisCache(RedisCacheConfig(connection_timeout=0.01))
+            result = await cache.connect()
+
+        assert result.is_failure()
+        assert cache._connected is False
+        assert not cache.redis
+
+    @pytest.mark.asyncio
+    async def test_connect_warns_once_without_hiredis(self):
+        aioredis = Mock()
+        aioredis.connection.HIREDIS_AVAILABLE = False
+        aioredis.Redis.return_value.ping = AsyncMock()
+
+        with (
+            patch("rfs.cache.redis_cache.REDIS_AVAILABLE", True),
+            patch("rfs.cache.redis_cache.aioredis", aioredis),
+            patch("rfs.cache.redis_cache._PARSER_WARNING_EMITTED", False),
+            patch("rfs.cache.redis_cache.logger") as logger,
+        ):
+            await RedisCache(RedisCacheConfig()).connect()
+            await RedisCache(RedisCacheConfig()).connect()
+
+        logger.warning.assert_called_once()
+        assert "hiredis" in logger.warning.call_args.args[0]
+
+
+class TestRedisOperationGuard:
+    """공통 연결 확인/예외 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_disconnected_returns_failure(self):
+        with patch("rfs.cache.redis_cache.REDIS_AVAILABLE", True):
+            cache = RedisCache(RedisCacheConfig())
+
+        result = await cache.get("key")
+
+        assert result.unwrap_error() == "Redis 연결이 없습니다"
+        assert cache._errors == 0
+        assert not cache.redis
+
+    @pytest.mark.asyncio
+    async def test_disconnect_restores_placeholder(self, make_cache):
+        cache = make_cache()
+
+        await cache.disconnect()
+
+        assert (await cache.set("key", 1)).unwrap_error() == "Redis 연결이 없습니다"
+
+    @pytest.mark.asyncio
+    async def test_exception_becomes_failure(self, make_cache):
+        cache = make_cache()
+        cache.redis.incrby.side_effect = RuntimeError("boom")
+
+        result = await cache.increment("key")
+
+        assert result.unwrap_error() == "Redis INCREMENT 실패: boom"
+        assert cache._errors == 1
+
+
+class TestRedisWriteBehind:
+    """지연 전송 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_delete_and_expire_are_batched(self, make_cache):
+        cache = make_cache(namespace="", write_behind=True)
+
+        assert (await cache.delete("a")).is_success()
+        assert (await cache.expire("b", 120)).is_success()
+        cache.redis.unlink.assert_not_called()
+        cache.redis.expire.assert_not_called()
+
+        await asyncio.sleep(0.05)
+
+        pipe = cache.redis.pipeline.return_value
+        pipe.unlink.assert_called_once_with("a")
+        pipe.expire.assert_called_once_with("b", 120)
+        pipe.execute.assert_awaited_once()
+        assert cache._write_behind_task is None
+
+    @pytest.mark.asyncio
+    async def test_disconnect_flushes_pending(self, make_cache):
+        cache = make_cache(namespace="", write_behind=True, write_behind_flush_ms=60000)
+
+        pipe = cache.redis.pipeline.return_value
+        await cache.delete("a")
+        await cache.disconnect()
+
+        pipe.unlink.assert_called_once_with("a")
+        assert cache._write_behind_pending == []
+
+    @pytest.mark.asyncio
+    async def test_disconnected_cache_does_not_buffer(self):
+        with patch("rfs.cache.redis_cache.REDIS_AVAILABLE", True):
+            cache = RedisCache(RedisCacheConfig(write_behind=True))
+
+        assert (await cache.delete("a")).unwrap_error() == "Redis 연결이 없습니다"
+        assert (await cache.expire("a", 60)).unwrap_error() == "Redis 연결이 없습니다"
+        assert cache._write_behind_pending == []
+        assert cache._deletes == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_without_connection_counts_dropped(self, make_cache):
+        cache = make_cache(namespace="", write_behind=True, write_behind_flush_ms=60000)
+        await cache.delete("a")
+        await cache.expire("b", 60)
+        cache._write_behind_task.cancel()
+        cache.redis = _DISCONNECTED
+
+        await cache._flush_write_behind()
+
+        assert cache._write_behind_pending == []
+        assert cache._errors == 2
+
+
+class TestRedisUnlink:
+    """비동기 삭제 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_delete_uses_unlink(self, make_cache):
+        cache = make_cache(namespace="")
+
+        await cache.delete("a")
+
+        cache.redis.unlink.assert_awaited_once_with("a")
+        cache.redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_clear_without_namespace_flushes_asynchronously(self, make_cache):
+        cache = make_cache(namespace="")
+
+        await cache.clear()
+
+        cache.redis.flushdb.assert_awaited_once_with(asynchronous=True)
+
+
+class TestRedisGetAndTouch:
+    """조회 시 TTL 갱신 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_and_touch_uses_getex(self, make_cache):
+        cache = make_cache(namespace="")
+        cache.redis.getex.return_value = b"1"
+
+        result = await cache.get_and_touch("a", ttl=120)
+
+        assert result.unwrap() == 1
+        cache.redis.getex.assert_awaited_once_with("a", ex=120)
+        assert cache._hits == 1
+
+    @pytest.mark.asyncio
+    async def test_get_and_touch_falls_back_to_script(self, make_cache):
+        cache = make_cache(namespace="")
+        cache.redis.getex.side_effect = Exception("ERR unknown command 'GETEX'")
+        cache.redis.script_load.return_value = "sha"
+        cache.redis.evalsha.return_value = None
+
+        assert (await cache.get_and_touch("a", ttl=120)).unwrap() is None
+        assert (await cache.get_and_touch("a", ttl=120)).unwrap() is None
+
+        cache.redis.getex.assert_awaited_once()
+        cache.redis.script_load.assert_awaited_once()
+        cache.redis.evalsha.assert_awaited_with("sha", 1, "a", 120)
+        assert cache._misses == 2
+
+
+class TestRedisClusterConnect:
+    """클러스터 연결 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_connect_assigns_cluster_as_redis(self):
+        aioredis = Mock()
+        cluster = aioredis.RedisCluster.return_value
+        cluster.ping = AsyncMock()
+        cluster.close = AsyncMock()
+
+        with (
+            patch("rfs.cache.redis_cache.REDIS_AVAILABLE", True),
+            patch("rfs.cache.redis_cache.aioredis", aioredis),
+        ):
+            cache = RedisClusterCache(
+                RedisClusterConfig(startup_nodes=[{"host": "h", "port": 7000}])
+            )
+            assert (await cache.connect()).is_success()
+            assert cache.redis is cluster
+            assert cache.cluster is cluster
+
+            await cache.disconnect()
+
+        assert not cache.redis
+        assert not cache.cluster
+
+    @pytest.mark.asyncio
+    async def test_disconnect_flushes_write_behind(self, make_cache):
+        cache = make_cache(
+            RedisClusterCache,
+            RedisClusterConfig,
+            namespace="",
+            write_behind=True,
+            write_behind_flush_ms=60000,
+        )
+        cluster = cache.redis
+        cache.cluster = cluster
+
+        await cache.delete("a")
+        await cache.disconnect()
+
+        pipe = cluster.pipeline.return_value
+        pipe.unlink.assert_called_once_with("a")
+        pipe.execute.assert_awaited_once()
+        cluster.close.assert_awaited_once()
+        assert cache._write_behind_pending == []
+        assert cache._write_behind_task is None
+
+
+class TestRedisClientTracking:
+    """클라이언트 캐싱 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_served_from_local_cache(self, make_cache):
+        cache = make_cache(namespace="")
+        cache._local_cache = {}
+        cache.redis.get.return_value = b"1"
+
+        assert (await cache.get("a")).unwrap() == 1
+        assert (await cache.get("a")).unwrap() == 1
+
+        cache.redis.get.assert_awaited_once()
+        assert cache._hits == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_get_is_not_cached(self, make_cache):
+        cache = make_cache(namespace="")
+        cache._local_cache = {}
+
+        async def get_then_invalidate(key):
+            # GET 응답 대기 중 다른 클라이언트의 쓰기로 무효화 도착
+            cache._invalidate_local([b"message", b"__redis__:invalidate", [b"a"]])
+            return b"1"
+
+        cache.redis.get.side_effect = get_then_invalidate
+
+        assert (await cache.get("a")).unwrap() == 1
+        assert cache._local_cache == {}
+        assert cache._local_pending == {}
+
+        cache.redis.get.side_effect = None
+        cache.redis.get.return_value = b"2"
+
+        assert (await cache.get("a")).unwrap() == 2
+        assert cache._local_cache == {"a": 2}
+
+    @pytest.mark.asyncio
+    async def test_local_cache_is_bounded(self, make_cache):
+        cache = make_cache(namespace="", local_cache_size=1)
+        cache._local_cache = {}
+        cache.redis.get.return_value = b"1"
+
+        await cache.get("a")
+        await cache.get("b")
+
+        assert list(cache._local_cache) == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_writes_drop_local_entries(self, make_cache):
+        cache = make_cache(namespace="")
+        cache._local_cache = {"a": 1, "b": 2}
+
+        await cache.set("a", 3)
+        await cache.delete("b")
+
+        assert cache._local_cache == {}
+
+    def test_invalidation_message(self, make_cache):
+        cache = make_cache(namespace="")
+        cache._local_cache = {"a": 1, "b": 2, "c": 3}
+
+        cache._invalidate_local([b"message", b"__redis__:invalidate", [b"a"]])
+        assert cache._local_cache == {"b": 2, "c": 3}
+
+        cache._invalidate_local([b"message", b"__redis__:invalidate", None])
+        assert cache._local_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_enable_client_tracking(self, make_cache):
+        cache = make_cache(namespace="ns")
+        connection = Mock()
+        connection.send_command = AsyncMock()
+        connection.disconnect = AsyncMock()
+        responses = [7, [b"subscribe", b"__redis__:invalidate", 1]]
+        received = asyncio.Event()
+
+        async def read_response():
+            if responses:
+                return responses.pop(0)
+            received.set()
+            await asyncio.Event().wait()
+
+        connection.read_response = read_response
+        owner = Mock(is_connected=True)
+        owner.send_command = AsyncMock()
+        owner.read_response = AsyncMock(return_value=b"OK")
+        owner.disconnect = AsyncMock()
+        cache.pool = Mock()
+        cache.pool.get_connection = AsyncMock(side_effect=[connection, owner])
+        cache.pool.release = AsyncMock()
+
+        await cache._enable_client_tracking()
+        await received.wait()
+
+        # 추적은 풀의 임의 연결이 아닌 보유 중인 전용 연결에서 켠다
+        owner.send_command.assert_awaited_once_with(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", 7, "BCAST", "PREFIX", "ns:"
+        )
+        cache.redis.execute_command.assert_not_awaited()
+        cache.pool.release.assert_not_awaited()
+        assert cache._local_cache == {}
+
+        await cache._disable_client_tracking()
+        connection.disconnect.assert_awaited_once()
+        owner.disconnect.assert_awaited_once()
+        assert cache.pool.release.await_count == 2
+        assert cache._local_cache is None
+
+    @pytest.mark.asyncio
+    async def test_lost_tracking_connection_stops_local_cache(self, make_cache):
+        cache = make_cache(namespace="")
+        cache._local_cache = {"a": 1}
+        cache._tracking_owner = Mock(is_connected=False)
+        cache.redis.get.return_value = b"2"
+
+        assert (await cache.get("a")).unwrap() == 2
+        assert cache._local_cache is None
+
+    @pytest.mark.asyncio
+    async def test_enable_client_tracking_falls_back(self, make_cache):
+        cache = make_cache()
+        cache.pool = Mock()
+        cache.pool.get_connection = AsyncMock(side_effect=Exception("unsupported"))
+
+        await cache._enable_client_tracking()
+
+        assert cache._local_cache is None
+        assert cache._tracking_task is None
+
+
+class TestRedisCompression:
+    """값 압축 테스트"""
+
+    @pytest.fixture
+    def fake_zstandard(self):
+        zstandard = types.ModuleType("zstandard")
+        zstandard.ZstdCompressor = Mock(
+            return_value=types.SimpleNamespace(compress=zlib.compress)
+        )
+        zstandard.ZstdDecompressor = Mock(
+            return_value=types.SimpleNamespace(decompress=zlib.decompress)
+        )
+        with patch.dict(sys.modules, {"zstandard": zstandard}):
+            yield zstandard
+
+    def test_large_values_are_compressed(self, make_cache, fake_zstandard):
+        cache = make_cache(compression="zstd", compress_threshold=64)
+        value = {"text": "x" * 1000}
+
+        data = cache._serialize(value)
+
+        assert data[:2] == b"\xc1\x01"
+        assert len(data) < 100
+        assert cache._deserialize(data) == value
+        assert cache._decode_responses is False
+
+    def test_small_values_are_marked_raw(self, make_cache, fake_zstandard):
+        cache = make_cache(compression="zstd", compress_threshold=64)
+
+        data = cache._serialize({"a": 1})
+
+        assert data == b'\xc1\x00{"a": 1}'
+        assert cache._deserialize(data) == {"a": 1}
+        assert cache._deserialize(b'{"a": 1}') == {"a": 1}
+
+    @pytest.mark.parametrize(
+        "legacy, expected", [(b"\x00", 0), (b"\x04", 4), (b"\x1f", 31)]
+    )
+    def test_legacy_msgpack_values_round_trip(self, fake_zstandard, legacy, expected):
+        """압축 설정 이전에 저장된 msgpack fixint 값은 표식으로 오인하지 않음"""
+        # msgpack positive fixint: 1바이트 값 자체가 정수
+        encode, decode = _compressed_codec(
+            lambda value: bytes([value]), lambda data: data[0], "zstd", 64
+        )
+
+        assert decode(legacy) == expected
+        assert decode(encode(expected)) == expected
+
+    def test_missing_package_disables_compression(self, make_cache):
+        with patch.dict(sys.modules, {"zstandard": None}):
+            cache = make_cache(compression="zstd")
+
+        assert cache._serialize({"a": 1}) == b'{"a": 1}'
@@ -6,6 +6,7 @@ Annotation Base Module Tests
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -13,7 +14,10 @@ from rfs.core.annotations.base import (
     AnnotationMetadata,
     AnnotationType,
     ComponentMetadata,
+    InjectionType,
     ServiceScope,
+    _annotated_parameters,
+    extract_dependencies,
     get_annotation_metadata,
     has_annotation,
     set_annotation_metadata,
@@ -430,5 +434,95 @@ class TestEdgeCases:
         # 구현에 따라 다를 수 있음
 
 
+class TestExtractDependencies:
+    """의존성 추출 테스트"""
+
+    def test_constructor_dependencies(self):
+        class Service:
+            def __init__(self, repo: dict, untyped, *, limit: int = 10):
+                pass
+
+        deps = extract_dependencies(Service)
+
+        assert [(d.name, d.type, d.required) for d in deps] == [
+            ("repo", dict, True),
+            ("limit", int, False),
+        ]
+        assert all(d.injection_type is InjectionType.CONSTRUCTOR for d in deps)
+
+    def test_wrapped_init_uses_signature(self):
+        import functools
+
+        def passthrough(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        class Service:
+            @passthrough
+            def __init__(self, repo: dict = None):
+                pass
+
+        (dep,) = extract_dependencies(Service)
+
+        assert (dep.name, dep.type, dep.required) == ("repo", dict, False)
+
+    def test_signature_override_is_honoured(self):
+        import inspect
+
+        class Service:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            __init__.__signature__ = inspect.Signature(
+                [
+                    inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD),
+                    inspect.Parameter(
+                        "repo", inspect.Parameter.KEYWORD_ONLY, annotation=dict
+                    ),
+                ]
+            )
+
+        (dep,) = extract_dependencies(Service)
+
+        assert (dep.name, dep.type, dep.required) == ("repo", dict, True)
+
+    def test_result_is_cached_per_class(self):
+        class Service:
+            def __init__(self, repo: dict):
+                pass
+
+        with patch(
+            "rfs.core.annotations.base._annotated_parameters",
+            wraps=_annotated_parameters,
+        ) as parse:
+            first = extract_dependencies(Service)
+            second = extract_dependencies(Service)
+
+        parse.assert_called_once()
+        assert first == second
+
+    def test_cached_result_is_not_shared(self):
+        class Service:
+            def __init__(self, repo: dict):
+                pass
+
+        first = extract_dependencies(Service)
+        first[0].default_value = "changed"
+        first.append(first[0])
+
+        second = extract_dependencies(Service)
+        assert len(second) == 1
+        assert second[0].default_value is None
+
+    def test_class_without_init(self):
+        class Plain:
+            pass
+
+        assert extract_dependencies(Plain) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
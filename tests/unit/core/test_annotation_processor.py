@@ -0,0 +1,536 @@
+"""
+Annotation Processor Tests
+어노테이션 프로세서 테스트
+"""
+
+import importlib
+import re
+import sys
+import uuid
+from types import ModuleType, SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rfs.core.annotation_processor import (
+    AnnotationProcessor,
+    ProcessingContext,
+    ProcessingResult,
+    auto_register,
+    flush_pending_registrations,
+)
+from rfs.core.annotation_registry import (
+    _PENDING_REGISTRATIONS,
+    AnnotationRegistry,
+    RegistrationResult,
+)
+from rfs.core.annotations import AnnotationType
+from rfs.core.annotations.base import get_component_metadata
+
+SERVICES_SOURCE = """
+from rfs.core.annotations import Component
+
+
+@Component(name="scanned_service")
+class ScannedService:
+    pass
+
+
+class PlainHelper:
+    pass
+"""
+
+
+@pytest.fixture
+def scan_package(tmp_path, monkeypatch):
+    """임시 디렉터리에 스캔 대상 패키지 생성"""
+    name = f"scanpkg_{uuid.uuid4().hex[:8]}"
+    root = tmp_path / name
+    (root / "tests").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "services.py").write_text(SERVICES_SOURCE)
+    (root / "plain.py").write_text("VALUE = 1\n")
+    (root / "tests" / "__init__.py").write_text("")
+    (root / "tests" / "test_services.py").write_text("VALUE = 2\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for module_name in [m for m in sys.modules if m.split(".")[0] == name]:
+        del sys.modules[module_name]
+
+
+@pytest.fixture
+def processor():
+    return AnnotationProcessor(AnnotationRegistry())
+
+
+@pytest.fixture
+def context():
+    return ProcessingContext(
+        exclude_patterns=["tests"], auto_register=False, validate_architecture=False
+    )
+
+
+class TestProcessingContext:
+    """처리 컨텍스트 테스트"""
+
+    def test_sequences_are_normalized_to_tuples(self):
+        context = ProcessingContext(base_packages=["app"], exclude_patterns=["tests"])
+
+        assert context.base_packages == ("app",)
+        assert context.exclude_patterns == ("tests",)
+
+    def test_none_becomes_empty_tuple(self):
+        context = ProcessingContext(exclude_patterns=None)
+
+        assert context.exclude_patterns == ()
+
+
+class TestScanPackage:
+    """패키지 스캔 테스트"""
+
+    def test_scan_discovers_annotated_classes(self, processor, context, scan_package):
+        result = processor.scan_package(scan_package, context)
+
+        assert result.validation_errors == []
+        assert result.total_scanned == 1
+        assert "ScannedService" in processor.get_discovered_classes()
+
+    def test_walk_is_cached_per_package_and_excludes(
+        self, processor, context, scan_package
+    ):
+        def package_walks(walk):
+            # 하위 패키지는 재귀 호출로 순회되므로 최상위 호출만 센다
+            prefix = f"{scan_package}."
+            return sum(1 for c in walk.call_args_list if c.args[1] == prefix)
+
+        with patch.object(
+            processor,
+            "_iter_package_modules",
+            wraps=processor._iter_package_modules,
+        ) as walk:
+            processor.scan_package(scan_package, context)
+            processor.scan_package(scan_package, context)
+            assert package_walks(walk) == 1
+
+            processor.scan_package(scan_package, ProcessingContext(auto_register=False))
+            assert package_walks(walk) == 2
+
+            processor.clear_cache()
+            processor.scan_package(scan_package, context)
+            assert package_walks(walk) == 3
+
+    def test_excluded_modules_are_not_imported(self, processor, context, scan_package):
+        processor.scan_package(scan_package, context)
+
+        assert f"{scan_package}.services" in sys.modules
+        assert f"{scan_package}.tests.test_services" not in sys.modules
+
+    def test_exclude_patterns_are_literal_substrings(self, processor, scan_package):
+        context = ProcessingContext(
+            exclude_patterns=["serv.ces", "plain"],
+            auto_register=False,
+            validate_architecture=False,
+        )
+
+        result = processor.scan_package(scan_package, context)
+
+        assert result.total_scanned == 1
+        assert f"{scan_package}.plain" not in sys.modules
+
+    def test_import_failures_become_warnings(
+        self, processor, context, scan_package, tmp_path
+    ):
+        (tmp_path / scan_package / "broken.py").write_text("raise ValueError('boom')\n")
+
+        with patch(
+            "rfs.core.annotation_processor.importlib.import_module",
+            wraps=importlib.import_module,
+        ) as import_module:
+            result = processor.scan_package(scan_package, context)
+
+        broken = f"{scan_package}.broken"
+        assert result.warnings == [f"Failed to import module {broken}: boom"]
+        assert result.total_scanned == 1
+        # 스레드 풀에서 실패한 모듈은 호출 스레드에서 한 번 더 import한다
+        assert [c.args[0] for c in import_module.call_args_list].count(broken) == 2
+
+    def test_main_thread_only_modules_are_imported_serially(
+        self, processor, context, scan_package, tmp_path
+    ):
+        (tmp_path / scan_package / "handlers.py").write_text(
+            "import signal\n"
+            "from rfs.core.annotations import Component\n"
+            "signal.signal(signal.SIGUSR1, signal.getsignal(signal.SIGUSR1))\n"
+            "\n"
+            "@Component(name='signal_handler')\n"
+            "class SignalHandler:\n"
+            "    pass\n"
+        )
+
+        result = processor.scan_package(scan_package, context)
+
+        assert result.warnings == []
+        assert result.total_scanned == 2
+
+    def test_failed_imports_are_not_retried(
+        self, processor, context, scan_package, tmp_path
+    ):
+        (tmp_path / scan_package / "broken.py").write_text(
+            "import rfs_missing_dependency_for_tests\n"
+        )
+        broken = f"{scan_package}.broken"
+
+        with patch(
+            "rfs.core.annotation_processor.importlib.import_module",
+            wraps=importlib.import_module,
+        ) as import_module:
+            first = processor.scan_package(scan_package, context)
+            second = processor.scan_package(scan_package, context)
+            modules_result = processor.scan_modules([broken], context)
+
+        assert first.warnings == second.warnings
+        assert len(modules_result.warnings) == 1
+        assert "rfs_missing_dependency_for_tests" in modules_result.warnings[0]
+        # 풀 + 호출 스레드에서 한 번씩, 이후에는 캐시된 ImportError를 사용
+        assert [c.args[0] for c in import_module.call_args_list].count(broken) == 2
+
+        processor.clear_cache()
+        assert processor._import_failures == {}
+
+    def test_non_import_errors_are_not_cached(
+        self, processor, context, scan_package, tmp_path
+    ):
+        (tmp_path / scan_package / "broken.py").write_text("raise ValueError('boom')\n")
+
+        processor.scan_package(scan_package, context)
+
+        assert processor._import_failures == {}
+
+
+class TestScanModules:
+    """모듈 스캔 테스트"""
+
+    def test_scan_modules_by_name(self, processor, context, scan_package):
+        result = processor.scan_modules([f"{scan_package}.services"], context)
+
+        assert result.warnings == []
+        assert result.total_scanned == 1
+
+    def test_loaded_modules_skip_import_machinery(
+        self, processor, context, scan_package
+    ):
+        modname = f"{scan_package}.services"
+        importlib.import_module(modname)
+
+        with patch(
+            "rfs.core.annotation_processor.importlib.import_module"
+        ) as import_module:
+            result = processor.scan_modules([modname], context)
+
+        import_module.assert_not_called()
+        assert result.total_scanned == 1
+
+    def test_discovered_classes_are_merged_once(self, processor, context, scan_package):
+        modnames = [f"{scan_package}.services", f"{scan_package}.plain"]
+
+        with patch.object(
+            processor, "_merge_discovered", wraps=processor._merge_discovered
+        ) as merge:
+            result = processor.scan_modules(modnames, context)
+
+        merge.assert_called_once()
+        assert result.total_scanned == 1
+        assert list(processor.get_discovered_classes()) == ["ScannedService"]
+
+
+class TestDiscoverClasses:
+    """모듈 내 어노테이션 클래스 발견 테스트"""
+
+    def test_discovers_only_annotated_classes_defined_in_module(
+        self, processor, scan_package
+    ):
+        module = importlib.import_module(f"{scan_package}.services")
+
+        discovered = processor._discover_classes_in_module(module)
+
+        assert discovered == {"ScannedService": module.ScannedService}
+
+    def test_annotated_modules_are_marked(self, scan_package):
+        services = importlib.import_module(f"{scan_package}.services")
+        plain = importlib.import_module(f"{scan_package}.plain")
+
+        assert services.__rfs_has_annotations__ is True
+        assert not hasattr(plain, "__rfs_has_annotations__")
+
+    def test_unmarked_modules_are_skipped_unless_marker_is_optional(self, scan_package):
+        services = importlib.import_module(f"{scan_package}.services")
+        foreign = ModuleType("foreign")
+        foreign.ScannedService = services.ScannedService
+        services.ScannedService.__module__ = "foreign"
+        try:
+            strict = AnnotationProcessor(AnnotationRegistry())
+            lenient = AnnotationProcessor(AnnotationRegistry(), strict_marker=False)
+
+            assert strict._discover_classes_in_module(foreign) == {}
+            assert lenient._discover_classes_in_module(foreign) == {
+                "ScannedService": services.ScannedService
+            }
+        finally:
+            services.ScannedService.__module__ = services.__name__
+
+    def test_process_classes_stores_classes(self, processor, scan_package):
+        module = importlib.import_module(f"{scan_package}.services")
+        context = ProcessingContext(auto_register=False, validate_architecture=False)
+
+        processor.process_classes([module.ScannedService, module.PlainHelper], context)
+
+        assert processor.get_discovered_classes() == {
+            "ScannedService": module.ScannedService
+        }
+
+
+class TestMetadataCache:
+    """컴포넌트 메타데이터 캐시 테스트"""
+
+    def test_metadata_is_looked_up_once_per_class(self, processor, scan_package):
+        module = importlib.import_module(f"{scan_package}.services")
+        cls = module.ScannedService
+
+        with patch(
+            "rfs.core.annotation_processor.get_component_metadata",
+            wraps=get_component_metadata,
+        ) as lookup:
+            first = processor._get_meta(cls)
+            second = processor._get_meta(cls)
+            assert processor._get_meta(module.PlainHelper) is None
+            assert processor._get_meta(module.PlainHelper) is None
+
+        assert first is second is get_component_metadata(cls)
+        assert lookup.call_count == 2
+
+    def test_clear_cache_drops_metadata(self, processor, scan_package):
+        module = importlib.import_module(f"{scan_package}.services")
+        processor._get_meta(module.ScannedService)
+
+        processor.clear_cache()
+
+        assert processor._meta_cache == {}
+
+
+def _fake_meta(name, deps=(), kind="component", profile=None):
+    return SimpleNamespace(
+        component_id=name,
+        dependencies=[SimpleNamespace(name=dep) for dep in deps],
+        metadata={"type": kind},
+        profile=profile,
+    )
+
+
+class TestRegistrationOrder:
+    """의존성 기반 등록 순서 테스트"""
+
+    def _prepare(self, processor, specs):
+        classes = {}
+        for name, deps, kind in specs:
+            cls = type(name, (), {})
+            classes[name] = cls
+            processor._meta_cache[cls] = _fake_meta(name, deps, kind)
+        processor._discovered_classes = dict(classes)
+        return classes
+
+    def test_dependencies_come_first(self, processor):
+        classes = self._prepare(
+            processor,
+            [
+                ("service", ["adapter"], "component"),
+                ("adapter", ["port"], "adapter"),
+                ("port", ["ignored"], "port"),
+            ],
+        )
+
+        order = processor._resolve_registration_order()
+
+        assert order == [classes["port"], classes["adapter"], classes["service"]]
+
+    def test_cycles_are_appended_in_discovery_order(self, processor):
+        classes = self._prepare(
+            processor,
+            [
+                ("a", ["b"], "component"),
+                ("b", ["a"], "component"),
+                ("root", [], "component"),
+            ],
+        )
+
+        order = processor._resolve_registration_order()
+
+        assert order == [classes["root"], classes["a"], classes["b"]]
+
+    def test_unknown_dependencies_keep_component_unresolved(self, processor):
+        classes = self._prepare(
+            processor,
+            [
+                ("needs_external", ["external"], "component"),
+                ("leaf", [], "component"),
+                ("uses_leaf", ["leaf"], "component"),
+            ],
+        )
+
+        order = processor._resolve_registration_order()
+
+        assert order == [
+            classes["leaf"],
+            classes["uses_leaf"],
+            classes["needs_external"],
+        ]
+
+    def test_registration_follows_order_and_profile(self, processor):
+        classes = self._prepare(
+            processor,
+            [("service", ["port"], "component"), ("port", [], "port")],
+        )
+        dev_only = type("dev_only", (), {})
+        processor._meta_cache[dev_only] = _fake_meta("dev_only", profile="dev")
+        processor._discovered_classes["dev_only"] = dev_only
+        processor.registry = MagicMock()
+
+        processor._register_discovered_classes(ProcessingContext())
+
+        registered = [c.args[0] for c in processor.registry.register_class.mock_calls]
+        assert registered == [classes["port"], classes["service"]]
+
+    def test_snapshot_is_rebuilt_after_merge(self, processor):
+        self._prepare(processor, [("a", [], "component")])
+        first = processor._resolved_metas()
+        assert processor._resolved_metas() is first
+
+        extra = type("b", (), {})
+        processor._meta_cache[extra] = _fake_meta("b")
+        processor._merge_discovered({"b": extra})
+
+        assert [meta.name for meta in processor._resolved_metas()] == ["a", "b"]
+
+
+class TestDeferredAutoRegister:
+    """auto_register 지연 등록 테스트"""
+
+    @pytest.fixture
+    def registry(self):
+        _PENDING_REGISTRATIONS.clear()
+        registry = MagicMock()
+        registry.register_class.return_value = SimpleNamespace(success=True)
+        yield registry
+        _PENDING_REGISTRATIONS.clear()
+
+    def test_decorator_defers_registration(self, registry):
+        @auto_register(registry)
+        class Deferred:
+            pass
+
+        registry.register_class.assert_not_called()
+
+        results = flush_pending_registrations()
+
+        registry.register_class.assert_called_once_with(Deferred)
+        assert len(results) == 1
+        assert flush_pending_registrations() == []
+
+    def test_scan_flushes_pending_registrations(self, registry, processor, context):
+        @auto_register(registry)
+        class Deferred:
+            pass
+
+        processor.process_classes([], context)
+
+        registry.register_class.assert_called_once_with(Deferred)
+
+
+class TestValidationCache:
+    """아키텍처 검증 캐시 테스트"""
+
+    def test_validation_reused_until_classes_change(self, processor, scan_package):
+        module = importlib.import_module(f"{scan_package}.services")
+        context = ProcessingContext(auto_register=False)
+        other = type("Other", (), {})
+
+        with (
+            patch(
+                "rfs.core.annotation_processor.validate_hexagonal_architecture",
+                return_value=[],
+            ) as validate,
+            patch("rfs.core.annotation_processor.has_annotation", return_value=True),
+        ):
+            processor.process_classes([module.ScannedService], context)
+            processor.process_classes([module.ScannedService], context)
+            assert validate.call_count == 1
+
+            processor.process_classes([other], context)
+            assert validate.call_count == 2
+
+            processor.clear_cache()
+            processor.process_classes([other], context)
+            assert validate.call_count == 3
+
+
+class TestRegistrationResults:
+    """등록 결과 집계 테스트"""
+
+    def test_results_are_partitioned(self, processor):
+        results = [
+            RegistrationResult(True, "ok", AnnotationType.COMPONENT, warnings=["slow"]),
+            RegistrationResult(
+                False,
+                "bad",
+                AnnotationType.COMPONENT,
+                errors=["missing dep"],
+                warnings=["check"],
+            ),
+        ]
+        processing_result = ProcessingResult()
+
+        processor._process_registration_results(results, processing_result)
+
+        assert processing_result.total_registered == 1
+        assert processing_result.successful_registrations == ["ok"]
+        assert processing_result.failed_registrations == ["bad"]
+        assert processing_result.validation_errors == ["missing dep"]
+        assert processing_result.warnings == ["slow", "check"]
+
+
+class TestIterPackageModules:
+    """scandir 기반 패키지 순회 테스트"""
+
+    def test_yields_modules_and_subpackages(self, processor, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "__init__.py").write_text("")
+        (tmp_path / "sub" / "leaf.py").write_text("")
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "loose.py").write_text("")
+        (tmp_path / "__init__.py").write_text("")
+        (tmp_path / "alpha.py").write_text("")
+        (tmp_path / "not-a-module.py").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+
+        names = list(processor._iter_package_modules(str(tmp_path), "pkg."))
+
+        assert names == ["pkg.alpha", "pkg.sub", "pkg.sub.leaf"]
+
+    def test_excluded_subpackages_are_pruned(self, processor, tmp_path):
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "__init__.py").write_text("")
+        (tmp_path / "tests" / "test_leaf.py").write_text("")
+        (tmp_path / "alpha.py").write_text("")
+        excluded = re.compile("tests").search
+
+        with patch.object(
+            processor,
+            "_iter_package_modules",
+            wraps=processor._iter_package_modules,
+        ) as walk:
+            names = list(walk(str(tmp_path), "pkg.", excluded))
+
+        assert names == ["pkg.alpha"]
+        assert [c.args[1] for c in walk.call_args_list] == ["pkg."]
+
+    def test_missing_directory_yields_nothing(self, processor, tmp_path):
+        assert list(processor._iter_package_modules(str(tmp_path / "nope"), "")) == []
@@ -0,0 +1,391 @@
+"""
+Annotation Registry Tests
+어노테이션 레지스트리 테스트
+"""
+
+import io
+import json
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from rfs.core.annotation_processor import auto_register
+from rfs.core.annotation_registry import (
+    _PENDING_REGISTRATIONS,
+    AnnotationRegistry,
+    RegistryManager,
+    get_annotation_registry,
+)
+from rfs.core.annotations.base import (
+    AnnotationMetadata,
+    AnnotationType,
+    ComponentMetadata,
+    DependencyMetadata,
+    set_annotation_metadata,
+    set_component_metadata,
+)
+from rfs.core.registry import ServiceRegistry
+
+
+@pytest.fixture
+def registry():
+    return AnnotationRegistry()
+
+
+def _make_component(name, dependencies=(), **metadata_kwargs):
+    """어노테이션/컴포넌트 메타데이터를 가진 클래스 생성"""
+    cls = type(name, (), {})
+    set_annotation_metadata(
+        cls, AnnotationMetadata("Component", {"name": name}, cls, "class")
+    )
+    metadata = ComponentMetadata(
+        component_id=name, component_type=cls, **metadata_kwargs
+    )
+    for dep in dependencies:
+        metadata.dependencies.append(DependencyMetadata(name=dep, type=object))
+    set_component_metadata(cls, metadata)
+    return cls
+
+
+class TestCircularDependencyDetection:
+    """순환 의존성 검출 테스트"""
+
+    def test_acyclic_graph_has_no_cycles(self, registry):
+        edges = {"a": ["b", "c"], "b": ["c"], "c": [], "d": ["a", "unknown"]}
+
+        assert registry._detect_circular_dependencies(edges) == []
+
+    def test_cycle_is_reported_once_from_smallest_node(self, registry):
+        edges = {"c": ["a"], "a": ["b"], "b": ["c"], "d": ["b"]}
+
+        cycles = registry._detect_circular_dependencies(edges)
+
+        assert cycles == [["a", "b", "c", "a"]]
+
+    def test_self_dependency(self, registry):
+        assert registry._detect_circular_dependencies({"a": ["a"]}) == [["a", "a"]]
+
+    def test_separate_cycles_are_all_found(self, registry):
+        edges = {"a": ["b"], "b": ["a"], "x": ["y"], "y": ["z"], "z": ["x"]}
+
+        cycles = registry._detect_circular_dependencies(edges)
+
+        assert cycles == [["a", "b", "a"], ["x", "y", "z", "x"]]
+
+    def test_deep_chain_does_not_hit_recursion_limit(self, registry):
+        depth = 5000
+        edges = {f"n{i}": [f"n{i + 1}"] for i in range(depth)}
+        edges[f"n{depth}"] = ["n0"]
+
+        cycles = registry._detect_circular_dependencies(edges)
+
+        assert len(cycles) == 1
+        assert len(cycles[0]) == depth + 2
+
+
+class TestRegistrationValidation:
+    """등록 유효성 검증 테스트"""
+
+    def test_unknown_dependencies_are_reported_in_order(self, registry):
+        registry._ports = {"repo": object}
+        registry.register("cache", object, lazy=True)
+        registry.register(
+            "svc", object, dependencies=["ghost", "cache", "repo", "phantom"], lazy=True
+        )
+
+        assert registry._validate_dependencies() == [
+            "Service 'svc' has unknown dependency 'ghost'",
+            "Service 'svc' has unknown dependency 'phantom'",
+        ]
+
+    def test_adapters_must_reference_registered_ports(self, registry):
+        registry._ports = {"repo": object}
+        registry._annotation_metadata = {
+            "adapter:a": SimpleNamespace(
+                metadata={"type": "adapter", "port_name": "repo"}
+            ),
+            "adapter:b": SimpleNamespace(
+                metadata={"type": "adapter", "port_name": "missing"}
+            ),
+            "svc": SimpleNamespace(metadata={"type": "component"}),
+        }
+
+        assert registry._validate_port_adapter_matching() == [
+            "Adapter 'adapter:b' references unknown port 'missing'"
+        ]
+
+
+class TestDependencyGraph:
+    """의존성 그래프 테스트"""
+
+    def test_graph_uses_dependency_names(self, registry):
+        registry.register_class(_make_component("svc", ["repo", "external"]))
+        registry.register_class(_make_component("repo"))
+
+        graph = registry.build_dependency_graph()
+
+        assert graph.edges == {"svc": ["repo", "external"], "repo": []}
+        assert graph.reverse_edges == {"svc": [], "repo": ["svc"]}
+        assert graph.circular_dependencies == []
+
+    def test_graph_is_cached_until_next_registration(self, registry):
+        registry.register_class(_make_component("a", ["b"]))
+        first = registry.build_dependency_graph()
+
+        with patch.object(
+            registry,
+            "_detect_circular_dependencies",
+            wraps=registry._detect_circular_dependencies,
+        ) as detect:
+            assert registry.build_dependency_graph() == first
+            detect.assert_not_called()
+
+            registry.register_class(_make_component("b", ["a"]))
+            second = registry.build_dependency_graph()
+            detect.assert_called_once()
+
+        assert second.circular_dependencies == [["a", "b", "a"]]
+
+    def test_callers_cannot_mutate_cached_graph(self, registry):
+        registry.register_class(_make_component("repo"))
+        registry.register_class(_make_component("svc", ["repo"]))
+        graph = registry.build_dependency_graph()
+
+        graph.nodes.pop("repo")
+        graph.edges["svc"].append("extra")
+        graph.reverse_edges["repo"].clear()
+
+        fresh = registry.build_dependency_graph()
+        assert fresh is not graph
+        assert set(fresh.nodes) == {"repo", "svc"}
+        assert fresh.edges["svc"] == ["repo"]
+        assert fresh.reverse_edges["repo"] == ["svc"]
+
+    def test_reregistration_replaces_edges(self, registry):
+        registry.register_class(_make_component("repo"))
+        registry.register_class(_make_component("svc", ["repo"]))
+        registry.register_class(_make_component("svc"))
+
+        graph = registry.build_dependency_graph()
+
+        assert graph.edges["svc"] == []
+        assert graph.reverse_edges["repo"] == []
+
+    def test_names_are_interned(self, registry):
+        component_id = "".join(["interned", "_svc"])
+        dependency = "".join(["interned", "_repo"])
+        registry.register_class(_make_component(component_id, [dependency]))
+
+        ((name, deps),) = registry.build_dependency_graph().edges.items()
+
+        assert name is sys.intern("interned_svc")
+        assert deps[0] is sys.intern("interned_repo")
+
+
+class TestAutoRegisterModule:
+    """모듈 자동 등록 테스트"""
+
+    def test_registers_only_classes_defined_in_module(self, registry):
+        module = ModuleType("fake_services")
+        local = _make_component("local")
+        local.__module__ = module.__name__
+        foreign = _make_component("foreign")
+        module.Local = local
+        module.Foreign = foreign
+        module.Plain = type("Plain", (), {"__module__": module.__name__})
+        module.value = 42
+
+        results = registry.auto_register_module(module)
+
+        assert [result.service_name for result in results] == ["local"]
+
+
+class TestRegistrationStats:
+    """등록 통계 테스트"""
+
+    def test_counters_are_exported_as_plain_dicts(self, registry):
+        registry.register_class(_make_component("a"))
+        registry.register_class(_make_component("b"))
+
+        stats = registry.get_registration_stats()
+
+        assert stats["total_registered"] == 2
+        assert stats["by_type"] == {"component": 2}
+        assert stats["by_scope"] == {"singleton": 2}
+        assert type(stats["by_type"]) is dict
+        assert stats["registration_order"] == ["a", "b"]
+
+    def test_exported_order_is_a_snapshot(self, registry):
+        registry.register_class(_make_component("a"))
+        stats = registry.get_registration_stats()
+
+        registry.register_class(_make_component("b"))
+
+        assert stats["registration_order"] == ["a"]
+        assert registry.get_registration_stats()["registration_order"] == ["a", "b"]
+
+
+class TestGetByPort:
+    """Port 기반 어댑터 조회 테스트"""
+
+    def _adapter(self, name, port, profile=None):
+        return _make_component(
+            name, profile=profile, metadata={"type": "adapter", "port_name": port}
+        )
+
+    def test_profile_lookup_uses_index(self):
+        registry = AnnotationRegistry(current_profile="dev")
+        generic = self._adapter("generic", "repo")
+        dev = self._adapter("dev_repo", "repo", profile="dev")
+        registry.register_class(generic)
+        registry.register_class(dev)
+
+        # 인스턴스 생성 대신 선택된 어댑터 이름을 돌려받는다
+        with patch.object(ServiceRegistry, "get", lambda self, name: name):
+            assert registry.get_by_port("repo") == "generic"
+            assert registry.get_by_port("repo", profile="dev") == "dev_repo"
+            with pytest.raises(ValueError, match="profile 'prod'"):
+                registry.get_by_port("repo", profile="prod")
+
+    def test_unknown_port_raises(self, registry):
+        with pytest.raises(ValueError, match="No adapters found for port 'nope'"):
+            registry.get_by_port("nope")
+
+
+class TestRegisterClass:
+    """클래스 등록 테스트"""
+
+    @pytest.mark.parametrize(
+        "type_name, expected",
+        [
+            ("use_case", AnnotationType.USE_CASE),
+            ("repository", AnnotationType.REPOSITORY),
+            ("port", AnnotationType.PORT),
+            (None, AnnotationType.COMPONENT),
+            ("unknown", AnnotationType.COMPONENT),
+        ],
+    )
+    def test_annotation_type_from_metadata(self, registry, type_name, expected):
+        cls = _make_component("thing", metadata={"type": type_name})
+
+        result = registry.register_class(cls)
+
+        assert result.annotation_type is expected
+
+    def test_other_profile_is_skipped_without_registering(self, registry):
+        cls = _make_component("prod_only", profile="prod", metadata={"type": "service"})
+
+        result = registry.register_class(cls)
+
+        assert result.success is False
+        assert result.annotation_type is AnnotationType.SERVICE
+        assert result.warnings == ["Skipping prod_only - profile prod != default"]
+        assert result.errors == []
+        assert registry.get_registration_stats()["total_registered"] == 0
+
+
+class TestMetadataDataclasses:
+    """메타데이터 데이터클래스 테스트"""
+
+    def test_annotation_metadata_is_frozen_and_hashable(self):
+        params = {"name": "svc"}
+        metadata = AnnotationMetadata("Component", params, object, "class")
+        params["name"] = "changed"
+
+        assert metadata.get_param("name") == "svc"
+        with pytest.raises(TypeError):
+            metadata.parameters["name"] = "other"
+        with pytest.raises(AttributeError):
+            metadata.target_type = "method"
+        assert hash(metadata) == hash(
+            AnnotationMetadata("Component", {"name": "other"}, object, "class")
+        )
+
+    def test_component_metadata_has_no_instance_dict(self):
+        metadata = ComponentMetadata(component_id="svc", component_type=object)
+
+        assert not hasattr(metadata, "__dict__")
+        metadata.primary = True
+        assert metadata.primary is True
+
+
+class TestExportConfiguration:
+    """구성 export 테스트"""
+
+    @pytest.fixture
+    def populated(self, registry):
+        registry.register_class(_make_component("repo", metadata={"type": "port"}))
+        registry.register_class(
+            _make_component(
+                "repo_impl",
+                profile="default",
+                metadata={"type": "adapter", "port_name": "repo"},
+            )
+        )
+        return registry
+
+    def test_port_info_lists_adapters(self, populated):
+        info = populated.get_port_info()
+
+        assert info == {
+            "repo": {
+                "class": "repo",
+                "adapters": [
+                    {
+                        "name": "repo_impl",
+                        "class": "repo_impl",
+                        "scope": "singleton",
+                        "profile": "default",
+                    }
+                ],
+                "adapter_count": 1,
+            }
+        }
+        assert dict(populated.get_port_info_iter()) == info
+
+    def test_stream_matches_exported_dict(self, populated):
+        buffer = io.StringIO()
+
+        populated.export_configuration_stream(buffer)
+
+        streamed = json.loads(buffer.getvalue())
+        exported = populated.export_configuration()
+        streamed.pop("timestamp")
+        exported.pop("timestamp")
+        assert streamed == exported
+        assert list(streamed["port_info"]) == ["repo"]
+
+
+class TestPendingRegistrations:
+    """지연된 auto_register 등록 처리 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def empty_queue(self):
+        _PENDING_REGISTRATIONS.clear()
+        yield
+        _PENDING_REGISTRATIONS.clear()
+
+    def test_registry_read_flushes_queue(self, registry):
+        auto_register(registry)(_make_component("deferred"))
+
+        graph = registry.build_dependency_graph()
+
+        assert "deferred" in graph.nodes
+        assert not _PENDING_REGISTRATIONS
+
+    def test_get_flushes_queue(self, registry):
+        auto_register(registry)(_make_component("deferred"))
+
+        with patch.object(ServiceRegistry, "get", lambda self, name: name):
+            assert registry.get("deferred") == "deferred"
+        assert "deferred" in registry._definitions
+
+    def test_global_registry_lookup_flushes_queue(self, monkeypatch):
+        monkeypatch.setattr(RegistryManager, "_instances", {})
+        auto_register()(_make_component("global_deferred"))
+
+        registry = get_annotation_registry()
+
+        assert "global_deferred" in registry._definitions